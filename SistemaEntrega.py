@@ -1,50 +1,82 @@
 import csv
 from datetime import datetime
 
+from armazem_colunar import ArmazemConexoes
+from grafo_conexoes import GrafoConexoes
+from instrumentacao import ESTATISTICAS_DESATIVADAS
+from leitura_csv import RelatorioLeitura, iterar_conexoes, ler_entregas_em_blocos
+from repositorio_entregas import RepositorioEntregas
+from resultado_programacao import RenderizadorTexto, ResultadoProgramacao
+from roteirizacao import LIMITE_MINUTOS_DIA, ProgramadorRotas
+from snapshot_dados import ler_conexoes_com_snapshot, ler_entregas_com_snapshot
+
 class SistemaEntrega:
+    TITULO_PROGRAMACAO = "===== PROGRAMAÇÃO DE ENTREGAS ====="
+    RODAPE_PROGRAMACAO = "=================================="
+    
     def __init__(self):
-        self.conexoes = []
-        self.entregas = []
+        self.conexoes = ArmazemConexoes()
+        self.grafo = GrafoConexoes()
+        self.repositorio = RepositorioEntregas()
+        self.entregas = self.repositorio.entregas
+        self.estatisticas = ESTATISTICAS_DESATIVADAS  # Ver instrumentacao.instrumentar
     
-    def ler_conexoes(self, arquivo):
-        """Lê as conexões (rotas) de um arquivo CSV."""
-        try:
-            with open(arquivo, 'r') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    self.conexoes.append({
-                        'origem': row['origem'],
-                        'destino': row['destino'],
-                        'tempo': int(row['tempo'])
-                    })
-            print(f"Conexões carregadas: {len(self.conexoes)}")
-        except Exception as e:
-            print(f"Erro ao ler conexões: {e}")
+    def ler_conexoes(self, arquivo, usar_snapshot=False):
+        """
+        Lê as conexões (rotas) de um arquivo CSV. Linhas inválidas são ignoradas e informadas.
+        Com usar_snapshot=True, usa (ou cria) um snapshot binário do arquivo.
+        """
+        relatorio = RelatorioLeitura()
+        with self.estatisticas.medir('leitura_conexoes'):
+            try:
+                if usar_snapshot:
+                    conexoes = ler_conexoes_com_snapshot(arquivo, relatorio)
+                else:
+                    conexoes = iterar_conexoes(arquivo, relatorio)
+                for conexao in conexoes:
+                    self.conexoes.append(conexao)
+                    self.grafo.adicionar(conexao['origem'], conexao['destino'], conexao['tempo'])
+                print(f"Conexões carregadas: {len(self.conexoes)}")
+            except (OSError, ValueError, csv.Error) as e:
+                print(f"Erro ao ler conexões: {e}")
+        self.estatisticas.contar('linhas_lidas', relatorio.linhas_lidas)
+        if relatorio.total_erros:
+            print(relatorio.resumo())
     
-    def ler_entregas(self, arquivo):
-        """Lê as entregas disponíveis de um arquivo CSV."""
-        try:
-            with open(arquivo, 'r') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    self.entregas.append({
-                        'id': row['id'],
-                        'origem': row['origem'],
-                        'destino': row['destino'],
-                        'prazo': datetime.strptime(row['prazo'], '%Y-%m-%d'),
-                        'valor': float(row['valor']),
-                        'bonus': float(row['bonus'])
-                    })
-            print(f"Entregas carregadas: {len(self.entregas)}")
-        except Exception as e:
-            print(f"Erro ao ler entregas: {e}")
+    def ler_entregas(self, arquivo, prazo_minimo=None, usar_snapshot=False):
+        """
+        Lê as entregas disponíveis de um arquivo CSV, em blocos.
+        Com prazo_minimo, entregas com prazo anterior são descartadas já na leitura.
+        Linhas inválidas são ignoradas e informadas.
+        Com usar_snapshot=True (e sem prazo_minimo), as colunas vêm de um snapshot
+        binário mapeado em memória, criado na primeira leitura do arquivo.
+        """
+        relatorio = RelatorioLeitura()
+        with self.estatisticas.medir('leitura_entregas'):
+            try:
+                if usar_snapshot and prazo_minimo is None:
+                    self.repositorio.adicionar_armazem(ler_entregas_com_snapshot(arquivo, relatorio))
+                else:
+                    for bloco in ler_entregas_em_blocos(arquivo, prazo_minimo, relatorio=relatorio):
+                        self.repositorio.adicionar_varias(bloco)
+                print(f"Entregas carregadas: {len(self.entregas)}")
+            except (OSError, ValueError, csv.Error) as e:
+                print(f"Erro ao ler entregas: {e}")
+        self.estatisticas.contar('linhas_lidas', relatorio.linhas_lidas)
+        if relatorio.total_erros:
+            print(relatorio.resumo())
+    
+    def compartilhar_dados(self, outro):
+        """Passa a usar as conexões e entregas já carregadas por outro sistema (sem copiá-las)."""
+        self.conexoes = outro.conexoes
+        self.grafo = outro.grafo
+        self.repositorio = outro.repositorio
+        self.entregas = outro.entregas
     
     def calcular_tempo_entrega(self, origem, destino):
-        """Calcula o tempo necessário para uma entrega entre dois pontos."""
-        for conexao in self.conexoes:
-            if conexao['origem'] == origem and conexao['destino'] == destino:
-                return conexao['tempo']
-        return None  # Conexão não encontrada
+        """Calcula o tempo necessário para uma entrega entre dois pontos pelo caminho mais rápido."""
+        with self.estatisticas.medir('consulta_tempo'):
+            return self.grafo.tempo(origem, destino)  # None se não houver caminho
     
     def selecionar_entregas(self, data_atual, capacidade_diaria=5):
         """
@@ -52,37 +84,53 @@ class SistemaEntrega:
         Seleciona entregas com base no maior bônus oferecido.
         """
         # Filtrar entregas que ainda estão no prazo
-        entregas_validas = [e for e in self.entregas if e['prazo'] >= data_atual]
+        with self.estatisticas.medir('filtro'):
+            entregas_validas = self.repositorio.validas(data_atual)
+        self.estatisticas.contar('entregas_validas', len(entregas_validas))
         
         # Ordenar entregas pelo valor do bônus (do maior para o menor)
-        entregas_ordenadas = sorted(entregas_validas, key=lambda x: x['bonus'], reverse=True)
+        with self.estatisticas.medir('selecao'):
+            entregas_ordenadas = sorted(entregas_validas, key=lambda x: x['bonus'], reverse=True)
         
         # Selecionar até o limite de capacidade diária
         entregas_selecionadas = entregas_ordenadas[:capacidade_diaria]
         
         return entregas_selecionadas
     
-    def exibir_programacao(self, entregas_selecionadas):
-        """Exibe a programação de entregas e calcula o lucro total."""
-        print("\n===== PROGRAMAÇÃO DE ENTREGAS =====")
-        print("ID\tOrigem\tDestino\tTempo\tValor\tBônus\tLucro Total")
-        
-        lucro_total = 0
-        tempo_total = 0
-        
-        for entrega in entregas_selecionadas:
-            tempo = self.calcular_tempo_entrega(entrega['origem'], entrega['destino'])
-            tempo_total += tempo if tempo else 0
-            lucro = entrega['valor'] + entrega['bonus']
-            lucro_total += lucro
-            
-            print(f"{entrega['id']}\t{entrega['origem']}\t{entrega['destino']}\t{tempo}\t{entrega['valor']}\t{entrega['bonus']}\t{lucro}")
-        
-        print(f"\nTempo total estimado: {tempo_total} minutos")
-        print(f"Lucro total esperado: R$ {lucro_total:.2f}")
-        print("==================================")
+    def calcular_programacao(self, entregas_selecionadas):
+        """Calcula tempo, lucro e linhas da programação, sem exibir nada."""
+        with self.estatisticas.medir('calculo_programacao'):
+            return ResultadoProgramacao.calcular(entregas_selecionadas, self.calcular_tempo_entrega)
+    
+    def programar_rota(self, entregas_selecionadas, data_atual=None, limite_minutos=LIMITE_MINUTOS_DIA, base=None):
+        """
+        Ordena as entregas em um roteiro viável para o dia, contando o
+        deslocamento entre uma entrega e a seguinte, o limite diário de
+        minutos e os prazos (ver roteirizacao.ProgramadorRotas).
+        Retorna um RoteiroDiario.
+        """
+        programador = ProgramadorRotas(self.grafo, limite_minutos, base, self.estatisticas)
+        return programador.programar(entregas_selecionadas, data_atual)
+    
+    def renderizar_programacao(self, resultado, renderizador=None):
+        """Envia um ResultadoProgramacao ao renderizador (sem renderizador, imprime a tabela de texto)."""
+        with self.estatisticas.medir('saida'):
+            if renderizador is None:
+                with RenderizadorTexto() as texto:
+                    texto.renderizar(resultado, self.TITULO_PROGRAMACAO, self.RODAPE_PROGRAMACAO)
+            else:
+                renderizador.renderizar(resultado, self.TITULO_PROGRAMACAO, self.RODAPE_PROGRAMACAO)
+    
+    def exibir_programacao(self, entregas_selecionadas, renderizador=None):
+        """
+        Exibe a programação de entregas e calcula o lucro total.
+        Sem renderizador, imprime a tabela de texto; com um renderizador
+        (ver resultado_programacao), a saída fica no buffer dele.
+        """
+        resultado = self.calcular_programacao(entregas_selecionadas)
+        self.renderizar_programacao(resultado, renderizador)
         
-        return lucro_total
+        return resultado.lucro_total
 
 # Exemplo de uso
 if __name__ == "__main__":
@@ -92,8 +140,8 @@ if __name__ == "__main__":
     # conexoes.csv: origem,destino,tempo
     # entregas.csv: id,origem,destino,prazo,valor,bonus
     
-    sistema.ler_conexoes("conexoes.csv")
-    sistema.ler_entregas("entregas.csv")
+    sistema.ler_conexoes("conexoes.csv", usar_snapshot=True)
+    sistema.ler_entregas("entregas.csv", usar_snapshot=True)
     
     # Data atual para comparação com os prazos
     data_atual = datetime.strptime('2023-11-15', '%Y-%m-%d')
@@ -1,62 +1,118 @@
 import csv
+import heapq
 import random
+import time
 from datetime import datetime
 
+import numpy as np
+
+from armazem_colunar import ArmazemConexoes
+from avaliacao_vetorizada import AvaliadorVetorizado
+from cache_avaliacao import CacheAvaliacao
+from frota import GERACOES_POR_RODADA, RODADAS, distancias_bases, executar_frota
+from ga_ilhas import executar_ilhas
+from grafo_conexoes import GrafoConexoes
+from instrumentacao import ESTATISTICAS_DESATIVADAS
+from leitura_csv import RelatorioLeitura, iterar_conexoes, ler_entregas_em_blocos
+from nucleo_genetico import evoluir, populacao_inicial, reparar_populacao
+from operadores_geneticos import OPERADORES_PADRAO
+from pareto import evoluir_pareto, frente_pareto
+from repositorio_entregas import RepositorioEntregas
+from resultado_programacao import RenderizadorTexto, ResultadoProgramacao
+from roteirizacao import LIMITE_MINUTOS_DIA, ProgramadorRotas
+from snapshot_dados import ler_conexoes_com_snapshot, ler_entregas_com_snapshot
+
 class SistemaEntregaIA:
+    TITULO_PROGRAMACAO = "===== PROGRAMAÇÃO DE ENTREGAS OTIMIZADA ====="
+    RODAPE_PROGRAMACAO = "=========================================="
+    
     def __init__(self):
-        self.conexoes = []
-        self.entregas = []
-    
-    def ler_conexoes(self, arquivo):
-        """Lê as conexões (rotas) de um arquivo CSV."""
-        try:
-            with open(arquivo, 'r') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    self.conexoes.append({
-                        'origem': row['origem'],
-                        'destino': row['destino'],
-                        'tempo': int(row['tempo'])
-                    })
-            print(f"Conexões carregadas: {len(self.conexoes)}")
-        except Exception as e:
-            print(f"Erro ao ler conexões: {e}")
-    
-    def ler_entregas(self, arquivo):
-        """Lê as entregas disponíveis de um arquivo CSV."""
-        try:
-            with open(arquivo, 'r') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    self.entregas.append({
-                        'id': row['id'],
-                        'origem': row['origem'],
-                        'destino': row['destino'],
-                        'prazo': datetime.strptime(row['prazo'], '%Y-%m-%d'),
-                        'valor': float(row['valor']),
-                        'bonus': float(row['bonus'])
-                    })
-            print(f"Entregas carregadas: {len(self.entregas)}")
-        except Exception as e:
-            print(f"Erro ao ler entregas: {e}")
+        self.conexoes = ArmazemConexoes()
+        self.grafo = GrafoConexoes()
+        self.repositorio = RepositorioEntregas()
+        self.entregas = self.repositorio.entregas
+        self.estatisticas = ESTATISTICAS_DESATIVADAS  # Ver instrumentacao.instrumentar
+        self.ultima_execucao_ga = None
+        self.cache_avaliacao = CacheAvaliacao()
+        self.ultima_populacao_ga = None  # Linhas do armazém da última população, para continuar=True
+        self.ultima_execucao_frota = None
+        self.ultima_frente_pareto = []
+    
+    def ler_conexoes(self, arquivo, usar_snapshot=False):
+        """
+        Lê as conexões (rotas) de um arquivo CSV. Linhas inválidas são ignoradas e informadas.
+        Com usar_snapshot=True, usa (ou cria) um snapshot binário do arquivo.
+        """
+        relatorio = RelatorioLeitura()
+        with self.estatisticas.medir('leitura_conexoes'):
+            try:
+                if usar_snapshot:
+                    conexoes = ler_conexoes_com_snapshot(arquivo, relatorio)
+                else:
+                    conexoes = iterar_conexoes(arquivo, relatorio)
+                for conexao in conexoes:
+                    self.conexoes.append(conexao)
+                    self.grafo.adicionar(conexao['origem'], conexao['destino'], conexao['tempo'])
+                self.cache_avaliacao.limpar()
+                self.ultima_populacao_ga = None
+                print(f"Conexões carregadas: {len(self.conexoes)}")
+            except (OSError, ValueError, csv.Error) as e:
+                print(f"Erro ao ler conexões: {e}")
+        self.estatisticas.contar('linhas_lidas', relatorio.linhas_lidas)
+        if relatorio.total_erros:
+            print(relatorio.resumo())
+    
+    def ler_entregas(self, arquivo, prazo_minimo=None, usar_snapshot=False):
+        """
+        Lê as entregas disponíveis de um arquivo CSV, em blocos.
+        Com prazo_minimo, entregas com prazo anterior são descartadas já na leitura.
+        Linhas inválidas são ignoradas e informadas.
+        Com usar_snapshot=True (e sem prazo_minimo), as colunas vêm de um snapshot
+        binário mapeado em memória, criado na primeira leitura do arquivo.
+        """
+        relatorio = RelatorioLeitura()
+        with self.estatisticas.medir('leitura_entregas'):
+            try:
+                if usar_snapshot and prazo_minimo is None:
+                    self.repositorio.adicionar_armazem(ler_entregas_com_snapshot(arquivo, relatorio))
+                else:
+                    for bloco in ler_entregas_em_blocos(arquivo, prazo_minimo, relatorio=relatorio):
+                        self.repositorio.adicionar_varias(bloco)
+                self.cache_avaliacao.limpar()
+                self.ultima_populacao_ga = None
+                print(f"Entregas carregadas: {len(self.entregas)}")
+            except (OSError, ValueError, csv.Error) as e:
+                print(f"Erro ao ler entregas: {e}")
+        self.estatisticas.contar('linhas_lidas', relatorio.linhas_lidas)
+        if relatorio.total_erros:
+            print(relatorio.resumo())
+    
+    def compartilhar_dados(self, outro):
+        """Passa a usar as conexões e entregas já carregadas por outro sistema (sem copiá-las)."""
+        self.conexoes = outro.conexoes
+        self.grafo = outro.grafo
+        self.repositorio = outro.repositorio
+        self.entregas = outro.entregas
+        self.cache_avaliacao.limpar()
+        self.ultima_populacao_ga = None
     
     def calcular_tempo_entrega(self, origem, destino):
-        """Calcula o tempo necessário para uma entrega entre dois pontos."""
-        for conexao in self.conexoes:
-            if conexao['origem'] == origem and conexao['destino'] == destino:
-                return conexao['tempo']
-        return None
+        """Calcula o tempo necessário para uma entrega entre dois pontos pelo caminho mais rápido."""
+        with self.estatisticas.medir('consulta_tempo'):
+            return self.grafo.tempo(origem, destino)  # None se não houver caminho
     
     def avaliar_solucao(self, solucao, data_atual):
         """
         Avalia uma solução calculando o tempo total e o lucro total.
         Retorna uma tupla (tempo_total, lucro_total)
+        O lucro é somado na ordem dos ids, e não dos genes, para que
+        permutações da mesma solução tenham exatamente o mesmo total.
         """
         tempo_total = 0
         lucro_total = 0
         
-        for id_entrega in solucao:
-            entrega = next((e for e in self.entregas if e['id'] == id_entrega), None)
+        for id_entrega in sorted(solucao):
+            entrega = self.repositorio.obter(id_entrega)
             if entrega and entrega['prazo'] >= data_atual:
                 tempo = self.calcular_tempo_entrega(entrega['origem'], entrega['destino'])
                 if tempo:
@@ -65,114 +121,250 @@ class SistemaEntregaIA:
         
         return (tempo_total, lucro_total)
     
-    def algoritmo_genetico(self, data_atual, tamanho_populacao=50, geracoes=100, capacidade_diaria=5):
+    def algoritmo_genetico(self, data_atual, tamanho_populacao=50, geracoes=100, capacidade_diaria=5, vetorizado=False,
+                           paciencia=None, tempo_limite=None, usar_cache=False, semente=None, continuar=False,
+                           operadores=OPERADORES_PADRAO, cancelar=None):
         """
         Implementa um algoritmo genético para encontrar a melhor combinação de entregas.
+        Cada indivíduo é uma lista de posições na lista de entregas válidas do dia.
+        Com vetorizado=True, cada geração é avaliada de uma só vez com NumPy;
+        para a mesma semente o resultado é idêntico ao da avaliação escalar.
+        
+        Parada antecipada:
+        - paciencia: encerra após esse número de gerações seguidas sem melhora
+        - tempo_limite: orçamento em segundos (ex.: 0.2); retorna a melhor
+          solução encontrada até o fim do orçamento
+        - cancelar: função sem argumentos (ex.: threading.Event.is_set)
+          consultada a cada geração; quando retorna True, retorna a melhor
+          solução encontrada até ali
+        O número de gerações executadas e o motivo da parada ficam em
+        self.ultima_execucao_ga.
+        
+        Com usar_cache=True (avaliação escalar), soluções já avaliadas, como a
+        elite copiada a cada geração, são buscadas em self.cache_avaliacao em
+        vez de reavaliadas, inclusive com os genes em outra ordem; o resultado
+        é o mesmo que sem o cache.
+        
+        Com semente, o algoritmo usa um gerador próprio (random.Random(semente))
+        em vez do estado global do módulo random.
+        
+        Com continuar=True (reotimização incremental entre dias), a população
+        final da execução anterior é reaproveitada como população inicial:
+        entregas que saíram do prazo são removidas e os indivíduos são
+        completados (ver nucleo_genetico.reparar_populacao). Assim, poucas
+        gerações bastam para chegar à qualidade de uma execução completa.
+        
+        `operadores` escolhe a seleção de pais (elite, torneio, roleta), o
+        cruzamento, a mutação, o tamanho da elite e a taxa de mutação
+        (ver operadores_geneticos.OperadoresGeneticos). A elite é obtida por
+        seleção parcial, sem ordenar a população inteira.
         """
+        inicio = time.perf_counter()
+        limite_tempo = inicio + tempo_limite if tempo_limite is not None else None
+        self.ultima_execucao_ga = {'geracoes_executadas': 0, 'motivo_parada': 'sem_entregas'}
+        
         # Filtrar entregas válidas
-        entregas_validas = [e for e in self.entregas if e['prazo'] >= data_atual]
-        if not entregas_validas:
+        with self.estatisticas.medir('filtro'):
+            indices_validos = self.repositorio.indices_validos(data_atual)
+        total_validas = len(indices_validos)
+        self.estatisticas.contar('entregas_validas', total_validas)
+        if not total_validas:
             return []
         
-        # Gerar população inicial
-        populacao = []
-        for _ in range(tamanho_populacao):
-            # Cada indivíduo é uma seleção aleatória de entregas
-            if len(entregas_validas) <= capacidade_diaria:
-                solucao = [e['id'] for e in entregas_validas]
+        with self.estatisticas.medir('preparacao_avaliacao'):
+            if vetorizado:
+                avaliador = AvaliadorVetorizado.do_armazem(self.repositorio.armazem, indices_validos, self.calcular_tempo_entrega)
+                avaliar = lambda populacao: avaliador.avaliar_populacao(populacao, data_atual)
+                ranquear = avaliador.ranquear
             else:
-                solucao = [e['id'] for e in random.sample(entregas_validas, capacidade_diaria)]
-            populacao.append(solucao)
-        
-        melhor_solucao = None
-        melhor_avaliacao = (float('inf'), 0)  # (tempo, lucro)
+                entregas_validas = self.repositorio.registros(indices_validos)
+                cache = self.cache_avaliacao if usar_cache else None
+                avaliar = lambda populacao: self._avaliar_populacao(populacao, entregas_validas, data_atual, cache)
+                ranquear = self._ranquear
         
-        for geracao in range(geracoes):
-            # Avaliar cada solução
-            avaliacoes = []
-            for solucao in populacao:
-                avaliacao = self.avaliar_solucao(solucao, data_atual)
-                avaliacoes.append((solucao, avaliacao))
-                
-                # Verifica se é a melhor solução até agora (menor tempo e maior lucro)
-                if avaliacao[0] < melhor_avaliacao[0] or (avaliacao[0] == melhor_avaliacao[0] and avaliacao[1] > melhor_avaliacao[1]):
-                    melhor_solucao = solucao
-                    melhor_avaliacao = avaliacao
-            
-            # Ordenar por fitness (menor tempo e maior lucro)
-            avaliacoes.sort(key=lambda x: (-x[1][1], x[1][0]))
-            
-            # Seleção dos melhores (elitismo)
-            elite = [item[0] for item in avaliacoes[:10]]
-            
-            # Criar nova população
-            nova_populacao = elite.copy()
-            
-            # Cruzamento e mutação
-            while len(nova_populacao) < tamanho_populacao:
-                # Seleção de pais
-                pai1 = random.choice(elite)
-                pai2 = random.choice(elite)
-                
-                # Cruzamento
-                if min(len(pai1), len(pai2)) > 1:
-                    ponto_corte = random.randint(1, min(len(pai1), len(pai2)) - 1)
-                else:
-                    ponto_corte = 1  # Ou outra abordagem para lidar com cromossomos pequenos
-
-                filho = pai1[:ponto_corte] + [x for x in pai2 if x not in pai1[:ponto_corte]]
-                
-                # Garantir que o filho tenha o tamanho correto
-                if len(filho) > capacidade_diaria:
-                    filho = filho[:capacidade_diaria]
-                elif len(filho) < capacidade_diaria and len(entregas_validas) > capacidade_diaria:
-                    # Adicionar entregas aleatórias para completar
-                    entregas_disponiveis = [e['id'] for e in entregas_validas if e['id'] not in filho]
-                    if entregas_disponiveis:
-                        filho.extend(random.sample(entregas_disponiveis, min(capacidade_diaria - len(filho), len(entregas_disponiveis))))
-                
-                # Mutação (com baixa probabilidade)
-                if random.random() < 0.1 and len(entregas_validas) > capacidade_diaria:
-                    # Substituir uma entrega aleatória
-                    idx = random.randint(0, len(filho) - 1)
-                    entregas_disponiveis = [e['id'] for e in entregas_validas if e['id'] not in filho]
-                    if entregas_disponiveis:
-                        filho[idx] = random.choice(entregas_disponiveis)
-                
-                nova_populacao.append(filho)
-            
-            populacao = nova_populacao
-        
-        # Recuperar as entregas completas a partir dos IDs
-        entregas_selecionadas = []
-        for id_entrega in melhor_solucao:
-            entrega = next((e for e in self.entregas if e['id'] == id_entrega), None)
-            if entrega:
-                entregas_selecionadas.append(entrega)
+        # Gerar população inicial e evoluir
+        rng = random.Random(semente) if semente is not None else random
+        reaproveitados = 0
+        if continuar and self.ultima_populacao_ga:
+            individuos = self._posicoes_no_dia(self.ultima_populacao_ga, indices_validos)
+            reaproveitados = min(len(individuos), tamanho_populacao)
+            populacao = reparar_populacao(individuos, total_validas, tamanho_populacao, capacidade_diaria, rng)
+        else:
+            populacao = populacao_inicial(total_validas, tamanho_populacao, capacidade_diaria, rng)
+        populacao, melhor_solucao, _, info = evoluir(populacao, geracoes, avaliar, ranquear, capacidade_diaria, total_validas,
+                                                     rng, paciencia=paciencia, limite_tempo=limite_tempo,
+                                                     estatisticas=self.estatisticas, operadores=operadores,
+                                                     cancelar=cancelar)
+        info['tempo_execucao'] = time.perf_counter() - inicio
+        info['individuos_reaproveitados'] = reaproveitados
+        self.ultima_execucao_ga = info
+        self.ultima_populacao_ga = [indices_validos[individuo].tolist() for individuo in populacao]
         
-        return entregas_selecionadas
+        # Recuperar as entregas completas a partir dos índices
+        return self.repositorio.registros(indices_validos[melhor_solucao])
     
-    def exibir_programacao(self, entregas_selecionadas):
-        """Exibe a programação de entregas e calcula o lucro total."""
-        print("\n===== PROGRAMAÇÃO DE ENTREGAS OTIMIZADA =====")
-        print("ID\tOrigem\tDestino\tTempo\tValor\tBônus\tLucro Total")
+    def algoritmo_genetico_ilhas(self, data_atual, tamanho_populacao=50, geracoes=100, capacidade_diaria=5,
+                                 ilhas=4, workers=None, intervalo_migracao=10, migrantes=2, semente=0,
+                                 operadores=OPERADORES_PADRAO):
+        """
+        Versão em modelo de ilhas do algoritmo genético: `ilhas` populações
+        independentes evoluem em paralelo em um ProcessPoolExecutor e trocam
+        os `migrantes` melhores indivíduos a cada `intervalo_migracao` gerações.
+        Para a mesma semente o resultado é o mesmo com qualquer número de workers.
+        """
+        indices_validos = self.repositorio.indices_validos(data_atual)
+        if not len(indices_validos):
+            return []
         
-        lucro_total = 0
-        tempo_total = 0
+        # Os dados de avaliação são enviados uma vez para cada worker
+        avaliador = AvaliadorVetorizado.do_armazem(self.repositorio.armazem, indices_validos, self.calcular_tempo_entrega)
+        melhor_solucao, _ = executar_ilhas(avaliador, data_atual, tamanho_populacao, geracoes, capacidade_diaria,
+                                           ilhas, workers, intervalo_migracao, migrantes, semente, operadores)
+        if melhor_solucao is None:
+            return []
+        return self.repositorio.registros(indices_validos[melhor_solucao])
+    
+    def algoritmo_genetico_frota(self, data_atual, veiculos, tamanho_populacao=50, geracoes_por_rodada=GERACOES_POR_RODADA,
+                                 rodadas=RODADAS, tempo_limite=None, workers=None, semente=0,
+                                 operadores=OPERADORES_PADRAO):
+        """
+        Modo frota: as entregas válidas do dia são repartidas entre os
+        veículos (frota.Veiculo, cada um com capacidade e cidade de partida
+        próprias), otimizadas por veículo em processos paralelos e
+        rebalanceadas entre as rodadas (ver frota.executar_frota).
+        tempo_limite é o orçamento total em segundos.
+        Retorna {id do veículo: entregas escolhidas}; os detalhes da execução
+        ficam em self.ultima_execucao_frota.
+        """
+        if len({veiculo.id for veiculo in veiculos}) != len(veiculos):
+            raise ValueError("os veículos da frota precisam ter ids diferentes")
+        indices_validos = self.repositorio.indices_validos(data_atual)
+        self.ultima_execucao_frota = {'rodadas': 0, 'entregas_movidas': 0, 'motivo_parada': 'sem_entregas'}
+        if not len(indices_validos) or not veiculos:
+            return {veiculo.id: [] for veiculo in veiculos}
         
-        for entrega in entregas_selecionadas:
-            tempo = self.calcular_tempo_entrega(entrega['origem'], entrega['destino'])
-            tempo_total += tempo if tempo else 0
-            lucro = entrega['valor'] + entrega['bonus']
-            lucro_total += lucro
-            
-            print(f"{entrega['id']}\t{entrega['origem']}\t{entrega['destino']}\t{tempo}\t{entrega['valor']}\t{entrega['bonus']}\t{lucro}")
+        armazem = self.repositorio.armazem
+        with self.estatisticas.medir('preparacao_avaliacao'):
+            avaliador = AvaliadorVetorizado.do_armazem(armazem, indices_validos, self.calcular_tempo_entrega)
+            origens = armazem.coluna('origem')[indices_validos].astype(np.intp)
+            distancias = distancias_bases(self.grafo, veiculos, armazem.cidades.nomes)
+        with self.estatisticas.medir('otimizacao_frota'):
+            selecoes, info = executar_frota(avaliador, origens, distancias, data_atual, veiculos, tamanho_populacao,
+                                            geracoes_por_rodada, rodadas, tempo_limite, workers, semente, operadores)
+        self.ultima_execucao_frota = info
+        return {veiculo.id: self.repositorio.registros(indices_validos[selecao])
+                for veiculo, selecao in zip(veiculos, selecoes)}
+    
+    def algoritmo_genetico_pareto(self, data_atual, tamanho_populacao=100, geracoes=100, capacidade_diaria=5,
+                                  tempo_limite=None, semente=None, operadores=OPERADORES_PADRAO, cancelar=None):
+        """
+        Modo multiobjetivo (NSGA-II, ver pareto.evoluir_pareto): em vez de uma
+        única solução, retorna a frente de Pareto de (lucro, tempo total),
+        ou seja, as programações para as quais nenhuma outra tem lucro maior
+        ou igual com tempo menor ou igual (e uma das duas coisas estritamente).
+        Retorna uma lista de {'tempo', 'lucro', 'entregas'} em ordem de tempo
+        crescente; a mesma lista fica em self.ultima_frente_pareto.
+        tempo_limite e cancelar funcionam como em algoritmo_genetico: a
+        frente retornada é a da última geração concluída.
+        """
+        inicio = time.perf_counter()
+        limite_tempo = inicio + tempo_limite if tempo_limite is not None else None
+        self.ultima_frente_pareto = []
+        indices_validos = self.repositorio.indices_validos(data_atual)
+        total_validas = len(indices_validos)
+        if not total_validas:
+            return []
         
-        print(f"\nTempo total estimado: {tempo_total} minutos")
-        print(f"Lucro total esperado: R$ {lucro_total:.2f}")
-        print("==========================================")
+        with self.estatisticas.medir('preparacao_avaliacao'):
+            avaliador = AvaliadorVetorizado.do_armazem(self.repositorio.armazem, indices_validos, self.calcular_tempo_entrega)
+        rng = random.Random(semente) if semente is not None else random
+        populacao = populacao_inicial(total_validas, tamanho_populacao, capacidade_diaria, rng)
+        populacao, tempos, lucros, frentes, _ = evoluir_pareto(
+            populacao, geracoes, lambda p: avaliador.avaliar_populacao(p, data_atual),
+            capacidade_diaria, total_validas, rng, operadores, limite_tempo, self.estatisticas, cancelar
+        )
+        self.ultima_frente_pareto = [
+            {'tempo': tempo, 'lucro': lucro, 'entregas': self.repositorio.registros(indices_validos[individuo])}
+            for individuo, tempo, lucro in frente_pareto(populacao, tempos, lucros, frentes)
+        ]
+        return self.ultima_frente_pareto
+    
+    def _posicoes_no_dia(self, populacao_linhas, indices_validos):
+        """Converte indivíduos em linhas do armazém para posições em indices_validos, descartando entregas vencidas."""
+        posicao = np.full(len(self.repositorio), -1, dtype=np.intp)
+        posicao[indices_validos] = np.arange(len(indices_validos))
+        return [[p for p in posicao[linhas].tolist() if p >= 0] for linhas in populacao_linhas]
+    
+    def _avaliar_populacao(self, populacao, entregas_validas, data_atual, cache=None):
+        """Avalia cada indivíduo (lista de índices) com avaliar_solucao, consultando o cache se houver."""
+        tempos = []
+        lucros = []
+        for solucao in populacao:
+            ids_entregas = [entregas_validas[i]['id'] for i in solucao]
+            if cache is None:
+                tempo, lucro = self.avaliar_solucao(ids_entregas, data_atual)
+            else:
+                chave = cache.chave(ids_entregas, data_atual)
+                avaliacao = cache.obter(chave)
+                if avaliacao is None:
+                    avaliacao = self.avaliar_solucao(ids_entregas, data_atual)
+                    cache.guardar(chave, avaliacao)
+                tempo, lucro = avaliacao
+            tempos.append(tempo)
+            lucros.append(lucro)
+        return tempos, lucros
+    
+    @staticmethod
+    def _ranquear(tempos, lucros, limite=None):
+        """
+        Retorna (ordem, indice_melhor):
+        - ordem: indivíduos por maior lucro e, no empate, menor tempo;
+          com limite, só os `limite` primeiros (heapq.nsmallest, sem ordenar todos)
+        - indice_melhor: primeiro indivíduo com menor tempo e, no empate, maior lucro
+        """
+        indices = range(len(tempos))
+        chave = lambda i: (-lucros[i], tempos[i])
+        if limite is None or limite >= len(tempos):
+            ordem = sorted(indices, key=chave)
+        else:
+            ordem = heapq.nsmallest(limite, indices, key=chave)
+        indice_melhor = min(indices, key=lambda i: (tempos[i], -lucros[i]))
+        return ordem, indice_melhor
+    
+    def calcular_programacao(self, entregas_selecionadas):
+        """Calcula tempo, lucro e linhas da programação, sem exibir nada."""
+        with self.estatisticas.medir('calculo_programacao'):
+            return ResultadoProgramacao.calcular(entregas_selecionadas, self.calcular_tempo_entrega)
+    
+    def programar_rota(self, entregas_selecionadas, data_atual=None, limite_minutos=LIMITE_MINUTOS_DIA, base=None):
+        """
+        Ordena as entregas em um roteiro viável para o dia, contando o
+        deslocamento entre uma entrega e a seguinte, o limite diário de
+        minutos e os prazos (ver roteirizacao.ProgramadorRotas).
+        Retorna um RoteiroDiario.
+        """
+        programador = ProgramadorRotas(self.grafo, limite_minutos, base, self.estatisticas)
+        return programador.programar(entregas_selecionadas, data_atual)
+    
+    def renderizar_programacao(self, resultado, renderizador=None):
+        """Envia um ResultadoProgramacao ao renderizador (sem renderizador, imprime a tabela de texto)."""
+        with self.estatisticas.medir('saida'):
+            if renderizador is None:
+                with RenderizadorTexto() as texto:
+                    texto.renderizar(resultado, self.TITULO_PROGRAMACAO, self.RODAPE_PROGRAMACAO)
+            else:
+                renderizador.renderizar(resultado, self.TITULO_PROGRAMACAO, self.RODAPE_PROGRAMACAO)
+    
+    def exibir_programacao(self, entregas_selecionadas, renderizador=None):
+        """
+        Exibe a programação de entregas e calcula o lucro total.
+        Sem renderizador, imprime a tabela de texto; com um renderizador
+        (ver resultado_programacao), a saída fica no buffer dele.
+        """
+        resultado = self.calcular_programacao(entregas_selecionadas)
+        self.renderizar_programacao(resultado, renderizador)
         
-        return lucro_total, tempo_total
+        return resultado.lucro_total, resultado.tempo_total
 
 # Exemplo de uso
 if __name__ == "__main__":
@@ -182,8 +374,8 @@ if __name__ == "__main__":
     # conexoes.csv: origem,destino,tempo
     # entregas.csv: id,origem,destino,prazo,valor,bonus
     
-    sistema.ler_conexoes("conexoes.csv")
-    sistema.ler_entregas("entregas.csv")
+    sistema.ler_conexoes("conexoes.csv", usar_snapshot=True)
+    sistema.ler_entregas("entregas.csv", usar_snapshot=True)
     
     # Data atual para comparação com os prazos
     data_atual = datetime.strptime('2023-11-15', '%Y-%m-%d')
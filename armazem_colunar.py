@@ -0,0 +1,214 @@
+from array import array
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timedelta
+
+import numpy as np
+
+EPOCA = datetime(1970, 1, 1)
+CAMPOS_ENTREGA = ('id', 'origem', 'destino', 'prazo', 'valor', 'bonus')
+
+
+def dias_desde_epoca(data):
+    """Converte um datetime em dias inteiros desde EPOCA."""
+    return (data - EPOCA).days
+
+
+def primeiro_dia_valido(data_atual):
+    """
+    Menor número de dias desde EPOCA cujo prazo (meia-noite) é >= data_atual.
+    Equivale à comparação prazo >= data_atual feita com datetime.
+    """
+    diferenca = data_atual - EPOCA
+    if diferenca.seconds or diferenca.microseconds:
+        return diferenca.days + 1
+    return diferenca.days
+
+
+class TabelaCidades:
+    """Internação dos nomes de cidades em códigos inteiros pequenos."""
+    def __init__(self):
+        self.nomes = []
+        self.codigos = {}
+
+    def codigo(self, nome):
+        codigo = self.codigos.get(nome)
+        if codigo is None:
+            codigo = self.codigos[nome] = len(self.nomes)
+            self.nomes.append(nome)
+        return codigo
+
+    def __len__(self):
+        return len(self.nomes)
+
+
+class ArmazemEntregas:
+    """
+    Entregas em formato colunar: ids em uma tabela de strings NumPy,
+    cidades como códigos int32, prazo como int32 (dias desde EPOCA) e
+    valor/bônus como float64. Cada coluna é um buffer com folga que dobra
+    de capacidade quando enche, então adicionar um bloco custa O(tamanho
+    do bloco) amortizado; as colunas lidas são visões das linhas preenchidas.
+    """
+    def __init__(self):
+        self.cidades = TabelaCidades()
+        self._colunas = {
+            'id': np.empty(0, dtype='U1'),
+            'origem': np.empty(0, dtype=np.int32),
+            'destino': np.empty(0, dtype=np.int32),
+            'prazo': np.empty(0, dtype=np.int32),
+            'valor': np.empty(0, dtype=np.float64),
+            'bonus': np.empty(0, dtype=np.float64)
+        }
+        self._tamanho = 0
+
+    def adicionar_varias(self, entregas):
+        """Adiciona um bloco de entregas no formato de dicionário."""
+        if not entregas:
+            return
+        codigo = self.cidades.codigo
+        self._anexar({
+            'id': np.array([e['id'] for e in entregas], dtype=str),
+            'origem': np.array([codigo(e['origem']) for e in entregas], dtype=np.int32),
+            'destino': np.array([codigo(e['destino']) for e in entregas], dtype=np.int32),
+            'prazo': np.array([dias_desde_epoca(e['prazo']) for e in entregas], dtype=np.int32),
+            'valor': np.array([e['valor'] for e in entregas], dtype=np.float64),
+            'bonus': np.array([e['bonus'] for e in entregas], dtype=np.float64)
+        })
+
+    def adicionar_colunas(self, colunas, nomes_cidades):
+        """
+        Adiciona entregas já em formato colunar (ex.: lidas de um snapshot),
+        com códigos de cidade relativos a nomes_cidades. Num armazém vazio as
+        colunas são usadas como estão, sem cópia (inclusive arrays mapeados em
+        memória); a primeira adição depois disso copia para buffers próprios.
+        """
+        if self._tamanho == 0 and not len(self.cidades):
+            for nome in nomes_cidades:
+                self.cidades.codigo(nome)
+            # Capacidade igual ao tamanho: essas colunas nunca são escritas
+            self._colunas = {nome: colunas[nome] for nome in CAMPOS_ENTREGA}
+            self._tamanho = len(colunas['id'])
+            return
+        recodificar = np.array([self.cidades.codigo(nome) for nome in nomes_cidades], dtype=np.int32)
+        bloco = {nome: np.asarray(colunas[nome]) for nome in CAMPOS_ENTREGA}
+        if len(recodificar):
+            bloco['origem'] = recodificar[bloco['origem']]
+            bloco['destino'] = recodificar[bloco['destino']]
+        self._anexar(bloco)
+
+    def _anexar(self, bloco):
+        """Copia um bloco de colunas para o fim dos buffers, aumentando-os se preciso."""
+        quantidade = len(bloco['id'])
+        if not quantidade:
+            return
+        fim = self._tamanho + quantidade
+        capacidade = len(self._colunas['id'])
+        if fim > capacidade:
+            capacidade = max(fim, 2 * capacidade)
+        for nome, buffer in self._colunas.items():
+            tipo = buffer.dtype
+            if nome == 'id' and bloco['id'].dtype.itemsize > tipo.itemsize:
+                tipo = bloco['id'].dtype  # Ids mais longos que os já guardados
+            if capacidade > len(buffer) or tipo != buffer.dtype:
+                novo = np.empty(capacidade, dtype=tipo)
+                novo[:self._tamanho] = buffer[:self._tamanho]
+                self._colunas[nome] = buffer = novo
+            buffer[self._tamanho:fim] = bloco[nome]
+        self._tamanho = fim
+
+    def coluna(self, nome):
+        """Retorna a coluna completa como array NumPy (visão das linhas preenchidas)."""
+        return self._colunas[nome][:self._tamanho]
+
+    def celula(self, nome, indice):
+        """Retorna o valor bruto (NumPy) da coluna `nome` na linha `indice`."""
+        return self._colunas[nome][indice]
+
+    def registro(self, indice):
+        """Retorna a entrega da linha `indice` como uma visão somente leitura."""
+        return Entrega(self, indice)
+
+    def __len__(self):
+        return self._tamanho
+
+
+class Entrega(Mapping):
+    """
+    Visão de uma linha do ArmazemEntregas com a interface de leitura de um
+    dicionário (entrega['id'], entrega['prazo'], dict(entrega), ...).
+    Não guarda cópia dos dados.
+    """
+    __slots__ = ('armazem', 'indice')
+
+    def __init__(self, armazem, indice):
+        self.armazem = armazem
+        self.indice = indice
+
+    def __getitem__(self, campo):
+        celula = self.armazem.celula
+        if campo == 'id':
+            return str(celula('id', self.indice))
+        if campo == 'origem' or campo == 'destino':
+            return self.armazem.cidades.nomes[celula(campo, self.indice)]
+        if campo == 'prazo':
+            return EPOCA + timedelta(days=int(celula('prazo', self.indice)))
+        if campo == 'valor' or campo == 'bonus':
+            return float(celula(campo, self.indice))
+        raise KeyError(campo)
+
+    def __iter__(self):
+        return iter(CAMPOS_ENTREGA)
+
+    def __len__(self):
+        return len(CAMPOS_ENTREGA)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class VisaoEntregas(Sequence):
+    """Sequência somente leitura de todas as entregas de um armazém, na ordem de leitura."""
+    def __init__(self, armazem):
+        self.armazem = armazem
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError(indice)
+        return self.armazem.registro(indice)
+
+    def __len__(self):
+        return len(self.armazem)
+
+
+class ArmazemConexoes(Sequence):
+    """
+    Conexões em formato colunar (códigos de cidade e tempos em array('i')).
+    Cada item lido é um dicionário {'origem', 'destino', 'tempo'}.
+    """
+    def __init__(self):
+        self.cidades = TabelaCidades()
+        self.origem = array('i')
+        self.destino = array('i')
+        self.tempo = array('i')
+
+    def append(self, conexao):
+        self.origem.append(self.cidades.codigo(conexao['origem']))
+        self.destino.append(self.cidades.codigo(conexao['destino']))
+        self.tempo.append(conexao['tempo'])
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        nomes = self.cidades.nomes
+        return {
+            'origem': nomes[self.origem[indice]],
+            'destino': nomes[self.destino[indice]],
+            'tempo': self.tempo[indice]
+        }
+
+    def __len__(self):
+        return len(self.tempo)
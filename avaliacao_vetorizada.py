@@ -0,0 +1,104 @@
+import numpy as np
+
+from armazem_colunar import dias_desde_epoca, primeiro_dia_valido
+
+
+class AvaliadorVetorizado:
+    """
+    Avalia uma população inteira do algoritmo genético de uma só vez.
+    As entregas são codificadas como índices em vetores NumPy de tempo,
+    lucro (valor + bônus), prazo e posição do id na ordem dos ids; a
+    população é uma matriz (tamanho_populacao x capacidade_diaria) de índices.
+    """
+    def __init__(self, tempo, lucro, prazo, posto):
+        self.tempo = tempo  # int64, 0 para entregas sem conexão
+        self.lucro = lucro  # float64, valor + bônus (0 para entregas sem conexão)
+        self.prazo = prazo  # int64, dias desde EPOCA
+        self.posto = posto  # int64, posição do id entre os ids ordenados (ordem da soma do lucro)
+
+    @classmethod
+    def das_entregas(cls, entregas, calcular_tempo_entrega):
+        """Codifica uma lista de entregas (dicionários)."""
+        tempos = [calcular_tempo_entrega(e['origem'], e['destino']) for e in entregas]
+        # Entregas sem conexão não contam tempo nem lucro, como em avaliar_solucao
+        tempo = np.array([t if t else 0 for t in tempos], dtype=np.int64)
+        lucro = np.array([e['valor'] + e['bonus'] if t else 0.0
+                          for e, t in zip(entregas, tempos)], dtype=np.float64)
+        prazo = np.array([dias_desde_epoca(e['prazo']) for e in entregas], dtype=np.int64)
+        posto = _postos(np.array([e['id'] for e in entregas], dtype=str))
+        return cls(tempo, lucro, prazo, posto)
+
+    @classmethod
+    def do_armazem(cls, armazem, indices, calcular_tempo_entrega):
+        """
+        Codifica as linhas `indices` de um ArmazemEntregas direto das colunas,
+        consultando o tempo uma única vez por par (origem, destino).
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        origem = armazem.coluna('origem')[indices].astype(np.int64)
+        destino = armazem.coluna('destino')[indices].astype(np.int64)
+        nomes = armazem.cidades.nomes
+        total_cidades = len(nomes)
+        pares, posicoes = np.unique(origem * total_cidades + destino, return_inverse=True)
+        tempos_pares = [calcular_tempo_entrega(nomes[par // total_cidades], nomes[par % total_cidades])
+                        for par in pares.tolist()]
+        tempo_par = np.array([t if t else 0 for t in tempos_pares], dtype=np.int64)
+
+        tempo = tempo_par[posicoes.reshape(-1)] if len(pares) else np.zeros(0, dtype=np.int64)
+        lucro = armazem.coluna('valor')[indices] + armazem.coluna('bonus')[indices]
+        lucro = np.where(tempo > 0, lucro, 0.0)
+        prazo = armazem.coluna('prazo')[indices].astype(np.int64)
+        posto = _postos(armazem.coluna('id')[indices])
+        return cls(tempo, lucro, prazo, posto)
+
+    def avaliar_populacao(self, populacao, data_atual):
+        """
+        Retorna os vetores (tempos, lucros) de todos os indivíduos.
+        Os lucros de cada indivíduo são somados coluna a coluna na ordem
+        dos ids, como em SistemaEntregaIA.avaliar_solucao, para reproduzir
+        exatamente os totais em ponto flutuante da avaliação escalar.
+        """
+        matriz = np.asarray(populacao, dtype=np.intp)
+        tamanho = matriz.shape[0]
+        tempos = np.zeros(tamanho, dtype=np.int64)
+        lucros = np.zeros(tamanho, dtype=np.float64)
+        if matriz.size == 0:
+            return tempos, lucros
+
+        no_prazo = self.prazo[matriz] >= primeiro_dia_valido(data_atual)
+        tempo_genes = np.where(no_prazo, self.tempo[matriz], 0)
+        lucro_genes = np.where(no_prazo, self.lucro[matriz], 0.0)
+        ordem_ids = np.argsort(self.posto[matriz], axis=1, kind='stable')
+        lucro_genes = np.take_along_axis(lucro_genes, ordem_ids, axis=1)
+        for coluna in range(matriz.shape[1]):
+            tempos += tempo_genes[:, coluna]
+            lucros += lucro_genes[:, coluna]
+        return tempos, lucros
+
+    @staticmethod
+    def ranquear(tempos, lucros, limite=None):
+        """
+        Retorna (ordem, indice_melhor):
+        - ordem: indivíduos por maior lucro e, no empate, menor tempo (ordenação estável);
+          com limite, só os `limite` primeiros
+        - indice_melhor: primeiro indivíduo com menor tempo e, no empate, maior lucro
+        Com limite, a ordenação completa é trocada por uma seleção parcial
+        (np.partition), em tempo linear no tamanho da população.
+        """
+        empatados = np.flatnonzero(tempos == tempos.min())
+        indice_melhor = int(empatados[np.argmax(lucros[empatados])])
+        if limite is None or limite >= len(lucros):
+            return np.lexsort((tempos, -lucros)).tolist(), indice_melhor
+        # Só os indivíduos com lucro de pelo menos o limite-ésimo maior são ordenados
+        corte = np.partition(lucros, len(lucros) - limite)[len(lucros) - limite]
+        candidatos = np.flatnonzero(lucros >= corte)
+        ordem = candidatos[np.lexsort((tempos[candidatos], -lucros[candidatos]))][:limite]
+        return ordem.tolist(), indice_melhor
+
+
+def _postos(ids):
+    """Posição de cada id na ordem crescente dos ids (ids repetidos têm a mesma posição)."""
+    if not len(ids):
+        return np.zeros(0, dtype=np.int64)
+    _, posto = np.unique(ids, return_inverse=True)
+    return posto.reshape(-1).astype(np.int64)
@@ -0,0 +1,58 @@
+from collections import OrderedDict
+
+
+class CacheAvaliacao:
+    """
+    Cache LRU de avaliações de soluções do algoritmo genético.
+    A chave é (ids das entregas ordenados, data_atual), independente da
+    ordem dos genes: permutações da mesma solução dividem a entrada, o que
+    aumenta a taxa de acerto (cruzamento e mutação remontam com frequência
+    as mesmas entregas em outra ordem). Para isso o lucro é somado na ordem
+    dos ids, e não dos genes, tanto em avaliar_solucao quanto na avaliação
+    vetorizada; o valor guardado é então exatamente o que seria
+    recalculado, e o cache é transparente (mesmo resultado com ou sem ele).
+    O custo é ordenar os ids a cada avaliação, pequeno perto da consulta
+    dos tempos. Ao atingir tamanho_maximo a entrada menos usada é descartada.
+    """
+    def __init__(self, tamanho_maximo=100000):
+        self.tamanho_maximo = tamanho_maximo
+        self._itens = OrderedDict()
+        self.acertos = 0
+        self.faltas = 0
+
+    @staticmethod
+    def chave(ids_entregas, data_atual):
+        """Chave canônica de uma solução (ids repetidos continuam contando)."""
+        return (tuple(sorted(ids_entregas)), data_atual)
+
+    def obter(self, chave):
+        """Retorna a avaliação guardada ou None, atualizando os contadores."""
+        avaliacao = self._itens.get(chave)
+        if avaliacao is None:
+            self.faltas += 1
+            return None
+        self._itens.move_to_end(chave)
+        self.acertos += 1
+        return avaliacao
+
+    def guardar(self, chave, avaliacao):
+        self._itens[chave] = avaliacao
+        self._itens.move_to_end(chave)
+        if len(self._itens) > self.tamanho_maximo:
+            self._itens.popitem(last=False)
+
+    def limpar(self):
+        """Descarta as avaliações guardadas (ex.: após recarregar os dados)."""
+        self._itens.clear()
+
+    def estatisticas(self):
+        consultas = self.acertos + self.faltas
+        return {
+            'acertos': self.acertos,
+            'faltas': self.faltas,
+            'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            'tamanho': len(self._itens)
+        }
+
+    def __len__(self):
+        return len(self._itens)
@@ -1,517 +1,434 @@
 import csv
-import random
+import json
+import math
+import os
 import time
-import matplotlib.pyplot as plt
-import pandas as pd
-from datetime import datetime, timedelta
-import tkinter as tk
-from tkinter import ttk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
+from datetime import timedelta
 
 # Importando classes dos sistemas originais
 from SistemaEntrega import SistemaEntrega
 from SistemaEntregaIA import SistemaEntregaIA
+from gerador_dados import gerar_conexoes, gerar_entregas, nomes_cidades
+from leitura_csv import iterar_conexoes, iterar_entregas
+
+# Comparador do processo worker, enviado uma única vez pelo initializer do pool
+_comparador_worker = None
+
+def _inicializar_worker(comparador):
+    global _comparador_worker
+    _comparador_worker = comparador
+
+def _executar_tarefa(tarefa):
+    data_atual, algoritmo, capacidade_diaria, semente_dia, geracoes, _ = tarefa
+    return _comparador_worker._executar_algoritmo(algoritmo, data_atual, capacidade_diaria, semente_dia, exibir=False,
+                                                  geracoes=geracoes)
 
 class ComparadorAlgoritmos:
     def __init__(self):
         self.sistema_a = SistemaEntrega()
         self.sistema_b = SistemaEntregaIA()
         self.resultados = []
-        
-    def carregar_dados(self, arquivo_conexoes, arquivo_entregas):
-        """Carrega dados para ambos os sistemas."""
-        self.sistema_a.ler_conexoes(arquivo_conexoes)
-        self.sistema_a.ler_entregas(arquivo_entregas)
-        
-        self.sistema_b.ler_conexoes(arquivo_conexoes)
-        self.sistema_b.ler_entregas(arquivo_entregas)
-        
-    def executar_comparacao(self, data_inicio, dias=10, capacidade_diaria=5):
-        """Executa ambos os algoritmos por vários dias e compara resultados."""
-        resultados = []
-        
+        self.frente_pareto = None
+        
+    def carregar_dados(self, arquivo_conexoes, arquivo_entregas, usar_snapshot=False):
+        """Carrega dados para ambos os sistemas (uma única leitura, opcionalmente via snapshot binário)."""
+        self.sistema_a.ler_conexoes(arquivo_conexoes, usar_snapshot=usar_snapshot)
+        self.sistema_a.ler_entregas(arquivo_entregas, usar_snapshot=usar_snapshot)
+        
+        # Os dados são somente leitura: ambos os sistemas usam a mesma instância
+        self.sistema_b.compartilhar_dados(self.sistema_a)
+        
+    def executar_comparacao(self, data_inicio, dias=10, capacidade_diaria=5, workers=None, semente=None,
+                            exibir=True, renderizador=None, incremental=False, geracoes=100):
+        """
+        Executa ambos os algoritmos por vários dias e compara resultados.
+        As programações são impressas como texto, enviadas ao `renderizador`
+        informado (ver resultado_programacao) ou, com exibir=False, não são
+        renderizadas.
+        Com semente, o algoritmo genético de cada dia usa um gerador próprio
+        derivado de (semente, dia).
+        Com workers > 1, os dias e os dois algoritmos de cada dia são
+        distribuídos em um pool de processos (sem exibir as programações);
+        os resultados voltam na ordem dos dias e, para a mesma semente
+        (0 se omitida), não dependem do número de workers.
+        Com incremental=True, o algoritmo genético de cada dia parte da
+        população final do dia anterior (ver SistemaEntregaIA.algoritmo_genetico,
+        continuar=True), o que permite usar menos `geracoes`; como cada dia
+        depende do anterior, esse modo só roda sequencialmente.
+        """
+        paralelo = workers is not None and workers > 1
+        if paralelo and incremental:
+            raise ValueError("o modo incremental depende do dia anterior e não pode usar workers > 1")
+        if paralelo and semente is None:
+            semente = 0
+        
+        tarefas = []
         data_atual = data_inicio
         for dia in range(1, dias + 1):
-            print(f"\n===== Dia {dia} - {data_atual.strftime('%Y-%m-%d')} =====")
-            
-            # Medir tempo de execução do algoritmo A
-            inicio_a = time.time()
-            entregas_a = self.sistema_a.selecionar_entregas(data_atual, capacidade_diaria)
-            lucro_a = self.sistema_a.exibir_programacao(entregas_a)
-            tempo_exec_a = time.time() - inicio_a
-            
-            # Calcular tempo total das entregas para algoritmo A
-            tempo_total_a = 0
-            rotas_a = []
-            for entrega in entregas_a:
-                tempo = self.sistema_a.calcular_tempo_entrega(entrega['origem'], entrega['destino'])
-                if tempo:
-                    tempo_total_a += tempo
-                    rotas_a.append(f"{entrega['origem']};{tempo}")
-            
-            # Medir tempo de execução do algoritmo B
-            inicio_b = time.time()
-            entregas_b = self.sistema_b.algoritmo_genetico(data_atual, capacidade_diaria=capacidade_diaria)
-            lucro_b, tempo_total_b = self.sistema_b.exibir_programacao(entregas_b)
-            tempo_exec_b = time.time() - inicio_b
-            
-            # Construir rotas para algoritmo B
-            rotas_b = []
-            for entrega in entregas_b:
-                tempo = self.sistema_b.calcular_tempo_entrega(entrega['origem'], entrega['destino'])
-                if tempo:
-                    rotas_b.append(f"{entrega['origem']};{tempo}")
-            
-            # Formatação da saída no formato solicitado
-            saida_a = f"({capacidade_diaria}, {', '.join(rotas_a)})"
-            saida_b = f"({capacidade_diaria}, {', '.join(rotas_b)})"
-            
-            # Guardar resultados
-            resultados.append({
-                'dia': dia,
-                'data': data_atual.strftime('%Y-%m-%d'),
-                'lucro_a': lucro_a,
-                'tempo_exec_a': tempo_exec_a,
-                'tempo_entrega_a': tempo_total_a,
-                'entregas_a': len(entregas_a),
-                'rotas_a': saida_a,
-                'lucro_b': lucro_b,
-                'tempo_exec_b': tempo_exec_b,
-                'tempo_entrega_b': tempo_total_b,
-                'entregas_b': len(entregas_b),
-                'rotas_b': saida_b
-            })
-            
+            semente_dia = f"{semente}:{dia}" if semente is not None else None
+            tarefas.append((data_atual, 'a', capacidade_diaria, semente_dia, geracoes, False))
+            tarefas.append((data_atual, 'b', capacidade_diaria, semente_dia, geracoes, incremental and dia > 1))
             # Avançar para o próximo dia
             data_atual += timedelta(days=1)
         
+        if paralelo:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker, initargs=(self,)) as executor:
+                execucoes = list(executor.map(_executar_tarefa, tarefas))
+        else:
+            execucoes = []
+            for data_atual, algoritmo, capacidade, semente_dia, geracoes_dia, continuar in tarefas:
+                if algoritmo == 'a' and exibir and renderizador is None:
+                    dia = len(execucoes) // 2 + 1
+                    print(f"\n===== Dia {dia} - {data_atual.strftime('%Y-%m-%d')} =====")
+                execucoes.append(self._executar_algoritmo(algoritmo, data_atual, capacidade, semente_dia, exibir,
+                                                          geracoes=geracoes_dia, renderizador=renderizador,
+                                                          continuar=continuar))
+            if renderizador is not None:
+                renderizador.descarregar()
+        
+        resultados = [self._montar_resultado(dia, tarefas[2 * (dia - 1)][0], execucoes[2 * (dia - 1)], execucoes[2 * (dia - 1) + 1])
+                      for dia in range(1, dias + 1)]
+        
         self.resultados = resultados
         return resultados
     
-    def gerar_graficos_comparativos(self):
-        """Gera gráficos comparativos entre os algoritmos."""
+    def executar_dia(self, dia, data_atual, capacidade_diaria=5, tamanho_populacao=50, geracoes=100, semente=None,
+                     exibir=False, continuar=False, cancelar=None):
+        """
+        Executa os dois algoritmos para um único dia e retorna a linha de resultado do dia.
+        Com continuar=True, o algoritmo genético parte da população final da execução anterior.
+        cancelar é repassado ao algoritmo genético, que o consulta a cada geração.
+        """
+        execucao_a = self._executar_algoritmo('a', data_atual, capacidade_diaria, exibir=exibir)
+        execucao_b = self._executar_algoritmo('b', data_atual, capacidade_diaria, semente, exibir,
+                                              tamanho_populacao, geracoes, continuar=continuar, cancelar=cancelar)
+        return self._montar_resultado(dia, data_atual, execucao_a, execucao_b)
+    
+    @staticmethod
+    def _montar_resultado(dia, data_atual, execucao_a, execucao_b):
+        resultado = {'dia': dia, 'data': data_atual.strftime('%Y-%m-%d')}
+        for sufixo, execucao in (('a', execucao_a), ('b', execucao_b)):
+            for chave, valor in execucao.items():
+                resultado[f'{chave}_{sufixo}'] = valor
+        return resultado
+    
+    def _executar_algoritmo(self, algoritmo, data_atual, capacidade_diaria, semente=None, exibir=True,
+                            tamanho_populacao=50, geracoes=100, renderizador=None, continuar=False, cancelar=None):
+        """
+        Executa o algoritmo 'a' (SistemaEntrega) ou 'b' (SistemaEntregaIA) para um dia.
+        Retorna lucro, tempo de execução, tempo total de entrega, quantidade de entregas,
+        rotas e bônus médio por entrega. O tempo de execução mede só a seleção;
+        a programação é exibida (com exibir=True) fora da medição.
+        """
+        sistema = self.sistema_a if algoritmo == 'a' else self.sistema_b
+        
+        # Medir tempo de execução do algoritmo
+        inicio = time.perf_counter()
+        if algoritmo == 'a':
+            entregas = sistema.selecionar_entregas(data_atual, capacidade_diaria)
+        else:
+            entregas = sistema.algoritmo_genetico(data_atual, tamanho_populacao, geracoes, capacidade_diaria, semente=semente,
+                                                  continuar=continuar, cancelar=cancelar)
+        tempo_exec = time.perf_counter() - inicio
+        
+        resultado = sistema.calcular_programacao(entregas)
+        if exibir:
+            sistema.renderizar_programacao(resultado, renderizador)
+        
+        # Formatação da saída no formato solicitado
+        return {
+            'lucro': resultado.lucro_total,
+            'tempo_exec': tempo_exec,
+            'tempo_entrega': resultado.tempo_total,
+            'entregas': len(entregas),
+            'rotas': resultado.rotas(capacidade_diaria),
+            'bonus_medio': sum(e['bonus'] for e in entregas) / len(entregas) if entregas else 0
+        }
+    
+    def resumo_comparativo(self):
+        """
+        Retorna o resumo comparativo dos resultados como dicionário (serializável em JSON).
+        Percentuais sem base (divisão por zero) ficam como None.
+        """
+        def soma(chave):
+            return sum(r[chave] for r in self.resultados)
+        
+        def percentual(numerador, denominador):
+            return (numerador / denominador - 1) * 100 if denominador else None
+        
+        dias = len(self.resultados)
+        lucro_a, lucro_b = soma('lucro_a'), soma('lucro_b')
+        tempo_entrega_a, tempo_entrega_b = soma('tempo_entrega_a'), soma('tempo_entrega_b')
+        return {
+            'dias': dias,
+            'lucro_total_a': lucro_a,
+            'lucro_total_b': lucro_b,
+            'melhoria_lucro': percentual(lucro_b, lucro_a),
+            'tempo_exec_medio_a': soma('tempo_exec_a') / dias if dias else None,
+            'tempo_exec_medio_b': soma('tempo_exec_b') / dias if dias else None,
+            'tempo_entrega_total_a': tempo_entrega_a,
+            'tempo_entrega_total_b': tempo_entrega_b,
+            'reducao_tempo_entrega': percentual(tempo_entrega_a, tempo_entrega_b),
+            'rotas_a': self.resultados[0]['rotas_a'] if dias else None,
+            'rotas_b': self.resultados[0]['rotas_b'] if dias else None
+        }
+    
+    def desenhar_graficos(self, fig):
+        """Desenha os quatro gráficos comparativos em uma figure do matplotlib."""
+        dias = [r['dia'] for r in self.resultados]
+        series = [
+            ('lucro', 'Lucro (R$)', 'Comparação de Lucro por Algoritmo'),
+            ('tempo_exec', 'Tempo de Execução (s)', 'Comparação de Tempo de Processamento'),
+            ('tempo_entrega', 'Tempo Total de Entrega (min)', 'Comparação de Tempo Total de Entrega'),
+            ('eficiencia', 'Eficiência (R$/min)', 'Comparação de Eficiência (Lucro/Tempo)')
+        ]
+        for posicao, (serie, rotulo, titulo) in enumerate(series, start=1):
+            ax = fig.add_subplot(2, 2, posicao)
+            for sufixo, estilo, nome in (('a', 'b-', 'SistemaEntrega'), ('b', 'r-', 'SistemaEntregaIA')):
+                if serie == 'eficiencia':
+                    # Eficiência (lucro/tempo); dias sem tempo de entrega ficam sem ponto
+                    valores = [r[f'lucro_{sufixo}'] / r[f'tempo_entrega_{sufixo}'] if r[f'tempo_entrega_{sufixo}'] else math.nan
+                               for r in self.resultados]
+                else:
+                    valores = [r[f'{serie}_{sufixo}'] for r in self.resultados]
+                ax.plot(dias, valores, estilo, label=nome)
+            ax.set_xlabel('Dia')
+            ax.set_ylabel(rotulo)
+            ax.set_title(titulo)
+            ax.legend()
+            ax.grid(True)
+        fig.tight_layout()
+    
+    def executar_frente_pareto(self, data_atual, capacidade_diaria=5, tamanho_populacao=100, geracoes=100, semente=None,
+                               cancelar=None):
+        """
+        Calcula, com o modo multiobjetivo do SistemaEntregaIA (NSGA-II), a
+        frente de Pareto de (lucro, tempo total) de um dia e a guarda em
+        self.frente_pareto (serializável em JSON), que é retornada.
+        cancelar é repassado ao algoritmo (ver executar_dia).
+        """
+        frente = self.sistema_b.algoritmo_genetico_pareto(data_atual, tamanho_populacao, geracoes, capacidade_diaria,
+                                                          semente=semente, cancelar=cancelar)
+        self.frente_pareto = {
+            'data': data_atual.strftime('%Y-%m-%d'),
+            'capacidade_diaria': capacidade_diaria,
+            'solucoes': [{'tempo': solucao['tempo'], 'lucro': solucao['lucro'],
+                          'entregas': [e['id'] for e in solucao['entregas']]} for solucao in frente]
+        }
+        return self.frente_pareto
+    
+    def desenhar_frente_pareto(self, fig):
+        """
+        Desenha a frente de Pareto (tempo x lucro) em uma figure do matplotlib,
+        com as soluções dos dois algoritmos no mesmo dia, se esse dia estiver
+        nos resultados da comparação.
+        """
+        ax = fig.add_subplot(1, 1, 1)
+        if self.frente_pareto is None:
+            return
+        solucoes = self.frente_pareto['solucoes']
+        ax.step([s['tempo'] for s in solucoes], [s['lucro'] for s in solucoes], 'g-', where='post', alpha=0.5)
+        ax.plot([s['tempo'] for s in solucoes], [s['lucro'] for s in solucoes], 'go', label='Frente de Pareto (NSGA-II)')
+        for r in self.resultados:
+            if r['data'] == self.frente_pareto['data']:
+                ax.plot(r['tempo_entrega_a'], r['lucro_a'], 'bs', markersize=9, label='SistemaEntrega')
+                ax.plot(r['tempo_entrega_b'], r['lucro_b'], 'r^', markersize=9, label='SistemaEntregaIA')
+                break
+        ax.set_xlabel('Tempo Total de Entrega (min)')
+        ax.set_ylabel('Lucro (R$)')
+        ax.set_title(f"Frente de Pareto Lucro x Tempo em {self.frente_pareto['data']}")
+        ax.legend()
+        ax.grid(True)
+        fig.tight_layout()
+    
+    def gerar_graficos_comparativos(self, arquivo='comparacao_algoritmos.png', mostrar=True):
+        """
+        Gera gráficos comparativos entre os algoritmos, salva em `arquivo` e
+        imprime o resumo. Com mostrar=False a figura é apenas salva, com o
+        backend não interativo Agg (sem abrir janela).
+        """
         if not self.resultados:
             print("Execute a comparação primeiro")
             return
         
+        import pandas as pd
         df = pd.DataFrame(self.resultados)
         
         # Configuração dos gráficos
-        plt.figure(figsize=(15, 12))
-        
-        # Gráfico de lucro
-        plt.subplot(2, 2, 1)
-        plt.plot(df['dia'], df['lucro_a'], 'b-', label='SistemaEntrega')
-        plt.plot(df['dia'], df['lucro_b'], 'r-', label='SistemaEntregaIA')
-        plt.xlabel('Dia')
-        plt.ylabel('Lucro (R$)')
-        plt.title('Comparação de Lucro por Algoritmo')
-        plt.legend()
-        plt.grid(True)
-        
-        # Gráfico de tempo de execução
-        plt.subplot(2, 2, 2)
-        plt.plot(df['dia'], df['tempo_exec_a'], 'b-', label='SistemaEntrega')
-        plt.plot(df['dia'], df['tempo_exec_b'], 'r-', label='SistemaEntregaIA')
-        plt.xlabel('Dia')
-        plt.ylabel('Tempo de Execução (s)')
-        plt.title('Comparação de Tempo de Processamento')
-        plt.legend()
-        plt.grid(True)
-        
-        # Gráfico de tempo total de entrega
-        plt.subplot(2, 2, 3)
-        plt.plot(df['dia'], df['tempo_entrega_a'], 'b-', label='SistemaEntrega')
-        plt.plot(df['dia'], df['tempo_entrega_b'], 'r-', label='SistemaEntregaIA')
-        plt.xlabel('Dia')
-        plt.ylabel('Tempo Total de Entrega (min)')
-        plt.title('Comparação de Tempo Total de Entrega')
-        plt.legend()
-        plt.grid(True)
-        
-        # Gráfico de eficiência (lucro/tempo)
-        plt.subplot(2, 2, 4)
-        eficiencia_a = df['lucro_a'] / df['tempo_entrega_a']
-        eficiencia_b = df['lucro_b'] / df['tempo_entrega_b']
-        plt.plot(df['dia'], eficiencia_a, 'b-', label='SistemaEntrega')
-        plt.plot(df['dia'], eficiencia_b, 'r-', label='SistemaEntregaIA')
-        plt.xlabel('Dia')
-        plt.ylabel('Eficiência (R$/min)')
-        plt.title('Comparação de Eficiência (Lucro/Tempo)')
-        plt.legend()
-        plt.grid(True)
-        
-        plt.tight_layout()
-        plt.savefig('comparacao_algoritmos.png')
-        plt.show()
+        if mostrar:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(15, 12))
+        else:
+            fig = _figura_agg(figsize=(15, 12))
+        self.desenhar_graficos(fig)
+        fig.savefig(arquivo)
+        if mostrar:
+            plt.show()
         
         # Tabela comparativa
-        melhoria_lucro = ((df['lucro_b'].sum() / df['lucro_a'].sum()) - 1) * 100
-        melhoria_tempo = ((df['tempo_entrega_a'].sum() / df['tempo_entrega_b'].sum()) - 1) * 100
+        resumo = self.resumo_comparativo()
         
         print("\n===== RESUMO COMPARATIVO =====")
-        print(f"Lucro total SistemaEntrega: R$ {df['lucro_a'].sum():.2f}")
-        print(f"Lucro total SistemaEntregaIA: R$ {df['lucro_b'].sum():.2f}")
-        print(f"Melhoria no lucro: {melhoria_lucro:.2f}%")
-        print(f"Tempo médio de execução SistemaEntrega: {df['tempo_exec_a'].mean():.4f} s")
-        print(f"Tempo médio de execução SistemaEntregaIA: {df['tempo_exec_b'].mean():.4f} s")
-        print(f"Tempo total de entrega SistemaEntrega: {df['tempo_entrega_a'].sum()} min")
-        print(f"Tempo total de entrega SistemaEntregaIA: {df['tempo_entrega_b'].sum()} min")
-        print(f"Redução no tempo de entrega: {melhoria_tempo:.2f}%")
+        print(f"Lucro total SistemaEntrega: R$ {resumo['lucro_total_a']:.2f}")
+        print(f"Lucro total SistemaEntregaIA: R$ {resumo['lucro_total_b']:.2f}")
+        print(f"Melhoria no lucro: {_formatar_percentual(resumo['melhoria_lucro'])}")
+        print(f"Tempo médio de execução SistemaEntrega: {resumo['tempo_exec_medio_a']:.4f} s")
+        print(f"Tempo médio de execução SistemaEntregaIA: {resumo['tempo_exec_medio_b']:.4f} s")
+        print(f"Tempo total de entrega SistemaEntrega: {resumo['tempo_entrega_total_a']} min")
+        print(f"Tempo total de entrega SistemaEntregaIA: {resumo['tempo_entrega_total_b']} min")
+        print(f"Redução no tempo de entrega: {_formatar_percentual(resumo['reducao_tempo_entrega'])}")
         print("===============================")
         
         # Exibir formato de saída solicitado
         print("\n===== EXEMPLO DE SAÍDA =====")
         print("SistemaEntrega:")
-        print(df['rotas_a'].iloc[0])
+        print(resumo['rotas_a'])
         print("\nSistemaEntregaIA:")
-        print(df['rotas_b'].iloc[0])
+        print(resumo['rotas_b'])
         print("===========================")
         
         return df
-
-class SimuladorLeilao(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        
-        self.title("Simulador de Leilão de Entregas")
-        self.geometry("1200x800")
-        
-        self.sistema_a = SistemaEntrega()
-        self.sistema_b = SistemaEntregaIA()
-        
-        self.setup_ui()
-        
-    def setup_ui(self):
-        """Configura a interface gráfica."""
-        # Frame para controles
-        frm_controles = ttk.Frame(self)
-        frm_controles.pack(pady=10, fill=tk.X)
-        
-        # Parâmetros de simulação
-        ttk.Label(frm_controles, text="Data Inicial:").grid(row=0, column=0, padx=5, pady=5)
-        self.data_var = tk.StringVar(value="2023-11-15")
-        ttk.Entry(frm_controles, textvariable=self.data_var, width=12).grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(frm_controles, text="Capacidade Diária:").grid(row=0, column=2, padx=5, pady=5)
-        self.capacidade_var = tk.IntVar(value=5)
-        ttk.Spinbox(frm_controles, from_=1, to=20, textvariable=self.capacidade_var, width=5).grid(row=0, column=3, padx=5, pady=5)
-        
-        ttk.Label(frm_controles, text="Dias:").grid(row=0, column=4, padx=5, pady=5)
-        self.dias_var = tk.IntVar(value=10)
-        ttk.Spinbox(frm_controles, from_=1, to=30, textvariable=self.dias_var, width=5).grid(row=0, column=5, padx=5, pady=5)
-        
-        # Parâmetros do algoritmo genético
-        ttk.Label(frm_controles, text="Tamanho População:").grid(row=1, column=0, padx=5, pady=5)
-        self.populacao_var = tk.IntVar(value=50)
-        ttk.Spinbox(frm_controles, from_=10, to=200, textvariable=self.populacao_var, width=5).grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Label(frm_controles, text="Gerações:").grid(row=1, column=2, padx=5, pady=5)
-        self.geracoes_var = tk.IntVar(value=100)
-        ttk.Spinbox(frm_controles, from_=10, to=500, textvariable=self.geracoes_var, width=5).grid(row=1, column=3, padx=5, pady=5)
-        
-        # Botões
-        ttk.Button(frm_controles, text="Carregar Dados", command=self.carregar_dados).grid(row=1, column=4, padx=5, pady=5)
-        ttk.Button(frm_controles, text="Executar Simulação", command=self.executar_simulacao).grid(row=1, column=5, padx=5, pady=5)
-        
-        # Frame para gráficos
-        self.frm_graficos = ttk.Frame(self)
-        self.frm_graficos.pack(expand=True, fill=tk.BOTH, padx=10, pady=10)
-        
-        # Frame para resultados
-        self.frm_resultados = ttk.Frame(self)
-        self.frm_resultados.pack(fill=tk.X, padx=10, pady=10)
-        
-        # Frame para exibir formato de saída
-        self.frm_saida = ttk.LabelFrame(self, text="Formato de Saída")
-        self.frm_saida.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.saida_a_var = tk.StringVar()
-        self.saida_b_var = tk.StringVar()
-        
-        ttk.Label(self.frm_saida, text="SistemaEntrega:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        ttk.Entry(self.frm_saida, textvariable=self.saida_a_var, width=60, state="readonly").grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(self.frm_saida, text="SistemaEntregaIA:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        ttk.Entry(self.frm_saida, textvariable=self.saida_b_var, width=60, state="readonly").grid(row=1, column=1, padx=5, pady=5)
-        
-        # Label para status
-        self.status_var = tk.StringVar(value="Pronto para iniciar. Carregue os dados e execute a simulação.")
-        ttk.Label(self, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W).pack(fill=tk.X, side=tk.BOTTOM, padx=5, pady=5)
-    
-    def carregar_dados(self):
-        """Carrega dados de conexões e entregas."""
-        self.status_var.set("Carregando dados...")
-        try:
-            self.sistema_a.ler_conexoes("conexoes.csv")
-            self.sistema_a.ler_entregas("entregas.csv")
-            
-            self.sistema_b.ler_conexoes("conexoes.csv")
-            self.sistema_b.ler_entregas("entregas.csv")
-            
-            self.status_var.set(f"Dados carregados: {len(self.sistema_a.conexoes)} conexões e {len(self.sistema_a.entregas)} entregas.")
-        except Exception as e:
-            self.status_var.set(f"Erro ao carregar dados: {e}")
     
-    def executar_simulacao(self):
-        """Executa a simulação e exibe os resultados."""
-        # Limpar gráficos anteriores
-        for widget in self.frm_graficos.winfo_children():
-            widget.destroy()
-        for widget in self.frm_resultados.winfo_children():
-            widget.destroy()
-        
-        try:
-            data_inicial = datetime.strptime(self.data_var.get(), '%Y-%m-%d')
-            capacidade = self.capacidade_var.get()
-            dias = self.dias_var.get()
-            
-            # Modificar parâmetros do algoritmo genético
-            tamanho_populacao = self.populacao_var.get()
-            geracoes = self.geracoes_var.get()
-            
-            self.status_var.set("Executando simulação...")
-            
-            # Resultados da simulação
-            resultados = []
-            
-            data_atual = data_inicial
-            for dia in range(1, dias + 1):
-                # Algoritmo A - SistemaEntrega
-                inicio_a = time.time()
-                entregas_a = self.sistema_a.selecionar_entregas(data_atual, capacidade)
-                lucro_a = sum([e['valor'] + e['bonus'] for e in entregas_a])
-                tempo_exec_a = time.time() - inicio_a
-                
-                tempo_total_a = 0
-                rotas_a = []
-                for entrega in entregas_a:
-                    tempo = self.sistema_a.calcular_tempo_entrega(entrega['origem'], entrega['destino'])
-                    if tempo:
-                        tempo_total_a += tempo
-                        rotas_a.append(f"{entrega['origem']};{tempo}")
-                
-                # Algoritmo B - SistemaEntregaIA
-                inicio_b = time.time()
-                entregas_b = self.sistema_b.algoritmo_genetico(data_atual, tamanho_populacao, geracoes, capacidade)
-                tempo_exec_b = time.time() - inicio_b
-                
-                lucro_b = sum([e['valor'] + e['bonus'] for e in entregas_b])
-                tempo_total_b = 0
-                rotas_b = []
-                for entrega in entregas_b:
-                    tempo = self.sistema_b.calcular_tempo_entrega(entrega['origem'], entrega['destino'])
-                    if tempo:
-                        tempo_total_b += tempo
-                        rotas_b.append(f"{entrega['origem']};{tempo}")
-                
-                # Formatação da saída no formato solicitado
-                saida_a = f"({capacidade}, {', '.join(rotas_a)})"
-                saida_b = f"({capacidade}, {', '.join(rotas_b)})"
-                
-                # Atualizar os campos de saída na interface na primeira iteração
-                if dia == 1:
-                    self.saida_a_var.set(saida_a)
-                    self.saida_b_var.set(saida_b)
-                
-                # Guardar resultados
-                resultados.append({
-                    'dia': dia,
-                    'data': data_atual.strftime('%Y-%m-%d'),
-                    'lucro_a': lucro_a,
-                    'tempo_exec_a': tempo_exec_a,
-                    'tempo_entrega_a': tempo_total_a,
-                    'entregas_a': len(entregas_a),
-                    'rotas_a': saida_a,
-                    'lucro_b': lucro_b,
-                    'tempo_exec_b': tempo_exec_b,
-                    'tempo_entrega_b': tempo_total_b,
-                    'entregas_b': len(entregas_b),
-                    'rotas_b': saida_b
-                })
-                
-                # Avançar para o próximo dia
-                data_atual += timedelta(days=1)
-            
-            # Criar DataFrame
-            df = pd.DataFrame(resultados)
-            
-            # Criar figura para os gráficos
-            fig = plt.Figure(figsize=(12, 8), dpi=100)
-            
-            # Gráfico de lucro
-            ax1 = fig.add_subplot(221)
-            ax1.plot(df['dia'], df['lucro_a'], 'b-', label='SistemaEntrega')
-            ax1.plot(df['dia'], df['lucro_b'], 'r-', label='SistemaEntregaIA')
-            ax1.set_xlabel('Dia')
-            ax1.set_ylabel('Lucro (R$)')
-            ax1.set_title('Comparação de Lucro por Algoritmo')
-            ax1.legend()
-            ax1.grid(True)
-            
-            # Gráfico de tempo de execução
-            ax2 = fig.add_subplot(222)
-            ax2.plot(df['dia'], df['tempo_exec_a'], 'b-', label='SistemaEntrega')
-            ax2.plot(df['dia'], df['tempo_exec_b'], 'r-', label='SistemaEntregaIA')
-            ax2.set_xlabel('Dia')
-            ax2.set_ylabel('Tempo de Execução (s)')
-            ax2.set_title('Comparação de Tempo de Processamento')
-            ax2.legend()
-            ax2.grid(True)
-            
-            # Gráfico de tempo total de entrega
-            ax3 = fig.add_subplot(223)
-            ax3.plot(df['dia'], df['tempo_entrega_a'], 'b-', label='SistemaEntrega')
-            ax3.plot(df['dia'], df['tempo_entrega_b'], 'r-', label='SistemaEntregaIA')
-            ax3.set_xlabel('Dia')
-            ax3.set_ylabel('Tempo Total de Entrega (min)')
-            ax3.set_title('Comparação de Tempo Total de Entrega')
-            ax3.legend()
-            ax3.grid(True)
-            
-            # Gráfico de eficiência (lucro/tempo)
-            ax4 = fig.add_subplot(224)
-            eficiencia_a = df['lucro_a'] / df['tempo_entrega_a']
-            eficiencia_b = df['lucro_b'] / df['tempo_entrega_b']
-            ax4.plot(df['dia'], eficiencia_a, 'b-', label='SistemaEntrega')
-            ax4.plot(df['dia'], eficiencia_b, 'r-', label='SistemaEntregaIA')
-            ax4.set_xlabel('Dia')
-            ax4.set_ylabel('Eficiência (R$/min)')
-            ax4.set_title('Comparação de Eficiência (Lucro/Tempo)')
-            ax4.legend()
-            ax4.grid(True)
-            
-            fig.tight_layout()
-            
-            # Inserir gráficos na interface
-            canvas = FigureCanvasTkAgg(fig, self.frm_graficos)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Calcular estatísticas
-            melhoria_lucro = ((df['lucro_b'].sum() / df['lucro_a'].sum()) - 1) * 100
-            melhoria_tempo = ((df['tempo_entrega_a'].sum() / df['tempo_entrega_b'].sum()) - 1) * 100
-            
-            # Exibir resultados em tabela
-            style = ttk.Style()
-            style.configure("Treeview", rowheight=25)
-            
-            tree = ttk.Treeview(self.frm_resultados, columns=("algoritmo", "lucro", "tempo_exec", "tempo_entrega", "eficiencia", "bonus"))
-            tree.heading("#0", text="")
-            tree.heading("algoritmo", text="Algoritmo")
-            tree.heading("lucro", text="Lucro Total (R$)")
-            tree.heading("tempo_exec", text="Tempo Médio de Execução (s)")
-            tree.heading("tempo_entrega", text="Tempo Total de Entrega (min)")
-            tree.heading("eficiencia", text="Eficiência Média (R$/min)")
-            tree.heading("bonus", text="Bônus Médio por Entrega (R$)")
-            
-            tree.column("#0", width=0, stretch=tk.NO)
-            tree.column("algoritmo", width=150)
-            tree.column("lucro", width=120)
-            tree.column("tempo_exec", width=180)
-            tree.column("tempo_entrega", width=180)
-            tree.column("eficiencia", width=150)
-            tree.column("bonus", width=150)
-            
-            # Calcular bônus médio para cada algoritmo
-            bonus_a = []
-            bonus_b = []
-            for i in range(len(entregas_a)):
-                bonus_a.append(entregas_a[i]['bonus'])
-            for i in range(len(entregas_b)):
-                bonus_b.append(entregas_b[i]['bonus'])
-            
-            bonus_medio_a = sum(bonus_a) / len(bonus_a) if bonus_a else 0
-            bonus_medio_b = sum(bonus_b) / len(bonus_b) if bonus_b else 0
-            
-            tree.insert("", tk.END, text="1", values=("SistemaEntrega", 
-                                                        f"{df['lucro_a'].sum():.2f}", 
-                                                        f"{df['tempo_exec_a'].mean():.4f}",
-                                                        f"{df['tempo_entrega_a'].sum()}",
-                                                        f"{eficiencia_a.mean():.2f}",
-                                                        f"{bonus_medio_a:.2f}"))
-            
-            tree.insert("", tk.END, text="2", values=("SistemaEntregaIA", 
-                                                        f"{df['lucro_b'].sum():.2f}", 
-                                                        f"{df['tempo_exec_b'].mean():.4f}",
-                                                        f"{df['tempo_entrega_b'].sum()}",
-                                                        f"{eficiencia_b.mean():.2f}",
-                                                        f"{bonus_medio_b:.2f}"))
-            
-            tree.insert("", tk.END, text="3", values=("Diferença (%)", 
-                                                        f"{melhoria_lucro:.2f}%", 
-                                                        "---",
-                                                        f"{melhoria_tempo:.2f}%",
-                                                        f"{(eficiencia_b.mean()/eficiencia_a.mean() - 1) * 100:.2f}%",
-                                                        f"{(bonus_medio_b/bonus_medio_a - 1) * 100:.2f}%"))
-            
-            tree.pack(fill=tk.X, expand=True)
-            
-            self.status_var.set(f"Simulação concluída. Mostrando resultados para {dias} dias.")
-            
-        except Exception as e:
-            self.status_var.set(f"Erro na simulação: {e}")
+    def gerar_relatorio(self, diretorio='.', prefixo='comparacao'):
+        """
+        Modo relatório, sem interface nem saída no terminal: grava em `diretorio`
+        a figura (<prefixo>_graficos.png, backend Agg), os resultados por dia
+        (<prefixo>_resultados.csv) e o resumo (<prefixo>_resumo.json); se
+        houver frente de Pareto calculada, também o gráfico dela
+        (<prefixo>_pareto.png) e as suas soluções (<prefixo>_pareto.json).
+        Retorna os caminhos dos arquivos gravados.
+        """
+        if not self.resultados:
+            raise ValueError("Execute a comparação primeiro")
+        os.makedirs(diretorio, exist_ok=True)
+        arquivos = {
+            'graficos': os.path.join(diretorio, f'{prefixo}_graficos.png'),
+            'resultados': os.path.join(diretorio, f'{prefixo}_resultados.csv'),
+            'resumo': os.path.join(diretorio, f'{prefixo}_resumo.json')
+        }
+        
+        fig = _figura_agg(figsize=(15, 12))
+        self.desenhar_graficos(fig)
+        fig.savefig(arquivos['graficos'])
+        
+        with open(arquivos['resultados'], 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(self.resultados[0]))
+            writer.writeheader()
+            writer.writerows(self.resultados)
+        
+        with open(arquivos['resumo'], 'w') as file:
+            json.dump(self.resumo_comparativo(), file, indent=2, ensure_ascii=False)
+        
+        if self.frente_pareto is not None:
+            arquivos['pareto_grafico'] = os.path.join(diretorio, f'{prefixo}_pareto.png')
+            arquivos['pareto'] = os.path.join(diretorio, f'{prefixo}_pareto.json')
+            fig = _figura_agg(figsize=(10, 7))
+            self.desenhar_frente_pareto(fig)
+            fig.savefig(arquivos['pareto_grafico'])
+            with open(arquivos['pareto'], 'w') as file:
+                json.dump(self.frente_pareto, file, indent=2, ensure_ascii=False)
+        
+        return arquivos
+
+def _figura_agg(figsize):
+    """Figure com canvas Agg (não interativo), criada sem o pyplot e sem depender do backend padrão."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+def _formatar_percentual(valor):
+    return f"{valor:.2f}%" if valor is not None else "---"
+
+def __getattr__(nome):
+    # A interface gráfica (tkinter, matplotlib com TkAgg e pandas) só é importada quando usada
+    if nome == 'SimuladorLeilao':
+        from simulador_leilao import SimuladorLeilao
+        return SimuladorLeilao
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
 
 # Função para gerar dados de exemplo para testes
-def gerar_dados_exemplo():
-    """Gera arquivos CSV de exemplo para teste."""
-    # Gerar conexões
-    cidades = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']
-    
-    conexoes = []
-    for origem in cidades:
-        for destino in cidades:
-            if origem != destino:
-                tempo = random.randint(30, 180)  # Entre 30 minutos e 3 horas
-                conexoes.append({'origem': origem, 'destino': destino, 'tempo': tempo})
-    
-    with open('conexoes.csv', 'w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=['origem', 'destino', 'tempo'])
-        writer.writeheader()
-        writer.writerows(conexoes)
-    
-    # Gerar entregas
-    entregas = []
-    for i in range(1, 101):  # 100 entregas disponíveis
-        origem = random.choice(cidades)
-        destino = random.choice([c for c in cidades if c != origem])
-        
-        # Data aleatória nos próximos 14 dias
-        dias_entrega = random.randint(0, 14)
-        data_prazo = (datetime.now() + timedelta(days=dias_entrega)).strftime('%Y-%m-%d')
-        
-        valor = random.uniform(50, 300)  # Valor entre 50 e 300
-        bonus = random.uniform(10, 100)  # Bônus entre 10 e 100
-        
-        entregas.append({
-            'id': f"E{i:03d}",
-            'origem': origem,
-            'destino': destino,
-            'prazo': data_prazo,
-            'valor': round(valor, 2),
-            'bonus': round(bonus, 2)
-        })
-    
-    with open('entregas.csv', 'w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=['id', 'origem', 'destino', 'prazo', 'valor', 'bonus'])
-        writer.writeheader()
-        writer.writerows(entregas)
-    
-    print(f"Dados de exemplo gerados: {len(conexoes)} conexões e {len(entregas)} entregas.")
+def _cidades_do_arquivo(arquivo, iterar):
+    """Nomes das cidades (origem e destino) de um CSV existente, na ordem em que aparecem."""
+    cidades = {}
+    for registro in iterar(arquivo):
+        cidades.setdefault(registro['origem'], None)
+        cidades.setdefault(registro['destino'], None)
+    if not cidades:
+        raise ValueError(f"{arquivo} existe mas não tem nenhuma linha válida; "
+                         f"apague-o ou corrija-o para gerar os dados de exemplo")
+    return list(cidades)
+
+
+def gerar_dados_exemplo(diretorio='.', semente=0, sobrescrever=False):
+    """
+    Gera arquivos CSV de exemplo para teste (10 cidades e 100 entregas),
+    reprodutíveis pela semente e com prazos a partir de DATA_BASE_PADRAO.
+    Sem sobrescrever=True, só os arquivos que ainda não existem são gerados,
+    usando as cidades do arquivo que já existe para que os dois sejam coerentes.
+    """
+    arquivo_conexoes = os.path.join(diretorio, 'conexoes.csv')
+    arquivo_entregas = os.path.join(diretorio, 'entregas.csv')
+    gerar_arquivo_conexoes = sobrescrever or not os.path.exists(arquivo_conexoes)
+    gerar_arquivo_entregas = sobrescrever or not os.path.exists(arquivo_entregas)
+
+    if gerar_arquivo_conexoes and gerar_arquivo_entregas:
+        nomes = nomes_cidades(10)
+    elif gerar_arquivo_entregas:
+        nomes = _cidades_do_arquivo(arquivo_conexoes, iterar_conexoes)
+    elif gerar_arquivo_conexoes:
+        nomes = _cidades_do_arquivo(arquivo_entregas, iterar_entregas)
+    else:
+        nomes = []
+
+    arquivos = []
+    if gerar_arquivo_conexoes:
+        gerar_conexoes(arquivo_conexoes, nomes, 'completo', semente=semente, sobrescrever=sobrescrever)
+        arquivos.append(arquivo_conexoes)
+    if gerar_arquivo_entregas:
+        gerar_entregas(arquivo_entregas, nomes, 100, semente=semente, sobrescrever=sobrescrever)
+        arquivos.append(arquivo_entregas)
+    if arquivos:
+        print(f"Dados de exemplo gerados: {' e '.join(arquivos)}.")
     
     # Mostrar exemplo de saída no formato solicitado
     exemplo_rota = f"({5}, C;10)"
     print(f"\nExemplo de saída no formato solicitado: {exemplo_rota}")
 
-# Executar a aplicação
+# Executar a aplicação (ou, com --relatorio, a comparação sem interface gráfica)
 if __name__ == "__main__":
+    import argparse
+    from datetime import datetime
+    
+    parser = argparse.ArgumentParser(description="Comparação entre SistemaEntrega e SistemaEntregaIA.")
+    parser.add_argument('--relatorio', metavar='DIRETORIO', help="executa sem interface e grava figura, CSV e JSON no diretório")
+    parser.add_argument('--data-inicio', default='2023-11-15')
+    parser.add_argument('--dias', type=int, default=10)
+    parser.add_argument('--capacidade', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--semente', type=int, default=None)
+    parser.add_argument('--pareto', action='store_true', help="no relatório, inclui a frente de Pareto lucro x tempo do primeiro dia")
+    args = parser.parse_args()
+    
     # Verificar se os arquivos existem, caso contrário gerar dados de exemplo
-    import os
     if not os.path.exists('conexoes.csv') or not os.path.exists('entregas.csv'):
         print("Arquivos de dados não encontrados. Gerando dados de exemplo...")
         gerar_dados_exemplo()
     
-    # Iniciar a aplicação
-    app = SimuladorLeilao()
-    app.mainloop()
\ No newline at end of file
+    if args.relatorio:
+        comparador = ComparadorAlgoritmos()
+        comparador.carregar_dados('conexoes.csv', 'entregas.csv', usar_snapshot=True)
+        data_inicio = datetime.strptime(args.data_inicio, '%Y-%m-%d')
+        comparador.executar_comparacao(data_inicio, args.dias, args.capacidade, workers=args.workers, semente=args.semente,
+                                        exibir=False)
+        if args.pareto:
+            comparador.executar_frente_pareto(data_inicio, args.capacidade, semente=args.semente)
+        arquivos = comparador.gerar_relatorio(args.relatorio)
+        print(f"Relatório gravado: {', '.join(arquivos.values())}")
+    else:
+        # Iniciar a aplicação
+        from simulador_leilao import SimuladorLeilao
+        app = SimuladorLeilao()
+        app.mainloop()
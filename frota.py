@@ -0,0 +1,204 @@
+import os
+import random
+import time
+
+import numpy as np
+
+from avaliacao_vetorizada import AvaliadorVetorizado
+from nucleo_genetico import evoluir, populacao_inicial, reparar_populacao
+from operadores_geneticos import OPERADORES_PADRAO
+
+GERACOES_POR_RODADA = 20
+RODADAS = 5
+_DISTANCIA_SEM_CAMINHO = np.iinfo(np.int64).max // 4
+
+# Dados somente leitura do processo worker (avaliador do dia, data_atual, operadores).
+# São enviados uma única vez por processo pelo initializer do pool, e não a cada tarefa.
+_contexto = None
+
+
+class Veiculo:
+    """Um veículo da frota: identificador, número de entregas por dia e cidade de partida (None = qualquer)."""
+    def __init__(self, id, capacidade=5, base=None):
+        if capacidade < 1:
+            raise ValueError(f"capacidade inválida para o veículo {id}: {capacidade}")
+        self.id = id
+        self.capacidade = capacidade
+        self.base = base
+
+    def __repr__(self):
+        return f"Veiculo({self.id!r}, capacidade={self.capacidade}, base={self.base!r})"
+
+
+def distancias_bases(grafo, veiculos, nomes_cidades):
+    """
+    Matriz (veículos x cidades) com o menor tempo da base de cada veículo
+    até cada cidade; sem caminho, um valor muito alto. Veículos sem base
+    ficam a 0 de todas as cidades. Cada base distinta é consultada uma vez.
+    """
+    por_base = {}
+    distancias = np.zeros((len(veiculos), len(nomes_cidades)), dtype=np.int64)
+    for v, veiculo in enumerate(veiculos):
+        if veiculo.base is None:
+            continue
+        if veiculo.base not in por_base:
+            tempos = [grafo.tempo(veiculo.base, cidade) for cidade in nomes_cidades]
+            por_base[veiculo.base] = np.array([_DISTANCIA_SEM_CAMINHO if t is None else t for t in tempos],
+                                              dtype=np.int64)
+        distancias[v] = por_base[veiculo.base]
+    return distancias
+
+
+def _inicializar_worker(avaliador, data_atual, operadores):
+    global _contexto
+    _contexto = (avaliador, data_atual, operadores)
+
+
+def _otimizar_veiculo(tarefa, contexto=None):
+    """
+    Executa algumas gerações do algoritmo genético sobre a carteira de um
+    veículo. Carteira, solução e população usam posições nas entregas
+    válidas do dia. Retorna (melhor_solucao, populacao).
+    """
+    avaliador, data_atual, operadores = contexto or _contexto
+    carteira, capacidade, populacao_anterior, tamanho_populacao, geracoes, semente, prazo_final = tarefa
+    total = len(carteira)
+    if not total:
+        return [], []
+
+    rng = random.Random(semente)
+    parcial = AvaliadorVetorizado(avaliador.tempo[carteira], avaliador.lucro[carteira], avaliador.prazo[carteira],
+                                  avaliador.posto[carteira])
+    if populacao_anterior:
+        # Da rodada anterior: mantém só as entregas que continuam na carteira
+        individuos = []
+        for individuo in populacao_anterior:
+            individuo = np.asarray(individuo, dtype=np.intp)
+            posicoes = np.minimum(np.searchsorted(carteira, individuo), total - 1)
+            individuos.append(posicoes[carteira[posicoes] == individuo].tolist())
+        populacao = reparar_populacao(individuos, total, tamanho_populacao, capacidade, rng)
+    else:
+        populacao = populacao_inicial(total, tamanho_populacao, capacidade, rng)
+
+    # prazo_final é um instante de time.time(), comparável entre processos
+    limite_tempo = time.perf_counter() + (prazo_final - time.time()) if prazo_final is not None else None
+    populacao, melhor_solucao, _, _ = evoluir(
+        populacao, geracoes,
+        lambda p: parcial.avaliar_populacao(p, data_atual),
+        parcial.ranquear,
+        capacidade, total, rng,
+        limite_tempo=limite_tempo, operadores=operadores
+    )
+    return carteira[melhor_solucao].tolist(), [carteira[individuo].tolist() for individuo in populacao]
+
+
+def _atribuicao_inicial(origens, distancias):
+    """Cada entrega vai para o veículo com base mais próxima da sua origem; empates são distribuídos em rodízio."""
+    donos = np.zeros(len(origens), dtype=np.intp)
+    for cidade in np.unique(origens).tolist():
+        coluna = distancias[:, cidade]
+        mais_proximos = np.flatnonzero(coluna == coluna.min())
+        entregas = np.flatnonzero(origens == cidade)
+        donos[entregas] = mais_proximos[np.arange(len(entregas)) % len(mais_proximos)]
+    return donos
+
+
+def _carteiras(donos, total_veiculos):
+    """Posições das entregas de cada veículo, em ordem crescente."""
+    ordem = np.argsort(donos, kind='stable')
+    return np.split(ordem, np.cumsum(np.bincount(donos, minlength=total_veiculos))[:-1])
+
+
+def _rebalancear(donos, selecoes, lucro, origens, distancias, capacidades):
+    """
+    Move entregas que nenhum veículo escolheu para o veículo mais próximo
+    em que elas entrariam: um com vaga livre ou cuja pior entrega escolhida
+    tem lucro menor. As entregas são tratadas da mais lucrativa para a menos,
+    e cada veículo recebe no máximo `capacidade` novas entregas por rodada.
+    Retorna a quantidade de entregas movidas.
+    """
+    limiares = np.array([lucro[selecao].min() if len(selecao) >= capacidade else 0.0
+                         for selecao, capacidade in zip(selecoes, capacidades.tolist())])
+    escolhidas = np.zeros(len(donos), dtype=bool)
+    for selecao in selecoes:
+        escolhidas[selecao] = True
+    candidatas = np.flatnonzero(~escolhidas & (lucro > limiares.min()))
+    candidatas = candidatas[np.argsort(-lucro[candidatas], kind='stable')]
+
+    cotas = capacidades.copy()
+    movidas = 0
+    for entrega in candidatas.tolist():
+        elegiveis = (limiares < lucro[entrega]) & (cotas > 0)
+        elegiveis[donos[entrega]] = False
+        if not elegiveis.any():
+            if not cotas.any():
+                break
+            continue
+        destino = int(np.argmin(np.where(elegiveis, distancias[:, origens[entrega]], np.iinfo(np.int64).max)))
+        donos[entrega] = destino
+        cotas[destino] -= 1
+        movidas += 1
+    return movidas
+
+
+def executar_frota(avaliador, origens, distancias, data_atual, veiculos, tamanho_populacao=50,
+                   geracoes_por_rodada=GERACOES_POR_RODADA, rodadas=RODADAS, tempo_limite=None,
+                   workers=None, semente=0, operadores=OPERADORES_PADRAO):
+    """
+    Distribui as entregas válidas do dia entre os veículos e otimiza cada um.
+    - origens: código da cidade de origem de cada entrega (coluna de `distancias`)
+    - distancias: matriz de distancias_bases
+    Cada entrega começa na carteira do veículo de base mais próxima. A cada
+    rodada, o algoritmo genético de cada veículo (capacidade própria) roda
+    `geracoes_por_rodada` gerações sobre a sua carteira, em paralelo num
+    ProcessPoolExecutor e partindo da população da rodada anterior. Entre
+    as rodadas, as entregas não escolhidas são rebalanceadas (_rebalancear).
+    Com tempo_limite (segundos), nenhuma rodada começa depois do orçamento e
+    as gerações em andamento param nele; sem ele, o resultado depende só
+    da semente, não do número de workers.
+    Retorna (selecoes, info): as posições escolhidas por veículo e
+    info = {'rodadas', 'entregas_movidas', 'motivo_parada', 'tempo_execucao'}.
+    """
+    inicio = time.perf_counter()
+    limite = inicio + tempo_limite if tempo_limite is not None else None
+    total_veiculos = len(veiculos)
+    capacidades = np.array([veiculo.capacidade for veiculo in veiculos], dtype=np.int64)
+    donos = _atribuicao_inicial(np.asarray(origens), distancias)
+    populacoes = [None] * total_veiculos
+    selecoes = [[] for _ in range(total_veiculos)]
+    info = {'rodadas': 0, 'entregas_movidas': 0, 'motivo_parada': 'rodadas'}
+
+    contexto = (avaliador, data_atual, operadores)
+    if workers is None:
+        workers = min(total_veiculos, os.cpu_count() or 1)
+    executor = None
+    if workers > 1 and total_veiculos > 1:
+        # Importado só aqui, como em ga_ilhas
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker, initargs=contexto)
+
+    try:
+        for rodada in range(rodadas):
+            if limite is not None and time.perf_counter() >= limite:
+                info['motivo_parada'] = 'tempo_limite'
+                break
+            if rodada > 0:
+                info['entregas_movidas'] += _rebalancear(donos, selecoes, avaliador.lucro, origens, distancias, capacidades)
+            prazo_final = time.time() + (limite - time.perf_counter()) if limite is not None else None
+            tarefas = [(carteira, veiculo.capacidade, populacoes[v], tamanho_populacao, geracoes_por_rodada,
+                        f"{semente}:{veiculo.id}:{rodada}", prazo_final)
+                       for v, (veiculo, carteira) in enumerate(zip(veiculos, _carteiras(donos, total_veiculos)))]
+            if executor:
+                chunksize = max(1, total_veiculos // (workers * 4))
+                resultados = list(executor.map(_otimizar_veiculo, tarefas, chunksize=chunksize))
+            else:
+                resultados = [_otimizar_veiculo(tarefa, contexto) for tarefa in tarefas]
+            selecoes = [selecao for selecao, _ in resultados]
+            populacoes = [populacao for _, populacao in resultados]
+            info['rodadas'] += 1
+    finally:
+        if executor:
+            executor.shutdown()
+
+    info['tempo_execucao'] = time.perf_counter() - inicio
+    return selecoes, info
@@ -0,0 +1,100 @@
+import os
+import random
+
+from nucleo_genetico import evoluir, populacao_inicial
+from operadores_geneticos import OPERADORES_PADRAO
+
+# Dados somente leitura do processo worker (avaliador, data_atual, capacidade_diaria, operadores).
+# São enviados uma única vez por processo pelo initializer do pool, e não a cada tarefa.
+_contexto = None
+
+
+def _inicializar_worker(avaliador, data_atual, capacidade_diaria, operadores):
+    global _contexto
+    _contexto = (avaliador, data_atual, capacidade_diaria, operadores)
+
+
+def _evoluir_ilha(tarefa, contexto=None):
+    """Executa um bloco de gerações em uma ilha. Retorna o novo estado da ilha."""
+    avaliador, data_atual, capacidade_diaria, operadores = contexto or _contexto
+    populacao, rng, geracoes, melhor_solucao, melhor_avaliacao = tarefa
+    populacao, melhor_solucao, melhor_avaliacao, _ = evoluir(
+        populacao, geracoes,
+        lambda p: avaliador.avaliar_populacao(p, data_atual),
+        avaliador.ranquear,
+        capacidade_diaria, len(avaliador.tempo),
+        rng, melhor_solucao, melhor_avaliacao, operadores=operadores
+    )
+    return populacao, rng, melhor_solucao, melhor_avaliacao
+
+
+def _migrar(estados, migrantes, tamanho_elite):
+    """
+    Migração em anel: os melhores indivíduos de cada ilha substituem os
+    últimos indivíduos (filhos ainda não avaliados) da ilha seguinte.
+    """
+    novos_estados = []
+    for i, (populacao, rng, melhor_solucao, melhor_avaliacao) in enumerate(estados):
+        origem = estados[i - 1][0]
+        quantidade = min(migrantes, tamanho_elite, len(origem), len(populacao))
+        chegando = [list(individuo) for individuo in origem[:quantidade]]
+        populacao = populacao[:len(populacao) - quantidade] + chegando
+        novos_estados.append((populacao, rng, melhor_solucao, melhor_avaliacao))
+    return novos_estados
+
+
+def executar_ilhas(avaliador, data_atual, tamanho_populacao, geracoes, capacidade_diaria,
+                   ilhas=4, workers=None, intervalo_migracao=10, migrantes=2, semente=0,
+                   operadores=OPERADORES_PADRAO):
+    """
+    Algoritmo genético em modelo de ilhas.
+    Cada ilha evolui uma população independente com seu próprio gerador
+    (derivado de semente e do número da ilha); a cada `intervalo_migracao`
+    gerações os melhores indivíduos migram para a ilha vizinha.
+    O resultado depende só da semente, não do número de workers.
+    `operadores` define seleção, cruzamento, mutação e elite de todas as ilhas.
+    Retorna (melhor_solucao, melhor_avaliacao).
+    """
+    total_validas = len(avaliador.tempo)
+    estados = []
+    for ilha in range(ilhas):
+        rng = random.Random(f"{semente}:{ilha}")
+        populacao = populacao_inicial(total_validas, tamanho_populacao, capacidade_diaria, rng)
+        estados.append((populacao, rng, None, (float('inf'), 0)))
+
+    contexto = (avaliador, data_atual, capacidade_diaria, operadores)
+    if workers is None:
+        workers = min(ilhas, os.cpu_count() or 1)
+    executor = None
+    if workers > 1 and ilhas > 1:
+        # Importado só aqui: carregar o multiprocessing custa dezenas de ms na importação do módulo
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker, initargs=contexto)
+
+    try:
+        restantes = geracoes
+        while restantes > 0:
+            bloco = min(intervalo_migracao, restantes)
+            tarefas = [(populacao, rng, bloco, melhor_solucao, melhor_avaliacao)
+                       for populacao, rng, melhor_solucao, melhor_avaliacao in estados]
+            if executor:
+                estados = list(executor.map(_evoluir_ilha, tarefas))
+            else:
+                estados = [_evoluir_ilha(tarefa, contexto) for tarefa in tarefas]
+            restantes -= bloco
+            if restantes > 0 and ilhas > 1:
+                estados = _migrar(estados, migrantes, operadores.tamanho_elite)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    # Melhor global (menor tempo e maior lucro), percorrendo as ilhas em ordem
+    melhor_solucao = None
+    melhor_avaliacao = (float('inf'), 0)
+    for _, _, solucao, avaliacao in estados:
+        if solucao is None:
+            continue
+        if avaliacao[0] < melhor_avaliacao[0] or (avaliacao[0] == melhor_avaliacao[0] and avaliacao[1] > melhor_avaliacao[1]):
+            melhor_solucao = solucao
+            melhor_avaliacao = avaliacao
+    return melhor_solucao, melhor_avaliacao
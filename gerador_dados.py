@@ -0,0 +1,149 @@
+import argparse
+import csv
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from leitura_csv import CAMPOS_CONEXAO, CAMPOS_ENTREGA
+
+DATA_BASE_PADRAO = datetime(2023, 11, 15)  # Mesma data padrão do simulador
+TAMANHO_BLOCO = 100000
+DISTRIBUICOES_PRAZO = ('uniforme', 'exponencial')
+
+
+def nomes_cidades(quantidade):
+    """Nomes no estilo de colunas de planilha: A..Z, AA..AZ, BA..."""
+    nomes = []
+    for i in range(quantidade):
+        nome = ''
+        i += 1
+        while i:
+            i, resto = divmod(i - 1, 26)
+            nome = chr(ord('A') + resto) + nome
+        nomes.append(nome)
+    return nomes
+
+
+def _abrir_saida(arquivo, sobrescrever):
+    if not sobrescrever and os.path.exists(arquivo):
+        raise FileExistsError(f"{arquivo} já existe (use sobrescrever=True para substituí-lo)")
+    diretorio = os.path.dirname(arquivo)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    return open(arquivo, 'w', newline='')
+
+
+def gerar_conexoes(arquivo, cidades, grafo='completo', grau=4, tempo_minimo=30, tempo_maximo=180,
+                   semente=0, sobrescrever=False):
+    """
+    Grava o CSV de conexões. Retorna a quantidade de conexões geradas.
+    - grafo='completo': todas as conexões entre cidades diferentes
+    - grafo='esparso': cada cidade liga-se à seguinte (anel, garantindo que
+      todas se alcancem) e a até grau - 1 outras cidades sorteadas
+    Os tempos são sorteados entre tempo_minimo e tempo_maximo minutos.
+    """
+    if grafo not in ('completo', 'esparso'):
+        raise ValueError(f"tipo de grafo desconhecido: {grafo}")
+    rng = np.random.default_rng([semente, 1])
+    nomes = nomes_cidades(cidades) if isinstance(cidades, int) else list(cidades)
+    total = len(nomes)
+    quantidade = 0
+
+    with _abrir_saida(arquivo, sobrescrever) as file:
+        writer = csv.writer(file)
+        writer.writerow(CAMPOS_CONEXAO)
+        for origem in range(total):
+            if grafo == 'completo':
+                destinos = [destino for destino in range(total) if destino != origem]
+            else:
+                destinos = [(origem + 1) % total] if total > 1 else []
+                extras = min(grau - 1, total - 2)
+                if extras > 0:
+                    # Deslocamentos distintos em 2..total-1 evitam a própria cidade e a seguinte
+                    deslocamentos = rng.choice(total - 2, size=extras, replace=False) + 2
+                    destinos.extend(((origem + deslocamentos) % total).tolist())
+            tempos = rng.integers(tempo_minimo, tempo_maximo, size=len(destinos), endpoint=True).tolist()
+            writer.writerows((nomes[origem], nomes[destino], tempo) for destino, tempo in zip(destinos, tempos))
+            quantidade += len(destinos)
+    return quantidade
+
+
+def gerar_entregas(arquivo, cidades, quantidade, data_base=DATA_BASE_PADRAO, horizonte_dias=14,
+                   distribuicao_prazo='uniforme', valor=(50, 300), bonus=(10, 100), semente=0,
+                   tamanho_bloco=TAMANHO_BLOCO, sobrescrever=False):
+    """
+    Grava o CSV de entregas em blocos, sem montar o arquivo inteiro em memória.
+    Os prazos são data_base + d dias, com d em 0..horizonte_dias:
+    - 'uniforme': d uniforme
+    - 'exponencial': prazos concentrados nos primeiros dias (média horizonte_dias / 3)
+    Valor e bônus são uniformes nos intervalos informados, com 2 casas decimais.
+    Retorna a quantidade de entregas gravadas.
+    """
+    if distribuicao_prazo not in DISTRIBUICOES_PRAZO:
+        raise ValueError(f"distribuição de prazo desconhecida: {distribuicao_prazo}")
+    rng = np.random.default_rng([semente, 2])
+    nomes = nomes_cidades(cidades) if isinstance(cidades, int) else list(cidades)
+    total_cidades = len(nomes)
+    if total_cidades < 2:
+        raise ValueError("são necessárias pelo menos 2 cidades")
+    datas = [(data_base + timedelta(days=d)).strftime('%Y-%m-%d') for d in range(horizonte_dias + 1)]
+    largura_id = max(3, len(str(quantidade)))
+
+    with _abrir_saida(arquivo, sobrescrever) as file:
+        writer = csv.writer(file)
+        writer.writerow(CAMPOS_ENTREGA)
+        for inicio in range(0, quantidade, tamanho_bloco):
+            tamanho = min(tamanho_bloco, quantidade - inicio)
+            origens = rng.integers(0, total_cidades, size=tamanho)
+            # Deslocamento em 1..total-1 garante destino diferente da origem
+            destinos = (origens + rng.integers(1, total_cidades, size=tamanho)) % total_cidades
+            if distribuicao_prazo == 'uniforme':
+                dias = rng.integers(0, horizonte_dias, size=tamanho, endpoint=True)
+            else:
+                dias = np.minimum(rng.exponential(horizonte_dias / 3, size=tamanho).astype(np.int64), horizonte_dias)
+            valores = rng.uniform(valor[0], valor[1], size=tamanho)
+            bonus_sorteados = rng.uniform(bonus[0], bonus[1], size=tamanho)
+
+            writer.writerows(
+                (f"E{inicio + i + 1:0{largura_id}d}", nomes[o], nomes[d], datas[p], f"{v:.2f}", f"{b:.2f}")
+                for i, (o, d, p, v, b) in enumerate(zip(origens.tolist(), destinos.tolist(), dias.tolist(),
+                                                        valores.tolist(), bonus_sorteados.tolist()))
+            )
+    return quantidade
+
+
+def gerar_dados(diretorio, cidades=10, entregas=100, grafo='completo', grau=4, data_base=DATA_BASE_PADRAO,
+                horizonte_dias=14, distribuicao_prazo='uniforme', semente=0, sobrescrever=False):
+    """
+    Gera conexoes.csv e entregas.csv em `diretorio`. Para a mesma semente e os
+    mesmos parâmetros os arquivos são idênticos. Arquivos existentes só são
+    substituídos com sobrescrever=True. Retorna (arquivo_conexoes, arquivo_entregas).
+    """
+    nomes = nomes_cidades(cidades)
+    arquivo_conexoes = os.path.join(diretorio, 'conexoes.csv')
+    arquivo_entregas = os.path.join(diretorio, 'entregas.csv')
+    gerar_conexoes(arquivo_conexoes, nomes, grafo, grau, semente=semente, sobrescrever=sobrescrever)
+    gerar_entregas(arquivo_entregas, nomes, entregas, data_base, horizonte_dias, distribuicao_prazo,
+                   semente=semente, sobrescrever=sobrescrever)
+    return arquivo_conexoes, arquivo_entregas
+
+
+# Exemplo de uso: python gerador_dados.py dados_grandes --cidades 1000 --entregas 10000000 --grafo esparso
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera conexões e entregas sintéticas para benchmarks.")
+    parser.add_argument('diretorio')
+    parser.add_argument('--cidades', type=int, default=10)
+    parser.add_argument('--entregas', type=int, default=100)
+    parser.add_argument('--grafo', choices=('completo', 'esparso'), default='completo')
+    parser.add_argument('--grau', type=int, default=4)
+    parser.add_argument('--data-base', type=lambda texto: datetime.strptime(texto, '%Y-%m-%d'), default=DATA_BASE_PADRAO)
+    parser.add_argument('--horizonte-dias', type=int, default=14)
+    parser.add_argument('--distribuicao-prazo', choices=DISTRIBUICOES_PRAZO, default='uniforme')
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--sobrescrever', action='store_true')
+    args = parser.parse_args()
+
+    arquivos = gerar_dados(args.diretorio, args.cidades, args.entregas, args.grafo, args.grau, args.data_base,
+                           args.horizonte_dias, args.distribuicao_prazo, args.semente, args.sobrescrever)
+    print(f"Dados gerados: {arquivos[0]} e {arquivos[1]}")
@@ -0,0 +1,159 @@
+import heapq
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Até esse número de cidades a matriz completa de menores tempos é pré-calculada
+# (Floyd-Warshall vetorizado); acima disso, Dijkstra sob demanda com cache por origem.
+LIMITE_MATRIZ = 500
+MAX_ORIGENS_EM_CACHE = 256
+MAX_PARES_EM_CACHE = 100000
+_INFINITO = np.iinfo(np.int64).max // 4
+_SEM_CACHE = object()  # Marca de par ainda não consultado (None é um tempo válido: sem caminho)
+
+
+class GrafoConexoes:
+    """
+    Índice das conexões (rotas) entre cidades, tratadas como um grafo
+    direcionado ponderado pelo tempo.
+    Mapeia cada par (origem, destino) ao tempo da conexão para consultas O(1)
+    e calcula o menor tempo de viagem entre quaisquer duas cidades.
+    Os caches são protegidos por uma trava: as consultas podem vir de várias
+    threads ao mesmo tempo (ex.: lances do leilão online durante o GA).
+    """
+    def __init__(self, limite_matriz=LIMITE_MATRIZ):
+        self.tempos = {}
+        self.adjacencias = {}
+        self.limite_matriz = limite_matriz
+        self._indice_cidades = None
+        self._matriz = None
+        self._caminhos = OrderedDict()  # origem -> (distancias, anteriores)
+        self._menores_tempos = OrderedDict()  # (origem, destino) -> tempo, LRU
+        self._trava = threading.Lock()
+
+    def __getstate__(self):
+        # A trava não é serializável (o grafo vai para os workers dos pools); cada cópia cria a sua
+        estado = self.__dict__.copy()
+        del estado['_trava']
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._trava = threading.Lock()
+
+    def adicionar(self, origem, destino, tempo):
+        """Registra uma conexão. Se o par já existir, mantém o primeiro tempo lido."""
+        if (origem, destino) in self.tempos:
+            return
+        self.tempos[(origem, destino)] = tempo
+        self.adjacencias.setdefault(origem, {})[destino] = tempo
+        self.adjacencias.setdefault(destino, {})
+        self._invalidar()
+
+    def tempo_direto(self, origem, destino):
+        """Retorna o tempo da conexão direta entre dois pontos ou None se não existir."""
+        return self.tempos.get((origem, destino))
+
+    def tempo(self, origem, destino):
+        """
+        Retorna o menor tempo de viagem entre dois pontos, possivelmente
+        passando por cidades intermediárias, ou None se não houver caminho.
+        Os pares consultados ficam num cache LRU de até MAX_PARES_EM_CACHE
+        entradas, limpo quando o grafo muda.
+        """
+        chave = (origem, destino)
+        with self._trava:
+            tempo = self._menores_tempos.get(chave, _SEM_CACHE)
+            if tempo is not _SEM_CACHE:
+                self._menores_tempos.move_to_end(chave)
+                return tempo
+
+        if origem not in self.adjacencias or destino not in self.adjacencias:
+            tempo = None
+        elif len(self.adjacencias) <= self.limite_matriz:
+            indice, matriz = self.matriz_distancias()
+            valor = matriz[indice[origem], indice[destino]]
+            tempo = int(valor) if valor < _INFINITO else None
+        else:
+            distancias, _ = self._dijkstra(origem)
+            tempo = distancias.get(destino)
+
+        with self._trava:
+            self._menores_tempos[chave] = tempo
+            if len(self._menores_tempos) > MAX_PARES_EM_CACHE:
+                self._menores_tempos.popitem(last=False)
+        return tempo
+
+    def caminho(self, origem, destino):
+        """Retorna a lista de cidades do caminho mais rápido ou None se não houver caminho."""
+        if origem not in self.adjacencias or destino not in self.adjacencias:
+            return None
+        distancias, anteriores = self._dijkstra(origem)
+        if destino not in distancias:
+            return None
+        caminho = [destino]
+        while caminho[-1] != origem:
+            caminho.append(anteriores[caminho[-1]])
+        caminho.reverse()
+        return caminho
+
+    def matriz_distancias(self):
+        """
+        Retorna (indice_cidades, matriz) com os menores tempos entre todas as
+        cidades, calculada uma vez por Floyd-Warshall. Pares sem caminho
+        ficam com um valor >= _INFINITO.
+        """
+        with self._trava:
+            if self._matriz is None:
+                cidades = sorted(self.adjacencias)
+                indice = {cidade: i for i, cidade in enumerate(cidades)}
+                matriz = np.full((len(cidades), len(cidades)), _INFINITO, dtype=np.int64)
+                np.fill_diagonal(matriz, 0)
+                for (origem, destino), tempo in self.tempos.items():
+                    i, j = indice[origem], indice[destino]
+                    matriz[i, j] = min(matriz[i, j], tempo)
+                for k in range(len(cidades)):
+                    np.minimum(matriz, matriz[:, k, None] + matriz[None, k, :], out=matriz)
+                self._indice_cidades = indice
+                self._matriz = matriz
+            return self._indice_cidades, self._matriz
+
+    def _dijkstra(self, origem):
+        """Menores tempos a partir de uma origem, com cache LRU por origem."""
+        with self._trava:
+            if origem in self._caminhos:
+                self._caminhos.move_to_end(origem)
+                return self._caminhos[origem]
+
+        distancias = {origem: 0}
+        anteriores = {}
+        fila = [(0, origem)]
+        visitadas = set()
+        while fila:
+            distancia, cidade = heapq.heappop(fila)
+            if cidade in visitadas:
+                continue
+            visitadas.add(cidade)
+            for vizinha, tempo in self.adjacencias[cidade].items():
+                nova_distancia = distancia + tempo
+                if nova_distancia < distancias.get(vizinha, _INFINITO):
+                    distancias[vizinha] = nova_distancia
+                    anteriores[vizinha] = cidade
+                    heapq.heappush(fila, (nova_distancia, vizinha))
+
+        with self._trava:
+            self._caminhos[origem] = (distancias, anteriores)
+            if len(self._caminhos) > MAX_ORIGENS_EM_CACHE:
+                self._caminhos.popitem(last=False)
+        return distancias, anteriores
+
+    def _invalidar(self):
+        with self._trava:
+            self._indice_cidades = None
+            self._matriz = None
+            self._caminhos.clear()
+            self._menores_tempos.clear()
+
+    def __len__(self):
+        return len(self.tempos)
@@ -0,0 +1,144 @@
+import contextlib
+import cProfile
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+
+
+class EstatisticasExecucao:
+    """
+    Tempos (time.perf_counter_ns) e contadores por etapa de uma execução:
+    leitura, filtro, avaliação de fitness, cruzamento/mutação, consultas de
+    tempo, formatação da saída etc. Opcionalmente guarda o perfil do
+    cProfile e o pico de memória do tracemalloc. Os tempos das etapas são
+    inclusivos e podem se sobrepor (ex.: consulta_tempo acontece dentro de
+    avaliacao_fitness). Pode ser atualizado de várias threads.
+    """
+    ativa = True
+
+    def __init__(self):
+        self.tempos_ns = defaultdict(int)
+        self.chamadas = defaultdict(int)
+        self.contadores = defaultdict(int)
+        self.perfil = None          # pstats.Stats, com instrumentar(..., perfil=True)
+        self.memoria_pico = None    # bytes, com instrumentar(..., memoria=True)
+        self._trava = threading.Lock()
+
+    def __getstate__(self):
+        estado = self.__dict__.copy()
+        del estado['_trava']
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._trava = threading.Lock()
+
+    @contextlib.contextmanager
+    def medir(self, etapa):
+        """Soma o tempo do bloco `with` à etapa e conta mais uma chamada."""
+        inicio = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            decorrido = time.perf_counter_ns() - inicio
+            with self._trava:
+                self.tempos_ns[etapa] += decorrido
+                self.chamadas[etapa] += 1
+
+    def contar(self, contador, quantidade=1):
+        with self._trava:
+            self.contadores[contador] += quantidade
+
+    def como_dicionario(self):
+        """Retorna as estatísticas em um dicionário serializável (ex.: para JSON)."""
+        return {
+            'etapas': {
+                etapa: {
+                    'chamadas': self.chamadas[etapa],
+                    'tempo_total_ms': tempo / 1e6,
+                    'tempo_medio_us': tempo / self.chamadas[etapa] / 1e3 if self.chamadas[etapa] else 0.0
+                }
+                for etapa, tempo in sorted(self.tempos_ns.items(), key=lambda item: -item[1])
+            },
+            'contadores': dict(self.contadores),
+            'memoria_pico': self.memoria_pico
+        }
+
+    def resumo(self):
+        """Tabela de texto com as etapas, da mais cara para a mais barata, e os contadores."""
+        linhas = [f"{'Etapa':<24}{'Chamadas':>10}{'Total (ms)':>14}{'Média (us)':>14}"]
+        for etapa, dados in self.como_dicionario()['etapas'].items():
+            linhas.append(f"{etapa:<24}{dados['chamadas']:>10}{dados['tempo_total_ms']:>14.3f}{dados['tempo_medio_us']:>14.2f}")
+        for contador, valor in sorted(self.contadores.items()):
+            linhas.append(f"{contador:<24}{valor:>10}")
+        if self.memoria_pico is not None:
+            linhas.append(f"Pico de memória: {self.memoria_pico / 1024:.1f} KiB")
+        return "\n".join(linhas)
+
+    def relatorio_perfil(self, limite=20, ordenar_por='cumulative'):
+        """Texto com as `limite` funções mais caras do perfil do cProfile (se capturado)."""
+        if self.perfil is None:
+            return ""
+        saida = io.StringIO()
+        self.perfil.stream = saida
+        self.perfil.sort_stats(ordenar_por).print_stats(limite)
+        return saida.getvalue()
+
+
+class EstatisticasDesativadas:
+    """Mesma interface de EstatisticasExecucao, sem registrar nada (padrão dos sistemas)."""
+    ativa = False
+    _contexto_nulo = contextlib.nullcontext()
+
+    def medir(self, etapa):
+        return self._contexto_nulo
+
+    def contar(self, contador, quantidade=1):
+        pass
+
+
+ESTATISTICAS_DESATIVADAS = EstatisticasDesativadas()
+
+
+@contextlib.contextmanager
+def instrumentar(*sistemas, perfil=False, memoria=False):
+    """
+    Ativa a instrumentação nos sistemas informados durante o bloco `with` e
+    entrega o EstatisticasExecucao da execução:
+
+        with instrumentar(sistema, perfil=True) as estatisticas:
+            sistema.algoritmo_genetico(data_atual)
+        print(estatisticas.resumo())
+
+    - perfil: captura o bloco com cProfile (estatisticas.perfil / relatorio_perfil())
+    - memoria: mede o pico de memória com tracemalloc (estatisticas.memoria_pico)
+    Trabalho feito em processos worker (pools) não é medido.
+    """
+    estatisticas = EstatisticasExecucao()
+    anteriores = [sistema.estatisticas for sistema in sistemas]
+    for sistema in sistemas:
+        sistema.estatisticas = estatisticas
+
+    perfilador = cProfile.Profile() if perfil else None
+    iniciou_tracemalloc = memoria and not tracemalloc.is_tracing()
+    if memoria:
+        if iniciou_tracemalloc:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+    if perfilador is not None:
+        perfilador.enable()
+    try:
+        yield estatisticas
+    finally:
+        if perfilador is not None:
+            perfilador.disable()
+            estatisticas.perfil = pstats.Stats(perfilador)
+        if memoria:
+            estatisticas.memoria_pico = tracemalloc.get_traced_memory()[1]
+            if iniciou_tracemalloc:
+                tracemalloc.stop()
+        for sistema, anterior in zip(sistemas, anteriores):
+            sistema.estatisticas = anterior
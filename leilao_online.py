@@ -0,0 +1,308 @@
+import asyncio
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from leitura_csv import RelatorioLeitura, converter_data_iso, converter_entrega, posicoes_entrega
+from resultado_programacao import ResultadoProgramacao
+
+GERACOES_POR_RODADA = 5
+INTERVALO_OCIOSO = 0.05  # Segundos entre verificações quando não há o que otimizar
+CODIFICACAO = 'utf-8'  # Dos CSVs acompanhados por acompanhar_arquivo
+
+
+class PlanoPublicado:
+    """Cópia imutável do melhor plano conhecido, lida pelas consultas sem bloquear a otimização."""
+    def __init__(self, versao, data_atual, resultado, rodadas, atualizado_em):
+        self.versao = versao
+        self.data_atual = data_atual
+        self.resultado = resultado
+        self.rodadas = rodadas
+        self.atualizado_em = atualizado_em
+
+    def como_dicionario(self):
+        dados = self.resultado.como_dicionario()
+        dados.update({'versao': self.versao, 'data_atual': self.data_atual.strftime('%Y-%m-%d'),
+                      'rodadas': self.rodadas, 'atualizado_em': self.atualizado_em})
+        return dados
+
+
+class MotorLeilao:
+    """
+    Motor de leilão online em asyncio em torno de um SistemaEntregaIA.
+
+    - Novas entregas chegam por receber(), por uma asyncio.Queue
+      (consumir_fila) ou acompanhando um CSV que cresce (acompanhar_arquivo).
+      Elas são acumuladas e incluídas no repositório no início da rodada
+      seguinte, na thread da otimização, com atualização incremental dos
+      índices por id e por prazo.
+    - executar() otimiza continuamente: cada rodada roda poucas gerações do
+      algoritmo genético partindo da população da rodada anterior
+      (continuar=True), em uma thread separada, e publica o melhor plano.
+    - O índice por id do repositório é construído na criação do motor, e
+      não na primeira entrega recebida pelo laço de eventos.
+    - plano_atual() e consultar_lance() só leem o último plano publicado,
+      então respondem em tempo constante no tamanho da base, sem esperar
+      a rodada em andamento.
+    """
+    def __init__(self, sistema, data_atual, capacidade_diaria=5, tamanho_populacao=50,
+                 geracoes_por_rodada=GERACOES_POR_RODADA, vetorizado=True, semente=0):
+        self.sistema = sistema
+        self.data_atual = data_atual
+        self.capacidade_diaria = capacidade_diaria
+        self.tamanho_populacao = tamanho_populacao
+        self.geracoes_por_rodada = geracoes_por_rodada
+        self.vetorizado = vetorizado
+        self.semente = semente
+        self.relatorio = RelatorioLeitura()  # Entregas recebidas inválidas ou repetidas
+        self._pendentes = []
+        self._ids_pendentes = set()
+        self._rodadas = 0
+        self._plano = PlanoPublicado(0, data_atual, ResultadoProgramacao([]), 0, None)
+        self._parar = None
+        # Uma única thread: as rodadas nunca se sobrepõem
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # O índice por id é construído aqui, e não na primeira chamada a receber(),
+        # que rodaria a construção O(N) dentro do laço de eventos
+        sistema.repositorio.indexar_ids()
+
+    # Chegada de entregas
+
+    def receber(self, entrega):
+        """
+        Registra uma nova entrega (dicionário com id, origem, destino, prazo,
+        valor e bônus; prazo como datetime ou 'AAAA-MM-DD'). Ela entra no
+        plano a partir da próxima rodada. Retorna False se for inválida ou repetida.
+        """
+        self.relatorio.linhas_lidas += 1
+        try:
+            entrega = {
+                'id': str(entrega['id']),
+                'origem': entrega['origem'],
+                'destino': entrega['destino'],
+                'prazo': entrega['prazo'] if isinstance(entrega['prazo'], datetime) else converter_data_iso(entrega['prazo']),
+                'valor': float(entrega['valor']),
+                'bonus': float(entrega['bonus'])
+            }
+        except KeyError as e:
+            self.relatorio.registrar_erro(self.relatorio.linhas_lidas, f"campo ausente: {e}")
+            return False
+        except (TypeError, ValueError) as e:
+            self.relatorio.registrar_erro(self.relatorio.linhas_lidas, str(e))
+            return False
+        if entrega['id'] in self._ids_pendentes or self.sistema.repositorio.obter(entrega['id']) is not None:
+            self.relatorio.registrar_erro(self.relatorio.linhas_lidas, f"id repetido: {entrega['id']}")
+            return False
+        self.relatorio.linhas_aceitas += 1
+        self._pendentes.append(entrega)
+        self._ids_pendentes.add(entrega['id'])
+        return True
+
+    async def consumir_fila(self, fila):
+        """Recebe entregas de uma asyncio.Queue até receber None."""
+        while True:
+            entrega = await fila.get()
+            if entrega is None:
+                return
+            self.receber(entrega)
+
+    async def acompanhar_arquivo(self, arquivo, intervalo=0.5, do_inicio=False):
+        """
+        Acompanha um CSV de entregas que recebe novas linhas no fim (como tail -f).
+        Só linhas completas (em UTF-8) são lidas; com do_inicio=False as linhas já
+        existentes são ignoradas. Se o arquivo for truncado, volta ao início.
+        Enquanto o arquivo não existir ou o cabeçalho não estiver completo
+        (arquivo recém-criado), tenta de novo a cada `intervalo`.
+        """
+        posicao = None
+        posicoes = None
+        datas = {}
+        resto = b''
+        while not self._parando():
+            try:
+                tamanho = os.path.getsize(arquivo)
+            except OSError:
+                await asyncio.sleep(intervalo)
+                continue
+            if posicao is not None and tamanho < posicao:
+                posicao, posicoes, resto = None, None, b''
+            # Leitura em bytes: uma escrita pode terminar no meio de um caractere
+            # multibyte, então só as linhas completas são decodificadas
+            with open(arquivo, 'rb') as file:
+                cabecalho_completo = True
+                if posicao is None:
+                    cabecalho = file.readline()
+                    cabecalho_completo = cabecalho.endswith(b'\n')
+                    if cabecalho_completo:
+                        posicoes = posicoes_entrega(next(csv.reader([cabecalho.decode(CODIFICACAO)]), []), arquivo)
+                        if not do_inicio:
+                            file.seek(0, os.SEEK_END)
+                else:
+                    file.seek(posicao)
+                if cabecalho_completo:
+                    dados = resto + file.read()
+                    posicao = file.tell()
+            if not cabecalho_completo:
+                await asyncio.sleep(intervalo)
+                continue
+
+            linhas = dados.split(b'\n')
+            resto = linhas.pop()  # Última linha ainda incompleta (ou vazia)
+            textos = []
+            for linha in linhas:
+                try:
+                    textos.append(linha.decode(CODIFICACAO))
+                except UnicodeDecodeError as e:
+                    self.relatorio.linhas_lidas += 1
+                    self.relatorio.registrar_erro(self.relatorio.linhas_lidas, str(e))
+            for row in csv.reader(textos):
+                if not row:
+                    continue
+                try:
+                    entrega = converter_entrega(row, posicoes, datas)
+                except IndexError:
+                    self.relatorio.linhas_lidas += 1
+                    self.relatorio.registrar_erro(self.relatorio.linhas_lidas, "colunas faltando")
+                    continue
+                except ValueError as e:
+                    self.relatorio.linhas_lidas += 1
+                    self.relatorio.registrar_erro(self.relatorio.linhas_lidas, str(e))
+                    continue
+                self.receber(entrega)
+            await asyncio.sleep(intervalo)
+
+    # Otimização contínua
+
+    def avancar_dia(self, data_atual):
+        """Muda o dia do plano; a próxima rodada descarta as entregas vencidas da população."""
+        self.data_atual = data_atual
+
+    async def executar(self, rodadas=None):
+        """
+        Laço de otimização: cada rodada inclui as entregas pendentes no
+        repositório e roda poucas gerações do algoritmo genético, tudo fora
+        do laço de eventos, e publica o plano.
+        Para após `rodadas` rodadas ou quando parar() for chamado.
+        """
+        self._parar = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        executadas = 0
+        while not self._parar.is_set() and (rodadas is None or executadas < rodadas):
+            pendentes, self._pendentes = self._pendentes, []
+            data_atual = self.data_atual
+            resultado = await loop.run_in_executor(self._executor, self._rodada, data_atual, self._rodadas, pendentes)
+            # Só agora os ids estão no repositório; até aqui receber() os achava em _ids_pendentes
+            self._ids_pendentes.difference_update(entrega['id'] for entrega in pendentes)
+            if resultado is None:
+                await asyncio.sleep(INTERVALO_OCIOSO)
+                continue
+            self._rodadas += 1
+            executadas += 1
+            self._plano = PlanoPublicado(self._plano.versao + 1, data_atual, resultado, self._rodadas,
+                                         datetime.now().isoformat(timespec='milliseconds'))
+            await asyncio.sleep(0)
+
+    def _rodada(self, data_atual, rodada, pendentes):
+        """
+        Roda na thread do executor: inclui as entregas pendentes no repositório
+        (atualizando os índices) e, se houver entregas válidas, roda as gerações
+        da rodada. Retorna o ResultadoProgramacao, ou None se não havia o que otimizar.
+        """
+        repositorio = self.sistema.repositorio
+        if pendentes:
+            repositorio.adicionar_varias(pendentes)
+        if not len(repositorio.indices_validos(data_atual)):
+            return None
+        entregas = self.sistema.algoritmo_genetico(
+            data_atual, self.tamanho_populacao, self.geracoes_por_rodada, self.capacidade_diaria,
+            vetorizado=self.vetorizado, semente=f"{self.semente}:{rodada}", continuar=True
+        )
+        return self.sistema.calcular_programacao(entregas)
+
+    def parar(self):
+        if self._parar is not None:
+            self._parar.set()
+
+    def _parando(self):
+        return self._parar is not None and self._parar.is_set()
+
+    def fechar(self):
+        self.parar()
+        self._executor.shutdown(wait=True)
+
+    # Consultas (apenas leitura do último plano publicado)
+
+    def plano_atual(self):
+        """Retorna o último PlanoPublicado (versão, data, entregas, lucro e tempo totais)."""
+        return self._plano
+
+    def consultar_lance(self, entrega):
+        """
+        Diz se vale a pena dar lance na entrega, comparando-a com o plano atual:
+        sim se ela está no prazo, tem caminho e há capacidade livre no plano ou
+        o seu lucro supera o da entrega de menor lucro do plano (que ela substituiria).
+        Retorna um dicionário com 'lance', 'motivo', 'lucro', 'tempo',
+        'substituiria' e 'versao_plano'.
+        """
+        plano = self._plano
+        prazo = entrega['prazo'] if isinstance(entrega['prazo'], datetime) else converter_data_iso(entrega['prazo'])
+        lucro = float(entrega['valor']) + float(entrega['bonus'])
+        resposta = {'lance': False, 'motivo': '', 'lucro': lucro, 'tempo': None, 'substituiria': None,
+                    'versao_plano': plano.versao}
+
+        if prazo < self.data_atual:
+            resposta['motivo'] = 'fora_do_prazo'
+            return resposta
+        resposta['tempo'] = self.sistema.calcular_tempo_entrega(entrega['origem'], entrega['destino'])
+        if not resposta['tempo']:
+            resposta['motivo'] = 'sem_caminho'
+            return resposta
+
+        linhas = plano.resultado.linhas
+        if len(linhas) < self.capacidade_diaria:
+            resposta['lance'] = True
+            resposta['motivo'] = 'capacidade_livre'
+            return resposta
+        pior = min(linhas, key=lambda linha: linha['lucro'])
+        if lucro > pior['lucro']:
+            resposta['lance'] = True
+            resposta['motivo'] = 'supera_plano'
+            resposta['substituiria'] = pior['id']
+        else:
+            resposta['motivo'] = 'lucro_insuficiente'
+        return resposta
+
+
+# Exemplo de uso: entregas chegando por uma fila enquanto o plano é otimizado
+if __name__ == "__main__":
+    from datetime import timedelta
+    from SistemaEntregaIA import SistemaEntregaIA
+
+    async def demonstracao():
+        sistema = SistemaEntregaIA()
+        sistema.ler_conexoes("conexoes.csv", usar_snapshot=True)
+        sistema.ler_entregas("entregas.csv", usar_snapshot=True)
+
+        data_atual = datetime.strptime('2023-11-15', '%Y-%m-%d')
+        motor = MotorLeilao(sistema, data_atual)
+        fila = asyncio.Queue()
+        tarefas = [asyncio.create_task(motor.executar()), asyncio.create_task(motor.consumir_fila(fila))]
+
+        for i in range(1, 6):
+            nova = {'id': f"N{i:03d}", 'origem': 'A', 'destino': 'B',
+                    'prazo': data_atual + timedelta(days=i), 'valor': 200.0 + 50 * i, 'bonus': 40.0}
+            print(f"Lance em {nova['id']}? {motor.consultar_lance(nova)}")
+            await fila.put(nova)
+            await asyncio.sleep(0.2)
+
+        plano = motor.plano_atual()
+        print(f"Plano v{plano.versao}: R$ {plano.resultado.lucro_total:.2f}, {plano.resultado.tempo_total} min")
+        print(plano.resultado.rotas(motor.capacidade_diaria))
+
+        await fila.put(None)
+        motor.parar()
+        await asyncio.gather(*tarefas)
+        motor.fechar()
+
+    asyncio.run(demonstracao())
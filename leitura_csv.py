@@ -0,0 +1,162 @@
+import csv
+from datetime import datetime
+
+CAMPOS_CONEXAO = ('origem', 'destino', 'tempo')
+CAMPOS_ENTREGA = ('id', 'origem', 'destino', 'prazo', 'valor', 'bonus')
+TAMANHO_BLOCO = 10000
+TAMANHO_BUFFER = 1 << 20
+MAX_ERROS_GUARDADOS = 100
+
+
+class RelatorioLeitura:
+    """Contadores de uma leitura de CSV e as linhas inválidas encontradas."""
+    def __init__(self):
+        self.linhas_lidas = 0
+        self.linhas_aceitas = 0
+        self.linhas_fora_do_prazo = 0
+        self.total_erros = 0
+        self.erros = []  # (número da linha, mensagem), no máximo MAX_ERROS_GUARDADOS
+
+    def registrar_erro(self, numero_linha, mensagem):
+        self.total_erros += 1
+        if len(self.erros) < MAX_ERROS_GUARDADOS:
+            self.erros.append((numero_linha, mensagem))
+
+    def resumo(self):
+        linhas = [f"Linhas inválidas ignoradas: {self.total_erros}"]
+        for numero_linha, mensagem in self.erros[:10]:
+            linhas.append(f"  linha {numero_linha}: {mensagem}")
+        if self.total_erros > 10:
+            linhas.append(f"  ... e mais {self.total_erros - 10}")
+        return "\n".join(linhas)
+
+
+def converter_data_iso(texto):
+    """Converte 'AAAA-MM-DD' em datetime sem passar por strptime."""
+    if len(texto) != 10 or texto[4] != '-' or texto[7] != '-':
+        raise ValueError(f"data inválida: {texto!r}")
+    return datetime(int(texto[:4]), int(texto[5:7]), int(texto[8:]))
+
+
+def _posicoes(cabecalho, campos, arquivo):
+    """Mapeia cada campo obrigatório para a sua coluna no cabeçalho."""
+    faltando = [campo for campo in campos if campo not in cabecalho]
+    if faltando:
+        raise ValueError(f"{arquivo}: colunas ausentes no cabeçalho: {', '.join(faltando)}")
+    return [cabecalho.index(campo) for campo in campos]
+
+
+def iterar_conexoes(arquivo, relatorio=None):
+    """Gera as conexões do arquivo uma a uma, registrando linhas inválidas no relatório."""
+    relatorio = relatorio if relatorio is not None else RelatorioLeitura()
+    with open(arquivo, 'r', newline='', buffering=TAMANHO_BUFFER) as file:
+        reader = csv.reader(file)
+        cabecalho = next(reader, None)
+        if cabecalho is None:
+            return
+        i_origem, i_destino, i_tempo = _posicoes(cabecalho, CAMPOS_CONEXAO, arquivo)
+        for row in reader:
+            if not row:
+                continue
+            relatorio.linhas_lidas += 1
+            try:
+                conexao = {
+                    'origem': row[i_origem],
+                    'destino': row[i_destino],
+                    'tempo': int(row[i_tempo])
+                }
+            except IndexError:
+                relatorio.registrar_erro(reader.line_num, "colunas faltando")
+                continue
+            except ValueError as e:
+                relatorio.registrar_erro(reader.line_num, str(e))
+                continue
+            relatorio.linhas_aceitas += 1
+            yield conexao
+
+
+def ler_entregas_em_blocos(arquivo, prazo_minimo=None, tamanho_bloco=TAMANHO_BLOCO, relatorio=None):
+    """
+    Lê o CSV de entregas em fluxo, gerando listas de até tamanho_bloco entregas.
+    - prazo_minimo: entregas com prazo anterior são descartadas sem converter
+      os demais campos (datas ISO comparadas como texto)
+    - relatorio: RelatorioLeitura onde são registradas as linhas inválidas,
+      que são ignoradas sem interromper a leitura
+    """
+    relatorio = relatorio if relatorio is not None else RelatorioLeitura()
+    minimo = prazo_minimo.strftime('%Y-%m-%d') if prazo_minimo is not None else None
+    datas = {}  # Poucas datas distintas: cada uma é convertida uma única vez
+
+    with open(arquivo, 'r', newline='', buffering=TAMANHO_BUFFER) as file:
+        reader = csv.reader(file)
+        cabecalho = next(reader, None)
+        if cabecalho is None:
+            return
+        posicoes = posicoes_entrega(cabecalho, arquivo)
+        i_prazo = posicoes[CAMPOS_ENTREGA.index('prazo')]
+
+        bloco = []
+        for row in reader:
+            if not row:
+                continue
+            relatorio.linhas_lidas += 1
+            try:
+                if minimo is not None:
+                    texto_prazo = row[i_prazo]
+                    _converter_prazo(texto_prazo, datas)  # Prazo inválido é erro, não "fora do prazo"
+                    if texto_prazo < minimo:
+                        relatorio.linhas_fora_do_prazo += 1
+                        continue
+                entrega = converter_entrega(row, posicoes, datas)
+            except IndexError:
+                relatorio.registrar_erro(reader.line_num, "colunas faltando")
+                continue
+            except ValueError as e:
+                relatorio.registrar_erro(reader.line_num, str(e))
+                continue
+
+            relatorio.linhas_aceitas += 1
+            bloco.append(entrega)
+            if len(bloco) >= tamanho_bloco:
+                yield bloco
+                bloco = []
+        if bloco:
+            yield bloco
+
+
+def _converter_prazo(texto_prazo, datas=None):
+    """converter_data_iso com cache opcional `datas` (texto -> datetime)."""
+    prazo = datas.get(texto_prazo) if datas is not None else None
+    if prazo is None:
+        prazo = converter_data_iso(texto_prazo)
+        if datas is not None:
+            datas[texto_prazo] = prazo
+    return prazo
+
+
+def converter_entrega(row, posicoes, datas=None):
+    """
+    Converte uma linha já separada do CSV de entregas em dicionário, com
+    posicoes = colunas de CAMPOS_ENTREGA (ver posicoes_entrega). Linhas
+    inválidas levantam IndexError (colunas faltando) ou ValueError.
+    """
+    i_id, i_origem, i_destino, i_prazo, i_valor, i_bonus = posicoes
+    return {
+        'id': row[i_id],
+        'origem': row[i_origem],
+        'destino': row[i_destino],
+        'prazo': _converter_prazo(row[i_prazo], datas),
+        'valor': float(row[i_valor]),
+        'bonus': float(row[i_bonus])
+    }
+
+
+def posicoes_entrega(cabecalho, arquivo=''):
+    """Colunas de CAMPOS_ENTREGA no cabeçalho (ValueError se faltar alguma)."""
+    return _posicoes(cabecalho, CAMPOS_ENTREGA, arquivo)
+
+
+def iterar_entregas(arquivo, prazo_minimo=None, relatorio=None):
+    """Gera as entregas do arquivo uma a uma (ver ler_entregas_em_blocos)."""
+    for bloco in ler_entregas_em_blocos(arquivo, prazo_minimo, relatorio=relatorio):
+        yield from bloco
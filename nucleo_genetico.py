@@ -0,0 +1,175 @@
+import random
+import time
+
+from instrumentacao import ESTATISTICAS_DESATIVADAS
+from operadores_geneticos import OPERADORES_PADRAO, entregas_livres
+
+
+def populacao_inicial(total_validas, tamanho_populacao, capacidade_diaria, rng=random):
+    """
+    Gera a população inicial. Cada indivíduo é uma seleção aleatória de
+    índices em entregas_validas.
+    """
+    populacao = []
+    for _ in range(tamanho_populacao):
+        if total_validas <= capacidade_diaria:
+            solucao = list(range(total_validas))
+        else:
+            solucao = rng.sample(range(total_validas), capacidade_diaria)
+        populacao.append(solucao)
+    return populacao
+
+
+def reparar_populacao(individuos, total_validas, tamanho_populacao, capacidade_diaria, rng=random):
+    """
+    Adapta uma população reaproveitada (ex.: a do dia anterior, já convertida
+    para posições do dia, sem as entregas vencidas) ao dia atual: remove
+    genes repetidos, corta ou completa cada indivíduo com entregas ainda não
+    usadas por ele e ajusta o tamanho da população, mantendo os primeiros
+    indivíduos (a elite) e completando com indivíduos aleatórios.
+    """
+    tamanho_individuo = min(capacidade_diaria, total_validas)
+    populacao = []
+    for individuo in individuos[:tamanho_populacao]:
+        usados = set()
+        solucao = []
+        for gene in individuo:
+            if gene not in usados and len(solucao) < tamanho_individuo:
+                usados.add(gene)
+                solucao.append(gene)
+        # Completar por sorteio com rejeição: O(k) em vez de listar todas as entregas livres
+        while len(solucao) < tamanho_individuo:
+            gene = rng.randrange(total_validas)
+            if gene not in usados:
+                usados.add(gene)
+                solucao.append(gene)
+        populacao.append(solucao)
+
+    faltando = tamanho_populacao - len(populacao)
+    if faltando > 0:
+        populacao.extend(populacao_inicial(total_validas, faltando, capacidade_diaria, rng))
+    return populacao
+
+
+def gerar_filho(pai1, pai2, capacidade_diaria, total_validas, rng=random, operadores=OPERADORES_PADRAO):
+    """
+    Cruza dois pais, ajusta o filho à capacidade diária (cortando ou
+    completando com entregas que ele ainda não tem) e aplica a mutação com
+    a probabilidade de `operadores`. Retorna (filho, mutou); o filho é
+    sempre uma lista nova.
+    """
+    filho = operadores.cruzamento(pai1, pai2, rng)
+
+    # Garantir que o filho tenha o tamanho correto: a capacidade diária ou,
+    # se houver menos entregas válidas, todas elas (o cruzamento uniforme
+    # pode perder genes mesmo quando os pais têm todas as entregas do dia)
+    tamanho_individuo = min(capacidade_diaria, total_validas)
+    if len(filho) > capacidade_diaria:
+        del filho[capacidade_diaria:]
+    elif len(filho) < tamanho_individuo:
+        # Adicionar entregas aleatórias para completar
+        livres = total_validas - len(filho)
+        sorteadas = rng.sample(range(livres), tamanho_individuo - len(filho))
+        filho.extend(entregas_livres(sorteadas, filho))
+
+    # Mutação (com baixa probabilidade)
+    mutou = False
+    if rng.random() < operadores.taxa_mutacao and total_validas > capacidade_diaria:
+        mutou = operadores.mutacao(filho, total_validas, rng)
+    return filho, mutou
+
+
+def evoluir(populacao, geracoes, avaliar, ranquear, capacidade_diaria, total_validas,
+            rng=random, melhor_solucao=None, melhor_avaliacao=(float('inf'), 0),
+            paciencia=None, limite_tempo=None, estatisticas=ESTATISTICAS_DESATIVADAS,
+            operadores=OPERADORES_PADRAO, cancelar=None):
+    """
+    Executa até `geracoes` gerações sobre a população.
+    - avaliar(populacao) -> (tempos, lucros)
+    - ranquear(tempos, lucros, limite) -> (ordem, indice_melhor), com ordem
+      contendo só os `limite` melhores indivíduos (a elite)
+    - rng: gerador de números aleatórios (o módulo random por padrão)
+    - paciencia: para após esse número de gerações seguidas sem melhora
+    - limite_tempo: instante de time.perf_counter() a partir do qual
+      nenhuma nova geração é iniciada
+    - estatisticas: registra o tempo de avaliação, ranqueamento e
+      cruzamento/mutação (ver instrumentacao.EstatisticasExecucao)
+    - operadores: seleção, cruzamento, mutação, tamanho da elite e taxa de
+      mutação (ver operadores_geneticos.OperadoresGeneticos)
+    - cancelar: função sem argumentos consultada a cada geração (ex.:
+      threading.Event.is_set); quando retorna True, o laço para
+    Retorna (populacao, melhor_solucao, melhor_avaliacao, info), com
+    info = {'geracoes_executadas', 'motivo_parada'} e motivo_parada em
+    'geracoes', 'estagnacao', 'tempo_limite' ou 'cancelado'. Quando o laço termina
+    normalmente, a população retornada começa pela elite da última geração
+    avaliada, em ordem de fitness; numa parada antecipada ela é a última
+    população avaliada.
+    """
+    tamanho_populacao = len(populacao)
+    geracoes_executadas = 0
+    geracoes_sem_melhora = 0
+    motivo_parada = 'geracoes'
+    # Duas listas de população alternadas entre as gerações (nunca a lista recebida),
+    # para não alocar uma lista de população por geração. Os filhos em si são listas
+    # novas: eles viram elite e melhor_solucao por referência, então não são reciclados.
+    buffers = ([], [])
+
+    for geracao in range(geracoes):
+        # Avaliar cada solução
+        with estatisticas.medir('avaliacao_fitness'):
+            tempos, lucros = avaliar(populacao)
+        with estatisticas.medir('ranqueamento'):
+            ordem, indice_melhor = ranquear(tempos, lucros, operadores.tamanho_elite)
+        estatisticas.contar('individuos_avaliados', len(populacao))
+        geracoes_executadas += 1
+
+        # Verifica se é a melhor solução até agora (menor tempo e maior lucro)
+        avaliacao = (tempos[indice_melhor], lucros[indice_melhor])
+        if avaliacao[0] < melhor_avaliacao[0] or (avaliacao[0] == melhor_avaliacao[0] and avaliacao[1] > melhor_avaliacao[1]):
+            melhor_solucao = populacao[indice_melhor]
+            melhor_avaliacao = avaliacao
+            geracoes_sem_melhora = 0
+        else:
+            geracoes_sem_melhora += 1
+
+        # Parada antecipada: estagnação, orçamento de tempo esgotado ou cancelamento
+        if paciencia is not None and geracoes_sem_melhora >= paciencia:
+            motivo_parada = 'estagnacao'
+            break
+        if limite_tempo is not None and time.perf_counter() >= limite_tempo:
+            motivo_parada = 'tempo_limite'
+            break
+        if cancelar is not None and cancelar():
+            motivo_parada = 'cancelado'
+            break
+
+        # Seleção dos melhores (elitismo)
+        elite = [populacao[i] for i in ordem[:operadores.tamanho_elite]]
+        sortear_pai = operadores.selecao.preparar(populacao, elite, tempos, lucros)
+
+        # Criar nova população no buffer livre (elite primeiro)
+        nova_populacao = buffers[geracao % 2]
+        nova_populacao[:len(elite)] = elite
+        del nova_populacao[tamanho_populacao:]
+
+        # Cruzamento e mutação
+        mutacoes = 0
+        with estatisticas.medir('cruzamento_mutacao'):
+            for posicao in range(len(elite), tamanho_populacao):
+                # Seleção de pais e cruzamento
+                pai1 = sortear_pai(rng)
+                pai2 = sortear_pai(rng)
+                filho, mutou = gerar_filho(pai1, pai2, capacidade_diaria, total_validas, rng, operadores)
+                mutacoes += mutou
+
+                if posicao < len(nova_populacao):
+                    nova_populacao[posicao] = filho
+                else:
+                    nova_populacao.append(filho)
+        estatisticas.contar('filhos_gerados', tamanho_populacao - len(elite))
+        estatisticas.contar('mutacoes', mutacoes)
+
+        populacao = nova_populacao
+
+    info = {'geracoes_executadas': geracoes_executadas, 'motivo_parada': motivo_parada}
+    return populacao, melhor_solucao, melhor_avaliacao, info
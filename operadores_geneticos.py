@@ -0,0 +1,168 @@
+import itertools
+
+TAMANHO_ELITE = 10
+TAXA_MUTACAO = 0.1
+TAMANHO_TORNEIO = 3
+
+
+def entregas_livres(posicoes, ocupadas):
+    """
+    Converte posições sorteadas entre as entregas livres (as de
+    range(total_validas) fora de `ocupadas`) em índices de entregas, sem
+    listar as livres: a j-ésima livre é j mais o número de ocupadas que vêm
+    antes dela. Custo O(k log k) para k ocupadas, independente de total_validas.
+    """
+    ordenadas = sorted(ocupadas)
+    entregas = []
+    for j in posicoes:
+        for ocupada in ordenadas:
+            if ocupada > j:
+                break
+            j += 1
+        entregas.append(j)
+    return entregas
+
+
+def _como_lista(valores):
+    # Vetores NumPy viram listas: o acesso elemento a elemento é bem mais rápido
+    return valores.tolist() if hasattr(valores, 'tolist') else valores
+
+
+# Seleção de pais: preparar() é chamado uma vez por geração e retorna sortear(rng)
+
+class SelecaoElite:
+    """Pais sorteados uniformemente entre os indivíduos da elite (comportamento original)."""
+    def preparar(self, populacao, elite, tempos, lucros):
+        return lambda rng: rng.choice(elite)
+
+
+class SelecaoTorneio:
+    """
+    Torneio: sorteia `tamanho` indivíduos da população inteira e escolhe o
+    de maior lucro (no empate, menor tempo). O(tamanho) por pai.
+    """
+    def __init__(self, tamanho=TAMANHO_TORNEIO):
+        if tamanho < 1:
+            raise ValueError("o torneio precisa de pelo menos 1 participante")
+        self.tamanho = tamanho
+
+    def preparar(self, populacao, elite, tempos, lucros):
+        tempos = _como_lista(tempos)
+        lucros = _como_lista(lucros)
+        total = len(populacao)
+
+        def sortear(rng):
+            vencedor = rng.randrange(total)
+            for _ in range(self.tamanho - 1):
+                candidato = rng.randrange(total)
+                if (-lucros[candidato], tempos[candidato]) < (-lucros[vencedor], tempos[vencedor]):
+                    vencedor = candidato
+            return populacao[vencedor]
+        return sortear
+
+
+class SelecaoRoleta:
+    """
+    Roleta: probabilidade de cada indivíduo ser pai proporcional ao seu
+    lucro. Os pesos acumulados são calculados uma vez por geração (O(N)) e
+    cada sorteio é uma busca binária. Sem lucro algum, o sorteio é uniforme.
+    """
+    def preparar(self, populacao, elite, tempos, lucros):
+        acumulados = list(itertools.accumulate(_como_lista(lucros)))
+        if not acumulados or acumulados[-1] <= 0:
+            return lambda rng: populacao[rng.randrange(len(populacao))]
+        return lambda rng: rng.choices(populacao, cum_weights=acumulados)[0]
+
+
+# Cruzamento: cruzar(pai1, pai2, rng) -> novo filho (o tamanho é ajustado por evoluir)
+
+def cruzamento_um_ponto(pai1, pai2, rng):
+    """Começo de pai1 até um ponto de corte sorteado, seguido dos genes de pai2 que ainda não estão no filho."""
+    if min(len(pai1), len(pai2)) > 1:
+        ponto_corte = rng.randint(1, min(len(pai1), len(pai2)) - 1)
+    else:
+        ponto_corte = 1  # Ou outra abordagem para lidar com cromossomos pequenos
+
+    filho = pai1[:ponto_corte]
+    usados = set(filho)
+    filho.extend(x for x in pai2 if x not in usados)
+    return filho
+
+
+def cruzamento_uniforme(pai1, pai2, rng):
+    """Cada posição herda o gene de um dos pais, por sorteio; se ele já estiver no filho, usa o do outro pai."""
+    filho = []
+    usados = set()
+    for gene1, gene2 in zip(pai1, pai2):
+        if rng.random() < 0.5:
+            gene1, gene2 = gene2, gene1
+        for gene in (gene1, gene2):
+            if gene not in usados:
+                usados.add(gene)
+                filho.append(gene)
+                break
+    return filho
+
+
+# Mutação: mutar(filho, total_validas, rng) altera o filho e retorna True se ele mudou
+
+def mutacao_substituicao(filho, total_validas, rng):
+    """Substitui uma entrega aleatória do filho por uma entrega que ele ainda não tem."""
+    idx = rng.randint(0, len(filho) - 1)
+    livres = total_validas - len(filho)
+    if livres:
+        filho[idx] = entregas_livres([rng.randrange(livres)], filho)[0]
+        return True
+    return False
+
+
+SELECOES = {'elite': SelecaoElite, 'torneio': SelecaoTorneio, 'roleta': SelecaoRoleta}
+CRUZAMENTOS = {'um_ponto': cruzamento_um_ponto, 'uniforme': cruzamento_uniforme}
+MUTACOES = {'substituicao': mutacao_substituicao}
+
+
+class OperadoresGeneticos:
+    """
+    Estratégias usadas por nucleo_genetico.evoluir em cada geração.
+    - selecao: nome em SELECOES ou objeto com preparar(populacao, elite, tempos, lucros)
+    - cruzamento: nome em CRUZAMENTOS ou função cruzar(pai1, pai2, rng)
+    - mutacao: nome em MUTACOES ou função mutar(filho, total_validas, rng)
+    - tamanho_elite: melhores indivíduos copiados para a geração seguinte
+    - taxa_mutacao: probabilidade de mutação de cada filho
+    Para serem usados em pools de processos, objetos e funções próprios
+    precisam ser definidos no nível de um módulo.
+    """
+    def __init__(self, selecao='elite', cruzamento='um_ponto', mutacao='substituicao',
+                 tamanho_elite=TAMANHO_ELITE, taxa_mutacao=TAXA_MUTACAO):
+        if tamanho_elite < 1:
+            raise ValueError("a elite precisa ter pelo menos 1 indivíduo")
+        if not 0 <= taxa_mutacao <= 1:
+            raise ValueError(f"taxa de mutação fora de [0, 1]: {taxa_mutacao}")
+        self.selecao = _estrategia(SELECOES, selecao, 'seleção desconhecida')() if isinstance(selecao, str) else selecao
+        self.cruzamento = _estrategia(CRUZAMENTOS, cruzamento, 'cruzamento desconhecido')
+        self.mutacao = _estrategia(MUTACOES, mutacao, 'mutação desconhecida')
+        self.tamanho_elite = tamanho_elite
+        self.taxa_mutacao = taxa_mutacao
+
+    def descricao(self):
+        """Texto curto que identifica a configuração (ex.: em tabelas de benchmark)."""
+        selecao = {classe: nome for nome, classe in SELECOES.items()}.get(type(self.selecao), type(self.selecao).__name__)
+        if isinstance(self.selecao, SelecaoTorneio):
+            selecao += f"({self.selecao.tamanho})"
+        cruzamento = {funcao: nome for nome, funcao in CRUZAMENTOS.items()}.get(self.cruzamento, self.cruzamento.__name__)
+        mutacao = {funcao: nome for nome, funcao in MUTACOES.items()}.get(self.mutacao, self.mutacao.__name__)
+        return f"{selecao}/{cruzamento}/{mutacao} elite={self.tamanho_elite} mutacao={self.taxa_mutacao:g}"
+
+    def __repr__(self):
+        return f"OperadoresGeneticos({self.descricao()})"
+
+
+def _estrategia(registro, estrategia, erro):
+    if not isinstance(estrategia, str):
+        return estrategia
+    if estrategia not in registro:
+        raise ValueError(f"{erro}: {estrategia} (opções: {', '.join(registro)})")
+    return registro[estrategia]
+
+
+OPERADORES_PADRAO = OperadoresGeneticos()
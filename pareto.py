@@ -0,0 +1,163 @@
+import random
+import time
+
+import numpy as np
+
+from instrumentacao import ESTATISTICAS_DESATIVADAS
+from nucleo_genetico import gerar_filho
+from operadores_geneticos import OPERADORES_PADRAO
+
+
+def classificar_frentes(tempos, lucros):
+    """
+    Ordenação não dominada (NSGA-II) para os objetivos maximizar lucro e
+    minimizar tempo. Retorna o número da frente de cada indivíduo (0 = não
+    dominado). Pares (lucro, tempo) repetidos são classificados uma vez;
+    cada frente é retirada com uma varredura vetorizada: em ordem de lucro
+    decrescente (no empate, tempo crescente), um ponto é não dominado se o
+    seu tempo é menor que o de todos os pontos anteriores.
+    """
+    tempos = np.asarray(tempos, dtype=np.float64)
+    lucros = np.asarray(lucros, dtype=np.float64)
+    # np.unique ordena os pares por -lucro e depois por tempo
+    pontos, inverso = np.unique(np.column_stack((-lucros, tempos)), axis=0, return_inverse=True)
+    restantes = np.arange(len(pontos))
+    frentes_pontos = np.empty(len(pontos), dtype=np.int64)
+    frente = 0
+    while len(restantes):
+        tempos_restantes = pontos[restantes, 1]
+        anteriores = np.minimum.accumulate(np.concatenate(([np.inf], tempos_restantes[:-1])))
+        nao_dominados = tempos_restantes < anteriores
+        frentes_pontos[restantes[nao_dominados]] = frente
+        restantes = restantes[~nao_dominados]
+        frente += 1
+    return frentes_pontos[inverso.reshape(-1)]
+
+
+def distancia_aglomeracao(tempos, lucros, frentes):
+    """
+    Distância de aglomeração (crowding distance) de cada indivíduo dentro da
+    sua frente: soma, para cada objetivo, da distância entre os vizinhos
+    normalizada pela amplitude da frente. Os extremos recebem infinito.
+    """
+    distancias = np.zeros(len(frentes), dtype=np.float64)
+    if not len(frentes):
+        return distancias
+    for valores in (np.asarray(lucros, dtype=np.float64), np.asarray(tempos, dtype=np.float64)):
+        ordem = np.lexsort((valores, frentes))
+        ordenados = valores[ordem]
+        frentes_ordenadas = frentes[ordem]
+        mudanca = frentes_ordenadas[1:] != frentes_ordenadas[:-1]
+        inicio = np.concatenate(([True], mudanca))
+        fim = np.concatenate((mudanca, [True]))
+        # Amplitude da frente de cada posição: último menos primeiro valor da frente
+        grupo = np.cumsum(inicio) - 1
+        amplitude = ordenados[fim][grupo] - ordenados[inicio][grupo]
+        vizinhos = np.zeros(len(ordem), dtype=np.float64)
+        vizinhos[1:-1] = ordenados[2:] - ordenados[:-2]
+        parcela = np.zeros(len(ordem), dtype=np.float64)
+        internos = ~(inicio | fim) & (amplitude > 0)
+        parcela[internos] = vizinhos[internos] / amplitude[internos]
+        parcela[inicio | fim] = np.inf
+        distancias[ordem] += parcela
+    return distancias
+
+
+def ranquear_pareto(tempos, lucros):
+    """Retorna (ordem, frentes, distancias): ordem por frente crescente e, na frente, distância decrescente."""
+    frentes = classificar_frentes(tempos, lucros)
+    distancias = distancia_aglomeracao(tempos, lucros, frentes)
+    return np.lexsort((-distancias, frentes)), frentes, distancias
+
+
+def evoluir_pareto(populacao, geracoes, avaliar, capacidade_diaria, total_validas, rng=random,
+                   operadores=OPERADORES_PADRAO, limite_tempo=None, estatisticas=ESTATISTICAS_DESATIVADAS,
+                   cancelar=None):
+    """
+    NSGA-II: a cada geração, os pais são escolhidos por torneio binário
+    (frente menor e, no empate, maior distância de aglomeração), os filhos
+    são gerados com o cruzamento e a mutação de `operadores` e a próxima
+    população são os melhores de pais + filhos, por frente e distância de
+    aglomeração. A seleção e a elite de `operadores` não são usadas.
+    limite_tempo e cancelar funcionam como em nucleo_genetico.evoluir e
+    são verificados antes de cada geração.
+    Retorna (populacao, tempos, lucros, frentes, info), com a população em
+    ordem de ranqueamento (a frente de Pareto primeiro) e
+    info = {'geracoes_executadas', 'motivo_parada'}, com motivo_parada em
+    'geracoes', 'tempo_limite' ou 'cancelado'.
+    """
+    tamanho_populacao = len(populacao)
+    with estatisticas.medir('avaliacao_fitness'):
+        tempos, lucros = (np.asarray(valores) for valores in avaliar(populacao))
+    with estatisticas.medir('ranqueamento'):
+        ordem, frentes, distancias = ranquear_pareto(tempos, lucros)
+        populacao = [populacao[i] for i in ordem.tolist()]
+        tempos, lucros = tempos[ordem], lucros[ordem]
+        frentes, distancias = frentes[ordem], distancias[ordem]
+    estatisticas.contar('individuos_avaliados', tamanho_populacao)
+    geracoes_executadas = 0
+    motivo_parada = 'geracoes'
+
+    for _ in range(geracoes):
+        if limite_tempo is not None and time.perf_counter() >= limite_tempo:
+            motivo_parada = 'tempo_limite'
+            break
+        if cancelar is not None and cancelar():
+            motivo_parada = 'cancelado'
+            break
+
+        # Torneio binário sobre listas: o acesso elemento a elemento é mais rápido que em vetores
+        frentes_lista = frentes.tolist()
+        distancias_lista = distancias.tolist()
+
+        def sortear_pai():
+            i = rng.randrange(tamanho_populacao)
+            j = rng.randrange(tamanho_populacao)
+            if (frentes_lista[j], -distancias_lista[j]) < (frentes_lista[i], -distancias_lista[i]):
+                i = j
+            return populacao[i]
+
+        filhos = []
+        mutacoes = 0
+        with estatisticas.medir('cruzamento_mutacao'):
+            for _ in range(tamanho_populacao):
+                filho, mutou = gerar_filho(sortear_pai(), sortear_pai(), capacidade_diaria, total_validas, rng, operadores)
+                filhos.append(filho)
+                mutacoes += mutou
+        estatisticas.contar('filhos_gerados', len(filhos))
+        estatisticas.contar('mutacoes', mutacoes)
+
+        with estatisticas.medir('avaliacao_fitness'):
+            tempos_filhos, lucros_filhos = avaliar(filhos)
+        estatisticas.contar('individuos_avaliados', len(filhos))
+
+        # Sobrevivência (mu + lambda): os melhores de pais + filhos, já em ordem de ranqueamento
+        with estatisticas.medir('ranqueamento'):
+            juntos = populacao + filhos
+            tempos = np.concatenate((tempos, np.asarray(tempos_filhos)))
+            lucros = np.concatenate((lucros, np.asarray(lucros_filhos)))
+            ordem, frentes, distancias = ranquear_pareto(tempos, lucros)
+            sobreviventes = ordem[:tamanho_populacao]
+            populacao = [juntos[i] for i in sobreviventes.tolist()]
+            tempos, lucros = tempos[sobreviventes], lucros[sobreviventes]
+            frentes, distancias = frentes[sobreviventes], distancias[sobreviventes]
+        geracoes_executadas += 1
+
+    info = {'geracoes_executadas': geracoes_executadas, 'motivo_parada': motivo_parada}
+    return populacao, tempos, lucros, frentes, info
+
+
+def frente_pareto(populacao, tempos, lucros, frentes):
+    """
+    Soluções não dominadas, uma por par (lucro, tempo), em ordem de tempo
+    crescente. Retorna uma lista de (individuo, tempo, lucro).
+    """
+    solucoes = []
+    vistos = set()
+    for individuo, tempo, lucro, frente in zip(populacao, tempos.tolist(), lucros.tolist(), frentes.tolist()):
+        if frente != 0 or (lucro, tempo) in vistos:
+            continue
+        vistos.add((lucro, tempo))
+        solucoes.append((individuo, tempo, lucro))
+    solucoes.sort(key=lambda solucao: (solucao[1], -solucao[2]))
+    return solucoes
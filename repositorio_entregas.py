@@ -0,0 +1,124 @@
+import numpy as np
+
+from armazem_colunar import CAMPOS_ENTREGA, ArmazemEntregas, VisaoEntregas, primeiro_dia_valido
+
+# As linhas novas ficam num índice por prazo auxiliar (pequeno), fundido ao
+# principal quando passa de max(MIN_FUSAO_INDICE, 1/FRACAO_FUSAO_INDICE dele)
+MIN_FUSAO_INDICE = 1024
+FRACAO_FUSAO_INDICE = 16
+
+
+class RepositorioEntregas:
+    """
+    Armazena as entregas lidas (em um ArmazemEntregas colunar) com índices
+    para consultas rápidas: por id (O(1)) e por prazo (busca binária).
+    O índice por prazo tem duas partes ordenadas, a principal e uma pequena
+    com as linhas adicionadas depois dela, para que cada chegada não
+    reescreva o índice inteiro.
+    """
+    def __init__(self, armazem=None):
+        self.armazem = armazem if armazem is not None else ArmazemEntregas()
+        self.entregas = VisaoEntregas(self.armazem)  # Ordem de leitura do arquivo
+        self._por_id = None
+        self._ordem_prazo = None
+        self._prazos_ordenados = None
+        self._ordem_prazo_novas = None
+        self._prazos_novas = None
+
+    def adicionar(self, entrega):
+        """Adiciona uma entrega. Se o id já existir, o índice mantém a primeira lida."""
+        self.adicionar_varias([entrega])
+
+    def adicionar_varias(self, entregas):
+        """
+        Adiciona um bloco de entregas de uma vez. Índices já construídos são
+        atualizados só com as novas linhas, sem reordenar todo o armazém.
+        """
+        inicio = len(self.armazem)
+        self.armazem.adicionar_varias(entregas)
+        if len(self.armazem) > inicio:
+            self._atualizar_indices(inicio)
+
+    def adicionar_armazem(self, armazem):
+        """Adiciona todas as entregas de outro ArmazemEntregas (ex.: lido de um snapshot)."""
+        colunas = {nome: armazem.coluna(nome) for nome in CAMPOS_ENTREGA}
+        self.armazem.adicionar_colunas(colunas, armazem.cidades.nomes)
+        self._por_id = None
+        self._ordem_prazo = None
+
+    def _atualizar_indices(self, inicio):
+        """Inclui as linhas a partir de `inicio` nos índices por id e por prazo, se existirem."""
+        if self._por_id is not None:
+            ids = self.armazem.coluna('id')[inicio:].tolist()
+            for indice, id_lido in enumerate(ids, start=inicio):
+                self._por_id.setdefault(id_lido, indice)
+        if self._ordem_prazo is not None:
+            prazos = self.armazem.coluna('prazo')[inicio:]
+            ordem = np.argsort(prazos, kind='stable')
+            self._ordem_prazo_novas, self._prazos_novas = _intercalar(
+                self._ordem_prazo_novas, self._prazos_novas, np.arange(inicio, inicio + len(prazos))[ordem], prazos[ordem])
+            if len(self._ordem_prazo_novas) > max(MIN_FUSAO_INDICE, len(self._ordem_prazo) // FRACAO_FUSAO_INDICE):
+                self._ordem_prazo, self._prazos_ordenados = _intercalar(
+                    self._ordem_prazo, self._prazos_ordenados, self._ordem_prazo_novas, self._prazos_novas)
+                self._ordem_prazo_novas, self._prazos_novas = _indice_vazio()
+    
+    def indexar_ids(self):
+        """
+        Constrói o índice por id, se ainda não existir. Normalmente ele é
+        construído só na primeira consulta a obter() (a avaliação vetorizada
+        não precisa dele); chamar antes evita esse custo O(N) na consulta.
+        """
+        if self._por_id is None:
+            por_id = {}
+            for indice, id_lido in enumerate(self.armazem.coluna('id').tolist()):
+                por_id.setdefault(id_lido, indice)
+            self._por_id = por_id
+
+    def obter(self, id_entrega):
+        """Retorna a entrega com o id informado ou None se não existir."""
+        self.indexar_ids()
+        indice = self._por_id.get(id_entrega)
+        return self.armazem.registro(indice) if indice is not None else None
+
+    def indices_validos(self, data_atual):
+        """
+        Retorna, como array NumPy, as linhas do armazém com prazo >= data_atual,
+        na ordem de leitura (a mesma da filtragem da lista de entregas, de que
+        dependem os desempates dos algoritmos). O índice por prazo localiza o
+        trecho válido por busca binária; só esse trecho é reordenado.
+        """
+        if self._ordem_prazo is None:
+            prazos = self.armazem.coluna('prazo')
+            self._ordem_prazo = np.argsort(prazos, kind='stable')
+            self._prazos_ordenados = prazos[self._ordem_prazo]
+            self._ordem_prazo_novas, self._prazos_novas = _indice_vazio()
+        dia = primeiro_dia_valido(data_atual)
+        inicio = np.searchsorted(self._prazos_ordenados, dia, side='left')
+        inicio_novas = np.searchsorted(self._prazos_novas, dia, side='left')
+        return np.sort(np.concatenate((self._ordem_prazo[inicio:], self._ordem_prazo_novas[inicio_novas:])))
+
+    def registros(self, indices):
+        """Retorna as entregas das linhas informadas."""
+        registro = self.armazem.registro
+        return [registro(indice) for indice in np.asarray(indices).tolist()]
+
+    def validas(self, data_atual):
+        """Retorna as entregas com prazo >= data_atual, na ordem de leitura."""
+        return self.registros(self.indices_validos(data_atual))
+
+    def __len__(self):
+        return len(self.armazem)
+
+
+def _indice_vazio():
+    return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.int32)
+
+
+def _intercalar(linhas, prazos, novas_linhas, novos_prazos):
+    """
+    Intercala duas partes do índice por prazo, ambas ordenadas por (prazo, linha),
+    sendo as linhas de `novas_linhas` todas posteriores às de `linhas`.
+    """
+    # side='right': empates ficam depois das linhas já existentes, como na ordenação estável completa
+    posicoes = np.searchsorted(prazos, novos_prazos, side='right')
+    return np.insert(linhas, posicoes, novas_linhas), np.insert(prazos, posicoes, novos_prazos)
@@ -0,0 +1,125 @@
+import csv
+import io
+import json
+import sys
+
+CAMPOS_LINHA = ('id', 'origem', 'destino', 'tempo', 'valor', 'bonus', 'lucro')
+TAMANHO_BUFFER = 1 << 16
+
+
+class ResultadoProgramacao:
+    """
+    Resultado de uma programação de entregas, sem nenhuma saída:
+    - linhas: um dicionário por entrega (id, origem, destino, tempo, valor, bônus, lucro),
+      com tempo None quando não há caminho entre origem e destino
+    - tempo_total: soma dos tempos conhecidos, em minutos
+    - lucro_total: soma de valor + bônus de todas as entregas
+    """
+    def __init__(self, linhas):
+        self.linhas = linhas
+        self.tempo_total = sum(linha['tempo'] for linha in linhas if linha['tempo'])
+        self.lucro_total = sum(linha['lucro'] for linha in linhas)
+
+    @classmethod
+    def calcular(cls, entregas, calcular_tempo_entrega):
+        linhas = []
+        for entrega in entregas:
+            linhas.append({
+                'id': entrega['id'],
+                'origem': entrega['origem'],
+                'destino': entrega['destino'],
+                'tempo': calcular_tempo_entrega(entrega['origem'], entrega['destino']),
+                'valor': entrega['valor'],
+                'bonus': entrega['bonus'],
+                'lucro': entrega['valor'] + entrega['bonus']
+            })
+        return cls(linhas)
+
+    def rotas(self, capacidade_diaria):
+        """Saída no formato solicitado: (capacidade, origem;tempo, ...), só com entregas que têm caminho."""
+        rotas = [f"{linha['origem']};{linha['tempo']}" for linha in self.linhas if linha['tempo']]
+        return f"({capacidade_diaria}, {', '.join(rotas)})"
+
+    def como_dicionario(self):
+        return {'tempo_total': self.tempo_total, 'lucro_total': self.lucro_total, 'entregas': self.linhas}
+
+    def __len__(self):
+        return len(self.linhas)
+
+
+class Renderizador:
+    """
+    Base dos renderizadores: o texto de cada programação é acumulado em
+    memória e escrito em `saida` (sys.stdout por padrão) em blocos de até
+    tamanho_buffer caracteres, ou ao chamar descarregar(). Pode ser usado
+    como gerenciador de contexto, que descarrega ao sair.
+    """
+    def __init__(self, saida=None, tamanho_buffer=TAMANHO_BUFFER):
+        self.saida = saida
+        self.tamanho_buffer = tamanho_buffer
+        self.programacoes = 0
+        self._partes = []
+        self._tamanho = 0
+
+    def renderizar(self, resultado, titulo=None, rodape=None):
+        self.programacoes += 1
+        texto = self._formatar(resultado, titulo, rodape)
+        self._partes.append(texto)
+        self._tamanho += len(texto)
+        if self._tamanho >= self.tamanho_buffer:
+            self.descarregar()
+
+    def descarregar(self):
+        if self._partes:
+            saida = self.saida if self.saida is not None else sys.stdout
+            saida.write(''.join(self._partes))
+            self._partes = []
+            self._tamanho = 0
+
+    def _formatar(self, resultado, titulo, rodape):
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.descarregar()
+
+
+class RenderizadorTexto(Renderizador):
+    """Tabela de texto, no mesmo formato de exibir_programacao."""
+    def _formatar(self, resultado, titulo, rodape):
+        linhas = [f"\n{titulo or '===== PROGRAMAÇÃO DE ENTREGAS ====='}",
+                  "ID\tOrigem\tDestino\tTempo\tValor\tBônus\tLucro Total"]
+        for linha in resultado.linhas:
+            linhas.append(f"{linha['id']}\t{linha['origem']}\t{linha['destino']}\t{linha['tempo']}\t"
+                          f"{linha['valor']}\t{linha['bonus']}\t{linha['lucro']}")
+        linhas.append(f"\nTempo total estimado: {resultado.tempo_total} minutos")
+        linhas.append(f"Lucro total esperado: R$ {resultado.lucro_total:.2f}")
+        linhas.append(rodape or "=" * 34)
+        return "\n".join(linhas) + "\n"
+
+
+class RenderizadorCSV(Renderizador):
+    """Uma linha CSV por entrega, com o número da programação na primeira coluna."""
+    def __init__(self, saida=None, tamanho_buffer=TAMANHO_BUFFER, cabecalho=True):
+        super().__init__(saida, tamanho_buffer)
+        self._cabecalho = cabecalho
+
+    def _formatar(self, resultado, titulo, rodape):
+        texto = io.StringIO()
+        writer = csv.writer(texto)
+        if self._cabecalho:
+            writer.writerow(('programacao',) + CAMPOS_LINHA)
+            self._cabecalho = False
+        writer.writerows((self.programacoes,) + tuple(linha[campo] for campo in CAMPOS_LINHA)
+                         for linha in resultado.linhas)
+        return texto.getvalue()
+
+
+class RenderizadorJSONLinhas(Renderizador):
+    """Um objeto JSON por programação (JSON Lines), com totais e entregas."""
+    def _formatar(self, resultado, titulo, rodape):
+        objeto = {'programacao': self.programacoes}
+        objeto.update(resultado.como_dicionario())
+        return json.dumps(objeto, ensure_ascii=False) + "\n"
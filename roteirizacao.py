@@ -0,0 +1,233 @@
+import math
+
+from instrumentacao import ESTATISTICAS_DESATIVADAS
+
+LIMITE_MINUTOS_DIA = 12 * 60
+TAMANHO_MAXIMO_SEGMENTO = 3  # Or-opt move blocos de 1 a 3 entregas seguidas
+_INFINITO = math.inf
+
+
+class RoteiroDiario:
+    """
+    Roteiro de um dia, sem nenhuma saída:
+    - paradas: um dicionário por entrega, na ordem de execução, com o
+      deslocamento vazio até a origem, o tempo da entrega e os minutos de
+      início e fim contados a partir da saída do veículo
+    - excluidas: entregas que ficaram fora do roteiro, com o motivo
+      ('fora_do_prazo', 'sem_caminho' ou 'limite_diario')
+    - tempo_total: minuto em que a última entrega termina (deslocamentos inclusos)
+    - tempo_deslocamento: parte de tempo_total gasta sem carga
+    - lucro_total: soma de valor + bônus das entregas do roteiro
+    """
+    def __init__(self, paradas, excluidas, base=None):
+        self.paradas = paradas
+        self.excluidas = excluidas
+        self.base = base
+        self.tempo_total = paradas[-1]['fim'] if paradas else 0
+        self.tempo_deslocamento = sum(parada['deslocamento'] for parada in paradas)
+        self.lucro_total = sum(parada['lucro'] for parada in paradas)
+
+    def sequencia(self):
+        """Ids das entregas na ordem do roteiro."""
+        return [parada['id'] for parada in self.paradas]
+
+    def como_dicionario(self):
+        return {'tempo_total': self.tempo_total, 'tempo_deslocamento': self.tempo_deslocamento,
+                'lucro_total': self.lucro_total, 'base': self.base,
+                'paradas': self.paradas, 'excluidas': self.excluidas}
+
+    def __len__(self):
+        return len(self.paradas)
+
+
+class ProgramadorRotas:
+    """
+    Ordena as entregas selecionadas para um dia em um roteiro viável sobre o
+    grafo de conexões. Entre uma entrega e outra o veículo vai, vazio, do
+    destino da anterior até a origem da seguinte pelo caminho mais rápido.
+
+    - Os tempos entre as cidades do dia vêm de GrafoConexoes.tempo (matriz
+      de Floyd-Warshall ou Dijkstra com cache) e formam uma pequena matriz
+      de transições calculada uma vez por chamada.
+    - O roteiro inicial é o do vizinho mais próximo e é melhorado por busca
+      local 2-opt (inversão de trechos) e or-opt (mudança de blocos de até
+      TAMANHO_MAXIMO_SEGMENTO entregas) até não haver melhora.
+    - Se o roteiro passa de limite_minutos, retira a entrega de menor lucro
+      por minuto economizado, preservando as que vencem no próprio dia, e
+      otimiza de novo.
+    - base: cidade de onde o veículo sai; sem base, o roteiro começa na
+      origem da primeira entrega.
+    Para 20 paradas, o custo fica na casa de dezenas de milissegundos.
+    """
+    def __init__(self, grafo, limite_minutos=LIMITE_MINUTOS_DIA, base=None, estatisticas=ESTATISTICAS_DESATIVADAS):
+        self.grafo = grafo
+        self.limite_minutos = limite_minutos
+        self.base = base
+        self.estatisticas = estatisticas
+
+    def programar(self, entregas, data_atual=None):
+        """Retorna o RoteiroDiario das entregas (com data_atual, descarta as vencidas e prioriza as que vencem no dia)."""
+        with self.estatisticas.medir('roteirizacao'):
+            excluidas = []
+            candidatas = []
+            tempos = []
+            for entrega in entregas:
+                if data_atual is not None and entrega['prazo'] < data_atual:
+                    excluidas.append({'id': entrega['id'], 'motivo': 'fora_do_prazo'})
+                    continue
+                tempo = self.grafo.tempo(entrega['origem'], entrega['destino'])
+                if not tempo:
+                    excluidas.append({'id': entrega['id'], 'motivo': 'sem_caminho'})
+                    continue
+                candidatas.append(entrega)
+                tempos.append(tempo)
+            if not candidatas:
+                return RoteiroDiario([], excluidas, self.base)
+
+            transicoes = self._transicoes(candidatas, tempos)
+            urgentes = [data_atual is not None and entrega['prazo'].date() <= data_atual.date() for entrega in candidatas]
+            rota = self._melhorar(self._vizinho_mais_proximo(transicoes), transicoes)
+            custo = self._custo(rota, transicoes)
+            while custo > self.limite_minutos:
+                retirada = self._escolher_retirada(rota, custo, transicoes, candidatas, urgentes)
+                excluidas.append({'id': candidatas[retirada]['id'], 'motivo': 'limite_diario'})
+                rota.remove(retirada)
+                if not rota:
+                    break
+                rota = self._melhorar(rota, transicoes)
+                custo = self._custo(rota, transicoes)
+            self.estatisticas.contar('paradas_roteirizadas', len(rota))
+            return RoteiroDiario(self._paradas(rota, candidatas, tempos, transicoes), excluidas, self.base)
+
+    def _transicoes(self, candidatas, tempos):
+        """
+        Matriz (n + 1) x n: transicoes[i][j] é o tempo do fim da entrega i
+        (destino) até o fim da entrega j (deslocamento + tempo de j); a
+        última linha parte da base.
+        """
+        def distancia(origem, destino):
+            tempo = self.grafo.tempo(origem, destino)
+            return _INFINITO if tempo is None else tempo
+
+        transicoes = []
+        for anterior in candidatas:
+            transicoes.append([distancia(anterior['destino'], entrega['origem']) + tempo
+                               for entrega, tempo in zip(candidatas, tempos)])
+        if self.base is None:
+            transicoes.append(list(tempos))
+        else:
+            transicoes.append([distancia(self.base, entrega['origem']) + tempo
+                               for entrega, tempo in zip(candidatas, tempos)])
+        return transicoes
+
+    @staticmethod
+    def _custo(rota, transicoes):
+        if not rota:
+            return 0
+        custo = transicoes[-1][rota[0]]
+        for anterior, seguinte in zip(rota, rota[1:]):
+            custo += transicoes[anterior][seguinte]
+        return custo
+
+    @staticmethod
+    def _vizinho_mais_proximo(transicoes):
+        restantes = set(range(len(transicoes) - 1))
+        rota = []
+        atual = -1  # Linha da base
+        while restantes:
+            seguinte = min(restantes, key=lambda j: (transicoes[atual][j], j))
+            rota.append(seguinte)
+            restantes.remove(seguinte)
+            atual = seguinte
+        return rota
+
+    def _melhorar(self, rota, transicoes):
+        """Busca local (primeira melhora) com 2-opt e or-opt até um ótimo local."""
+        custo = self._custo(rota, transicoes)
+        melhorou = True
+        while melhorou:
+            melhorou = False
+            # 2-opt: inverte o trecho rota[i:j + 1] (o grafo é direcionado, então o custo é recalculado)
+            for i in range(len(rota) - 1):
+                for j in range(i + 1, len(rota)):
+                    candidata = rota[:i] + rota[i:j + 1][::-1] + rota[j + 1:]
+                    novo_custo = self._custo(candidata, transicoes)
+                    if novo_custo < custo:
+                        rota, custo, melhorou = candidata, novo_custo, True
+            # Or-opt: move um bloco de entregas seguidas para outra posição
+            for tamanho in range(1, min(TAMANHO_MAXIMO_SEGMENTO, len(rota) - 1) + 1):
+                for i in range(len(rota) - tamanho + 1):
+                    bloco = rota[i:i + tamanho]
+                    resto = rota[:i] + rota[i + tamanho:]
+                    for k in range(len(resto) + 1):
+                        if k == i:
+                            continue
+                        candidata = resto[:k] + bloco + resto[k:]
+                        novo_custo = self._custo(candidata, transicoes)
+                        if novo_custo < custo:
+                            rota, custo, melhorou = candidata, novo_custo, True
+                            break
+        return rota
+
+    def _escolher_retirada(self, rota, custo, transicoes, candidatas, urgentes):
+        """Entrega a retirar: primeiro as que não vencem no dia, com menor lucro por minuto economizado."""
+        def chave(indice):
+            sem_ela = self._custo([i for i in rota if i != indice], transicoes)
+            if sem_ela == _INFINITO:
+                economia = 0
+            elif custo == _INFINITO:
+                economia = _INFINITO
+            else:
+                economia = custo - sem_ela
+            entrega = candidatas[indice]
+            lucro = entrega['valor'] + entrega['bonus']
+            eficiencia = lucro / economia if economia > 0 else _INFINITO
+            return (urgentes[indice], eficiencia, -indice)
+        return min(rota, key=chave)
+
+    def _paradas(self, rota, candidatas, tempos, transicoes):
+        paradas = []
+        minuto = 0
+        anterior = -1
+        for ordem, indice in enumerate(rota, start=1):
+            entrega = candidatas[indice]
+            deslocamento = transicoes[anterior][indice] - tempos[indice]
+            inicio = minuto + deslocamento
+            minuto = inicio + tempos[indice]
+            paradas.append({
+                'ordem': ordem,
+                'id': entrega['id'],
+                'origem': entrega['origem'],
+                'destino': entrega['destino'],
+                'deslocamento': deslocamento,
+                'tempo': tempos[indice],
+                'inicio': inicio,
+                'fim': minuto,
+                'prazo': entrega['prazo'],
+                'lucro': entrega['valor'] + entrega['bonus']
+            })
+            anterior = indice
+        return paradas
+
+
+# Exemplo de uso
+if __name__ == "__main__":
+    from datetime import datetime
+    from SistemaEntregaIA import SistemaEntregaIA
+
+    sistema = SistemaEntregaIA()
+    sistema.ler_conexoes("conexoes.csv", usar_snapshot=True)
+    sistema.ler_entregas("entregas.csv", usar_snapshot=True)
+
+    data_atual = datetime.strptime('2023-11-15', '%Y-%m-%d')
+    entregas = sistema.algoritmo_genetico(data_atual, capacidade_diaria=10, vetorizado=True, semente=0)
+    roteiro = sistema.programar_rota(entregas, data_atual)
+
+    print("Ordem\tID\tOrigem\tDestino\tDesloc.\tTempo\tInício\tFim")
+    for parada in roteiro.paradas:
+        print(f"{parada['ordem']}\t{parada['id']}\t{parada['origem']}\t{parada['destino']}\t"
+              f"{parada['deslocamento']}\t{parada['tempo']}\t{parada['inicio']}\t{parada['fim']}")
+    print(f"\nDuração do roteiro: {roteiro.tempo_total} minutos ({roteiro.tempo_deslocamento} sem carga)")
+    print(f"Lucro do roteiro: R$ {roteiro.lucro_total:.2f}")
+    for excluida in roteiro.excluidas:
+        print(f"Fora do roteiro: {excluida['id']} ({excluida['motivo']})")
@@ -0,0 +1,363 @@
+import math
+import queue
+import threading
+import tkinter as tk
+from datetime import datetime, timedelta
+from tkinter import ttk
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+from comparacao_sistemas import ComparadorAlgoritmos
+
+INTERVALO_ATUALIZACAO_MS = 100  # Intervalo de leitura da fila de resultados pela interface
+
+class SimuladorLeilao(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        
+        self.title("Simulador de Leilão de Entregas")
+        self.geometry("1200x800")
+        
+        self.comparador = ComparadorAlgoritmos()
+        self.sistema_a = self.comparador.sistema_a
+        self.sistema_b = self.comparador.sistema_b
+        
+        # Estado da simulação em segundo plano
+        self.fila_resultados = queue.Queue()
+        self.cancelamento = threading.Event()
+        self.thread_simulacao = None
+        self.resultados = []
+        
+        self.setup_ui()
+        
+    def setup_ui(self):
+        """Configura a interface gráfica."""
+        # Frame para controles
+        frm_controles = ttk.Frame(self)
+        frm_controles.pack(pady=10, fill=tk.X)
+        
+        # Parâmetros de simulação
+        ttk.Label(frm_controles, text="Data Inicial:").grid(row=0, column=0, padx=5, pady=5)
+        self.data_var = tk.StringVar(value="2023-11-15")
+        ttk.Entry(frm_controles, textvariable=self.data_var, width=12).grid(row=0, column=1, padx=5, pady=5)
+        
+        ttk.Label(frm_controles, text="Capacidade Diária:").grid(row=0, column=2, padx=5, pady=5)
+        self.capacidade_var = tk.IntVar(value=5)
+        ttk.Spinbox(frm_controles, from_=1, to=20, textvariable=self.capacidade_var, width=5).grid(row=0, column=3, padx=5, pady=5)
+        
+        ttk.Label(frm_controles, text="Dias:").grid(row=0, column=4, padx=5, pady=5)
+        self.dias_var = tk.IntVar(value=10)
+        ttk.Spinbox(frm_controles, from_=1, to=30, textvariable=self.dias_var, width=5).grid(row=0, column=5, padx=5, pady=5)
+        
+        # Parâmetros do algoritmo genético
+        ttk.Label(frm_controles, text="Tamanho População:").grid(row=1, column=0, padx=5, pady=5)
+        self.populacao_var = tk.IntVar(value=50)
+        ttk.Spinbox(frm_controles, from_=10, to=200, textvariable=self.populacao_var, width=5).grid(row=1, column=1, padx=5, pady=5)
+        
+        ttk.Label(frm_controles, text="Gerações:").grid(row=1, column=2, padx=5, pady=5)
+        self.geracoes_var = tk.IntVar(value=100)
+        ttk.Spinbox(frm_controles, from_=10, to=500, textvariable=self.geracoes_var, width=5).grid(row=1, column=3, padx=5, pady=5)
+        
+        # Reotimização incremental: cada dia parte da população final do dia anterior
+        self.incremental_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frm_controles, text="Incremental", variable=self.incremental_var).grid(row=0, column=6, padx=5, pady=5)
+        
+        # Botões
+        ttk.Button(frm_controles, text="Carregar Dados", command=self.carregar_dados).grid(row=1, column=4, padx=5, pady=5)
+        self.btn_executar = ttk.Button(frm_controles, text="Executar Simulação", command=self.executar_simulacao)
+        self.btn_executar.grid(row=1, column=5, padx=5, pady=5)
+        self.btn_cancelar = ttk.Button(frm_controles, text="Cancelar", command=self.cancelar_simulacao, state=tk.DISABLED)
+        self.btn_cancelar.grid(row=1, column=6, padx=5, pady=5)
+        self.btn_pareto = ttk.Button(frm_controles, text="Frente de Pareto", command=self.calcular_frente_pareto)
+        self.btn_pareto.grid(row=1, column=7, padx=5, pady=5)
+        
+        # Frame para gráficos
+        self.frm_graficos = ttk.Frame(self)
+        self.frm_graficos.pack(expand=True, fill=tk.BOTH, padx=10, pady=10)
+        
+        # Frame para resultados
+        self.frm_resultados = ttk.Frame(self)
+        self.frm_resultados.pack(fill=tk.X, padx=10, pady=10)
+        
+        # Frame para exibir formato de saída
+        self.frm_saida = ttk.LabelFrame(self, text="Formato de Saída")
+        self.frm_saida.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.saida_a_var = tk.StringVar()
+        self.saida_b_var = tk.StringVar()
+        
+        ttk.Label(self.frm_saida, text="SistemaEntrega:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        ttk.Entry(self.frm_saida, textvariable=self.saida_a_var, width=60, state="readonly").grid(row=0, column=1, padx=5, pady=5)
+        
+        ttk.Label(self.frm_saida, text="SistemaEntregaIA:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        ttk.Entry(self.frm_saida, textvariable=self.saida_b_var, width=60, state="readonly").grid(row=1, column=1, padx=5, pady=5)
+        
+        # Label para status
+        self.status_var = tk.StringVar(value="Pronto para iniciar. Carregue os dados e execute a simulação.")
+        ttk.Label(self, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W).pack(fill=tk.X, side=tk.BOTTOM, padx=5, pady=5)
+    
+    def carregar_dados(self):
+        """Carrega dados de conexões e entregas."""
+        if self.thread_simulacao is not None and self.thread_simulacao.is_alive():
+            self.status_var.set("Aguarde o fim da simulação (ou cancele-a) para carregar os dados.")
+            return
+        self.status_var.set("Carregando dados...")
+        try:
+            self.sistema_a.ler_conexoes("conexoes.csv", usar_snapshot=True)
+            self.sistema_a.ler_entregas("entregas.csv", usar_snapshot=True)
+            
+            self.sistema_b.compartilhar_dados(self.sistema_a)
+            
+            self.status_var.set(f"Dados carregados: {len(self.sistema_a.conexoes)} conexões e {len(self.sistema_a.entregas)} entregas.")
+        except Exception as e:
+            self.status_var.set(f"Erro ao carregar dados: {e}")
+    
+    def executar_simulacao(self):
+        """
+        Inicia a simulação em uma thread de segundo plano. Cada dia concluído
+        é enviado pela fila e exibido por _processar_fila (chamada com after()),
+        então a janela continua respondendo durante a execução.
+        """
+        if self.thread_simulacao is not None and self.thread_simulacao.is_alive():
+            return
+        
+        try:
+            data_inicial = datetime.strptime(self.data_var.get(), '%Y-%m-%d')
+            parametros = {
+                'capacidade_diaria': self.capacidade_var.get(),
+                'tamanho_populacao': self.populacao_var.get(),
+                'geracoes': self.geracoes_var.get()
+            }
+            dias = self.dias_var.get()
+            incremental = self.incremental_var.get()
+        except (ValueError, tk.TclError) as e:
+            self.status_var.set(f"Erro na simulação: {e}")
+            return
+        
+        # Limpar gráficos anteriores
+        for widget in self.frm_graficos.winfo_children():
+            widget.destroy()
+        for widget in self.frm_resultados.winfo_children():
+            widget.destroy()
+        self._criar_area_resultados()
+        
+        self.resultados = []
+        self.fila_resultados = queue.Queue()
+        self.cancelamento = threading.Event()
+        self.btn_executar.config(state=tk.DISABLED)
+        self.btn_cancelar.config(state=tk.NORMAL)
+        self.btn_pareto.config(state=tk.DISABLED)
+        self.status_var.set("Executando simulação...")
+        
+        self.thread_simulacao = threading.Thread(
+            target=self._simular,
+            args=(data_inicial, dias, parametros, incremental, self.fila_resultados, self.cancelamento),
+            daemon=True
+        )
+        self.thread_simulacao.start()
+        self.after(INTERVALO_ATUALIZACAO_MS, self._processar_fila)
+    
+    def cancelar_simulacao(self):
+        """Pede o cancelamento (simulação ou frente de Pareto); o algoritmo para ao fim da geração em andamento."""
+        self.cancelamento.set()
+        self.btn_cancelar.config(state=tk.DISABLED)
+        self.status_var.set("Cancelando...")
+    
+    def _simular(self, data_inicial, dias, parametros, incremental, fila, cancelamento):
+        """Executado na thread de segundo plano: não acessa widgets, só publica mensagens na fila."""
+        try:
+            data_atual = data_inicial
+            for dia in range(1, dias + 1):
+                if cancelamento.is_set():
+                    fila.put(('cancelado', dia - 1))
+                    return
+                continuar = incremental and dia > 1
+                resultado = self.comparador.executar_dia(dia, data_atual, continuar=continuar,
+                                                         cancelar=cancelamento.is_set, **parametros)
+                if cancelamento.is_set():
+                    # O dia foi interrompido no meio: não é publicado
+                    fila.put(('cancelado', dia - 1))
+                    return
+                fila.put(('dia', resultado))
+                
+                # Avançar para o próximo dia
+                data_atual += timedelta(days=1)
+            fila.put(('fim', dias))
+        except Exception as e:
+            fila.put(('erro', e))
+    
+    def calcular_frente_pareto(self):
+        """
+        Calcula em segundo plano a frente de Pareto lucro x tempo da data
+        inicial (modo NSGA-II do SistemaEntregaIA) e a mostra em uma janela,
+        junto das soluções dos dois algoritmos nesse dia, se já simulado.
+        """
+        if self.thread_simulacao is not None and self.thread_simulacao.is_alive():
+            return
+        
+        try:
+            data_inicial = datetime.strptime(self.data_var.get(), '%Y-%m-%d')
+            parametros = {
+                'capacidade_diaria': self.capacidade_var.get(),
+                'tamanho_populacao': self.populacao_var.get(),
+                'geracoes': self.geracoes_var.get()
+            }
+        except (ValueError, tk.TclError) as e:
+            self.status_var.set(f"Erro no cálculo da frente de Pareto: {e}")
+            return
+        
+        self.fila_resultados = queue.Queue()
+        self.cancelamento = threading.Event()
+        self.btn_executar.config(state=tk.DISABLED)
+        self.btn_cancelar.config(state=tk.NORMAL)
+        self.btn_pareto.config(state=tk.DISABLED)
+        self.status_var.set("Calculando a frente de Pareto...")
+        
+        self.thread_simulacao = threading.Thread(
+            target=self._calcular_pareto,
+            args=(data_inicial, parametros, self.fila_resultados, self.cancelamento),
+            daemon=True
+        )
+        self.thread_simulacao.start()
+        self.after(INTERVALO_ATUALIZACAO_MS, self._processar_fila)
+    
+    def _calcular_pareto(self, data_inicial, parametros, fila, cancelamento):
+        """Executado na thread de segundo plano, como _simular."""
+        try:
+            frente = self.comparador.executar_frente_pareto(data_inicial, cancelar=cancelamento.is_set, **parametros)
+            # Interrompida no meio, a frente é parcial: não é exibida
+            fila.put(('pareto_cancelado', None) if cancelamento.is_set() else ('pareto', frente))
+        except Exception as e:
+            fila.put(('erro', e))
+    
+    def _exibir_frente_pareto(self):
+        janela = tk.Toplevel(self)
+        janela.title("Frente de Pareto: Lucro x Tempo")
+        figura = Figure(figsize=(8, 6), dpi=100)
+        self.comparador.resultados = self.resultados
+        self.comparador.desenhar_frente_pareto(figura)
+        canvas = FigureCanvasTkAgg(figura, janela)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas.draw_idle()
+    
+    def _processar_fila(self):
+        """Aplica na interface as mensagens da simulação e se reagenda enquanto ela não termina."""
+        novos_dias = False
+        try:
+            while True:
+                tipo, conteudo = self.fila_resultados.get_nowait()
+                if tipo == 'dia':
+                    self.resultados.append(conteudo)
+                    novos_dias = True
+                    continue
+                
+                if novos_dias:
+                    self._atualizar_resultados()
+                if tipo == 'fim':
+                    self.status_var.set(f"Simulação concluída. Mostrando resultados para {conteudo} dias.")
+                elif tipo == 'cancelado':
+                    self.status_var.set(f"Simulação cancelada após {conteudo} dias.")
+                elif tipo == 'pareto_cancelado':
+                    self.status_var.set("Cálculo da frente de Pareto cancelado.")
+                elif tipo == 'pareto':
+                    self._exibir_frente_pareto()
+                    self.status_var.set(f"Frente de Pareto de {conteudo['data']}: {len(conteudo['solucoes'])} soluções não dominadas.")
+                else:
+                    self.status_var.set(f"Erro na simulação: {conteudo}")
+                self.btn_executar.config(state=tk.NORMAL)
+                self.btn_cancelar.config(state=tk.DISABLED)
+                self.btn_pareto.config(state=tk.NORMAL)
+                return
+        except queue.Empty:
+            pass
+        
+        if novos_dias:
+            self._atualizar_resultados()
+            if not self.cancelamento.is_set():
+                self.status_var.set(f"Executando simulação... dia {len(self.resultados)}/{self.dias_var.get()} concluído.")
+        self.after(INTERVALO_ATUALIZACAO_MS, self._processar_fila)
+    
+    def _criar_area_resultados(self):
+        """Cria a figura dos gráficos e a tabela de resultados, preenchidas a cada dia concluído."""
+        self.figura = Figure(figsize=(12, 8), dpi=100)
+        self.canvas = FigureCanvasTkAgg(self.figura, self.frm_graficos)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Exibir resultados em tabela
+        style = ttk.Style()
+        style.configure("Treeview", rowheight=25)
+        
+        tree = ttk.Treeview(self.frm_resultados, columns=("algoritmo", "lucro", "tempo_exec", "tempo_entrega", "eficiencia", "bonus"))
+        tree.heading("#0", text="")
+        tree.heading("algoritmo", text="Algoritmo")
+        tree.heading("lucro", text="Lucro Total (R$)")
+        tree.heading("tempo_exec", text="Tempo Médio de Execução (s)")
+        tree.heading("tempo_entrega", text="Tempo Total de Entrega (min)")
+        tree.heading("eficiencia", text="Eficiência Média (R$/min)")
+        tree.heading("bonus", text="Bônus Médio por Entrega (R$)")
+        
+        tree.column("#0", width=0, stretch=tk.NO)
+        tree.column("algoritmo", width=150)
+        tree.column("lucro", width=120)
+        tree.column("tempo_exec", width=180)
+        tree.column("tempo_entrega", width=180)
+        tree.column("eficiencia", width=150)
+        tree.column("bonus", width=150)
+        
+        tree.pack(fill=tk.X, expand=True)
+        self.tree = tree
+    
+    def _atualizar_resultados(self):
+        """Redesenha os gráficos e recalcula a tabela com os dias recebidos até agora."""
+        self.comparador.resultados = self.resultados
+        self.figura.clear()
+        self.comparador.desenhar_graficos(self.figura)
+        self.canvas.draw_idle()
+        
+        # Atualizar os campos de saída na interface com o primeiro dia
+        self.saida_a_var.set(self.resultados[0]['rotas_a'])
+        self.saida_b_var.set(self.resultados[0]['rotas_b'])
+        
+        resumo = self.comparador.resumo_comparativo()
+        eficiencia_a = self._eficiencia_media('a')
+        eficiencia_b = self._eficiencia_media('b')
+        # Bônus médio das entregas do último dia
+        bonus_medio_a = self.resultados[-1]['bonus_medio_a']
+        bonus_medio_b = self.resultados[-1]['bonus_medio_b']
+        
+        self.tree.delete(*self.tree.get_children())
+        self.tree.insert("", tk.END, text="1", values=("SistemaEntrega", 
+                                                        f"{resumo['lucro_total_a']:.2f}", 
+                                                        f"{resumo['tempo_exec_medio_a']:.4f}",
+                                                        f"{resumo['tempo_entrega_total_a']}",
+                                                        f"{eficiencia_a:.2f}",
+                                                        f"{bonus_medio_a:.2f}"))
+        
+        self.tree.insert("", tk.END, text="2", values=("SistemaEntregaIA", 
+                                                        f"{resumo['lucro_total_b']:.2f}", 
+                                                        f"{resumo['tempo_exec_medio_b']:.4f}",
+                                                        f"{resumo['tempo_entrega_total_b']}",
+                                                        f"{eficiencia_b:.2f}",
+                                                        f"{bonus_medio_b:.2f}"))
+        
+        self.tree.insert("", tk.END, text="3", values=("Diferença (%)", 
+                                                        _percentual(resumo['melhoria_lucro']), 
+                                                        "---",
+                                                        _percentual(resumo['reducao_tempo_entrega']),
+                                                        _percentual((eficiencia_b / eficiencia_a - 1) * 100 if eficiencia_a else None),
+                                                        _percentual((bonus_medio_b / bonus_medio_a - 1) * 100 if bonus_medio_a else None)))
+    
+    def _eficiencia_media(self, sufixo):
+        """Média diária de lucro/tempo de entrega, ignorando dias sem tempo de entrega."""
+        valores = [r[f'lucro_{sufixo}'] / r[f'tempo_entrega_{sufixo}']
+                   for r in self.resultados if r[f'tempo_entrega_{sufixo}']]
+        return sum(valores) / len(valores) if valores else math.nan
+
+def _percentual(valor):
+    return f"{valor:.2f}%" if valor is not None and not math.isnan(valor) else "---"
+
+# Executar a aplicação
+if __name__ == "__main__":
+    app = SimuladorLeilao()
+    app.mainloop()
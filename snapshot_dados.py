@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+from armazem_colunar import CAMPOS_ENTREGA, ArmazemConexoes, ArmazemEntregas
+from leitura_csv import iterar_conexoes, ler_entregas_em_blocos
+
+VERSAO_SNAPSHOT = 1
+SUFIXO_SNAPSHOT = '.snapshot'
+COLUNAS_CONEXOES = ('origem', 'destino', 'tempo')
+
+
+def caminho_snapshot(arquivo):
+    """Diretório do snapshot binário de um CSV (ao lado do arquivo)."""
+    return arquivo + SUFIXO_SNAPSHOT
+
+
+def _hash_arquivo(arquivo):
+    resumo = hashlib.blake2b(digest_size=20)
+    with open(arquivo, 'rb') as file:
+        for bloco in iter(lambda: file.read(1 << 20), b''):
+            resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+def _assinatura(arquivo, calcular_hash=True):
+    estado = os.stat(arquivo)
+    return {
+        'tamanho': estado.st_size,
+        'mtime_ns': estado.st_mtime_ns,
+        'hash': _hash_arquivo(arquivo) if calcular_hash else None
+    }
+
+
+def _snapshot_valido(arquivo, tipo):
+    """
+    Retorna os metadados do snapshot se ele corresponder ao CSV atual, senão None.
+    Tamanho e mtime iguais bastam; se só o mtime mudou, o hash do conteúdo decide.
+    """
+    try:
+        with open(os.path.join(caminho_snapshot(arquivo), 'meta.json'), 'r') as file:
+            meta = json.load(file)
+        atual = _assinatura(arquivo, calcular_hash=False)
+    except (OSError, ValueError):
+        return None
+
+    origem = meta.get('origem', {})
+    if meta.get('versao') != VERSAO_SNAPSHOT or meta.get('tipo') != tipo:
+        return None
+    if origem.get('tamanho') != atual['tamanho']:
+        return None
+    if origem.get('mtime_ns') != atual['mtime_ns']:
+        atual['hash'] = _hash_arquivo(arquivo)
+        if origem.get('hash') != atual['hash']:
+            return None
+        # Conteúdo igual: registra o novo mtime para não recalcular o hash na próxima vez
+        meta['origem'] = atual
+        try:
+            with open(os.path.join(caminho_snapshot(arquivo), 'meta.json'), 'w') as file:
+                json.dump(meta, file)
+        except OSError:
+            pass
+    return meta
+
+
+def _salvar(arquivo, tipo, colunas, nomes_cidades):
+    """Grava as colunas em .npy e a tabela de cidades, trocando o diretório de forma atômica."""
+    destino = caminho_snapshot(arquivo)
+    temporario = destino + '.tmp'
+    shutil.rmtree(temporario, ignore_errors=True)
+    os.makedirs(temporario)
+
+    for nome, coluna in colunas.items():
+        np.save(os.path.join(temporario, f'{nome}.npy'), np.ascontiguousarray(coluna))
+    with open(os.path.join(temporario, 'cidades.json'), 'w') as file:
+        json.dump(nomes_cidades, file)
+    with open(os.path.join(temporario, 'meta.json'), 'w') as file:
+        json.dump({'versao': VERSAO_SNAPSHOT, 'tipo': tipo, 'origem': _assinatura(arquivo)}, file)
+
+    shutil.rmtree(destino, ignore_errors=True)
+    os.replace(temporario, destino)
+
+
+def _carregar_colunas(arquivo, nomes_colunas, mmap_mode):
+    diretorio = caminho_snapshot(arquivo)
+    colunas = {nome: np.load(os.path.join(diretorio, f'{nome}.npy'), mmap_mode=mmap_mode)
+               for nome in nomes_colunas}
+    with open(os.path.join(diretorio, 'cidades.json'), 'r') as file:
+        nomes_cidades = json.load(file)
+    return colunas, nomes_cidades
+
+
+def ler_entregas_com_snapshot(arquivo, relatorio=None):
+    """
+    Retorna um ArmazemEntregas do CSV. Se existir um snapshot válido, as
+    colunas são mapeadas em memória (np.load com mmap_mode='r'), sem
+    reprocessar o CSV e compartilhando as páginas entre processos; senão o
+    CSV é lido e o snapshot é gravado para as próximas execuções.
+    """
+    armazem = ArmazemEntregas()
+    if _snapshot_valido(arquivo, 'entregas'):
+        colunas, nomes_cidades = _carregar_colunas(arquivo, CAMPOS_ENTREGA, mmap_mode='r')
+        armazem.adicionar_colunas(colunas, nomes_cidades)
+        return armazem
+
+    for bloco in ler_entregas_em_blocos(arquivo, relatorio=relatorio):
+        armazem.adicionar_varias(bloco)
+    colunas = {nome: armazem.coluna(nome) for nome in CAMPOS_ENTREGA}
+    try:
+        _salvar(arquivo, 'entregas', colunas, armazem.cidades.nomes)
+    except OSError as e:
+        print(f"Aviso: não foi possível gravar o snapshot de {arquivo}: {e}")
+    return armazem
+
+
+def ler_conexoes_com_snapshot(arquivo, relatorio=None):
+    """Retorna um ArmazemConexoes do CSV, usando ou criando o snapshot binário."""
+    conexoes = ArmazemConexoes()
+    if _snapshot_valido(arquivo, 'conexoes'):
+        colunas, nomes_cidades = _carregar_colunas(arquivo, COLUNAS_CONEXOES, mmap_mode=None)
+        for nome in nomes_cidades:
+            conexoes.cidades.codigo(nome)
+        for nome in COLUNAS_CONEXOES:
+            getattr(conexoes, nome).frombytes(colunas[nome].astype(np.int32).tobytes())
+        return conexoes
+
+    for conexao in iterar_conexoes(arquivo, relatorio):
+        conexoes.append(conexao)
+    colunas = {nome: np.frombuffer(getattr(conexoes, nome), dtype=np.int32).copy()
+               for nome in COLUNAS_CONEXOES}
+    try:
+        _salvar(arquivo, 'conexoes', colunas, conexoes.cidades.nomes)
+    except OSError as e:
+        print(f"Aviso: não foi possível gravar o snapshot de {arquivo}: {e}")
+    return conexoes
@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from SistemaEntregaIA import SistemaEntregaIA  # noqa: E402
+
+
+@pytest.fixture
+def sistema():
+    """SistemaEntregaIA com as conexões e entregas de exemplo do repositório."""
+    sistema = SistemaEntregaIA()
+    sistema.ler_conexoes(os.path.join(RAIZ, "conexoes.csv"))
+    sistema.ler_entregas(os.path.join(RAIZ, "entregas.csv"))
+    return sistema
+
+
+@pytest.fixture(scope='session')
+def dados_sinteticos(tmp_path_factory):
+    """Diretório com conexoes.csv e entregas.csv sintéticos (grafo esparso, 300 entregas)."""
+    from gerador_dados import gerar_dados
+    diretorio = tmp_path_factory.mktemp('dados')
+    gerar_dados(str(diretorio), cidades=20, entregas=300, grafo='esparso', semente=3)
+    return diretorio
+
+
+@pytest.fixture
+def sistema_sintetico(dados_sinteticos):
+    sistema = SistemaEntregaIA()
+    sistema.ler_conexoes(str(dados_sinteticos / "conexoes.csv"))
+    sistema.ler_entregas(str(dados_sinteticos / "entregas.csv"))
+    return sistema
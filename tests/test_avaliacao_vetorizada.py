@@ -0,0 +1,54 @@
+import random
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from avaliacao_vetorizada import AvaliadorVetorizado
+from operadores_geneticos import OperadoresGeneticos
+from SistemaEntregaIA import SistemaEntregaIA
+
+OPERADORES = [
+    OperadoresGeneticos(),
+    OperadoresGeneticos(selecao='torneio', cruzamento='uniforme'),
+    OperadoresGeneticos(selecao='roleta', tamanho_elite=3, taxa_mutacao=0.5),
+]
+
+
+def test_avaliacao_vetorizada_igual_a_escalar(sistema_sintetico):
+    data_atual = datetime(2023, 11, 18)
+    indices = sistema_sintetico.repositorio.indices_validos(data_atual)
+    entregas = sistema_sintetico.repositorio.registros(indices)
+    avaliador = AvaliadorVetorizado.do_armazem(sistema_sintetico.repositorio.armazem, indices,
+                                               sistema_sintetico.calcular_tempo_entrega)
+    rng = random.Random(0)
+    # Avalia num dia posterior para incluir genes fora do prazo
+    for dia in (data_atual, datetime(2023, 11, 24)):
+        populacao = [rng.sample(range(len(indices)), 8) for _ in range(200)]
+        tempos, lucros = avaliador.avaliar_populacao(populacao, dia)
+        for individuo, tempo, lucro in zip(populacao, tempos.tolist(), lucros.tolist()):
+            assert (tempo, lucro) == sistema_sintetico.avaliar_solucao([entregas[i]['id'] for i in individuo], dia)
+
+
+@pytest.mark.parametrize('limite', [None, 1, 10, 60])
+def test_ranqueamento_vetorizado_igual_ao_escalar(limite):
+    rng = np.random.default_rng(1)
+    # Poucos valores distintos: muitos empates
+    tempos = rng.integers(0, 5, size=100)
+    lucros = rng.integers(0, 5, size=100).astype(np.float64)
+    ordem, melhor = AvaliadorVetorizado.ranquear(tempos, lucros, limite)
+    ordem_escalar, melhor_escalar = SistemaEntregaIA._ranquear(tempos.tolist(), lucros.tolist(), limite)
+    assert ordem == list(ordem_escalar)
+    assert melhor == melhor_escalar
+
+
+@pytest.mark.parametrize('operadores', OPERADORES, ids=lambda o: o.descricao())
+@pytest.mark.parametrize('semente', [0, 7])
+def test_algoritmo_genetico_vetorizado_igual_ao_escalar(sistema_sintetico, operadores, semente):
+    for dia in (15, 20, 27):
+        data_atual = datetime(2023, 11, dia)
+        escalar = sistema_sintetico.algoritmo_genetico(data_atual, geracoes=30, capacidade_diaria=6, semente=semente,
+                                                       operadores=operadores)
+        vetorizado = sistema_sintetico.algoritmo_genetico(data_atual, geracoes=30, capacidade_diaria=6, semente=semente,
+                                                          vetorizado=True, operadores=operadores)
+        assert [e['id'] for e in vetorizado] == [e['id'] for e in escalar]
@@ -0,0 +1,36 @@
+import itertools
+import random
+from datetime import datetime
+
+import pytest
+
+from avaliacao_vetorizada import AvaliadorVetorizado
+from cache_avaliacao import CacheAvaliacao
+
+
+@pytest.mark.parametrize('semente', range(4))
+def test_cache_nao_muda_o_resultado(sistema_sintetico, semente):
+    for dia in (15, 17, 19):
+        data_atual = datetime(2023, 11, dia)
+        sem_cache = sistema_sintetico.algoritmo_genetico(data_atual, geracoes=60, semente=semente)
+        sistema_sintetico.cache_avaliacao.limpar()
+        com_cache = sistema_sintetico.algoritmo_genetico(data_atual, geracoes=60, semente=semente, usar_cache=True)
+        assert [e['id'] for e in com_cache] == [e['id'] for e in sem_cache]
+    assert sistema_sintetico.cache_avaliacao.acertos > 0
+
+
+def test_permutacoes_dividem_a_entrada_com_o_mesmo_valor(sistema_sintetico):
+    data_atual = datetime(2023, 11, 15)
+    indices = sistema_sintetico.repositorio.indices_validos(data_atual)
+    entregas = sistema_sintetico.repositorio.registros(indices)
+    avaliador = AvaliadorVetorizado.do_armazem(sistema_sintetico.repositorio.armazem, indices,
+                                               sistema_sintetico.calcular_tempo_entrega)
+    rng = random.Random(1)
+    for _ in range(50):
+        solucao = rng.sample(range(len(entregas)), 5)
+        permutacoes = [list(p) for p in itertools.islice(itertools.permutations(solucao), 0, None, 7)]
+        avaliacoes = {sistema_sintetico.avaliar_solucao([entregas[i]['id'] for i in p], data_atual) for p in permutacoes}
+        assert len(avaliacoes) == 1  # Bit a bit, não só aproximadamente
+        tempos, lucros = avaliador.avaliar_populacao(permutacoes, data_atual)
+        assert {(int(t), float(l)) for t, l in zip(tempos, lucros)} == avaliacoes
+        assert len({CacheAvaliacao.chave([entregas[i]['id'] for i in p], data_atual) for p in permutacoes}) == 1
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+import pytest
+
+from frota import Veiculo
+
+DATA = datetime(2023, 11, 16)
+
+
+def ids(entregas):
+    return [e['id'] for e in entregas]
+
+
+@pytest.fixture
+def veiculos():
+    return [Veiculo('v1', capacidade=3, base='A'), Veiculo('v2', capacidade=5, base='F'),
+            Veiculo('v3', capacidade=4, base='K'), Veiculo('v4', capacidade=2)]
+
+
+def test_frota_independe_do_numero_de_workers(sistema_sintetico, veiculos):
+    resultados = []
+    for workers in (1, 2, 4):
+        selecoes = sistema_sintetico.algoritmo_genetico_frota(DATA, veiculos, tamanho_populacao=20,
+                                                              geracoes_por_rodada=5, rodadas=3, workers=workers,
+                                                              semente=2)
+        resultados.append({veiculo: ids(entregas) for veiculo, entregas in selecoes.items()})
+    assert resultados[1] == resultados[0]
+    assert resultados[2] == resultados[0]
+
+
+def test_frota_respeita_capacidades_sem_repetir_entregas(sistema_sintetico, veiculos):
+    selecoes = sistema_sintetico.algoritmo_genetico_frota(DATA, veiculos, tamanho_populacao=20, geracoes_por_rodada=5,
+                                                          rodadas=3, workers=1, semente=2)
+    escolhidas = [e['id'] for entregas in selecoes.values() for e in entregas]
+    assert len(escolhidas) == len(set(escolhidas))
+    for veiculo in veiculos:
+        assert 0 < len(selecoes[veiculo.id]) <= veiculo.capacidade
+        assert all(e['prazo'] >= DATA for e in selecoes[veiculo.id])
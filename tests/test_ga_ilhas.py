@@ -0,0 +1,16 @@
+from datetime import datetime
+
+DATA = datetime(2023, 11, 16)
+
+
+def ids(entregas):
+    return [e['id'] for e in entregas]
+
+
+def test_ilhas_independem_do_numero_de_workers(sistema_sintetico):
+    resultados = [ids(sistema_sintetico.algoritmo_genetico_ilhas(DATA, tamanho_populacao=30, geracoes=20, ilhas=3,
+                                                                 workers=workers, intervalo_migracao=5, semente=4))
+                  for workers in (1, 2, 3)]
+    assert resultados[0]
+    assert resultados[1] == resultados[0]
+    assert resultados[2] == resultados[0]
@@ -0,0 +1,65 @@
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import grafo_conexoes
+from grafo_conexoes import LIMITE_MATRIZ, GrafoConexoes
+from instrumentacao import EstatisticasExecucao
+
+
+def test_cache_de_pares_e_limitado(monkeypatch):
+    monkeypatch.setattr(grafo_conexoes, 'MAX_PARES_EM_CACHE', 5)
+    grafo = GrafoConexoes()
+    cidades = [f"C{i}" for i in range(6)]
+    for origem, destino in zip(cidades, cidades[1:]):
+        grafo.adicionar(origem, destino, 10)
+    for origem in cidades:
+        for destino in cidades:
+            esperado = 10 * (cidades.index(destino) - cidades.index(origem))
+            assert grafo.tempo(origem, destino) == (esperado if esperado >= 0 else None)
+            assert len(grafo._menores_tempos) <= 5
+    grafo.adicionar('C5', 'C0', 10)
+    assert not grafo._menores_tempos
+    assert grafo.tempo('C5', 'C1') == 20
+
+
+def test_consultas_concorrentes(monkeypatch):
+    # Leilão online: lances consultam o grafo na thread do loop enquanto o GA roda em outra
+    monkeypatch.setattr(grafo_conexoes, 'MAX_PARES_EM_CACHE', 5)
+    monkeypatch.setattr(grafo_conexoes, 'MAX_ORIGENS_EM_CACHE', 2)
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    cidades = [f"C{i}" for i in range(8)]
+    esperados = {(o, d): 10 * (j - i) if j >= i else None
+                 for i, o in enumerate(cidades) for j, d in enumerate(cidades)}
+    pares = list(esperados) * 50
+    try:
+        for limite_matriz in (LIMITE_MATRIZ, 0):
+            grafo = GrafoConexoes(limite_matriz=limite_matriz)
+            for origem, destino in zip(cidades, cidades[1:]):
+                grafo.adicionar(origem, destino, 10)
+            estatisticas = EstatisticasExecucao()
+
+            def consultar(deslocamento):
+                for origem, destino in pares[deslocamento:] + pares[:deslocamento]:
+                    with estatisticas.medir('consulta_tempo'):
+                        assert grafo.tempo(origem, destino) == esperados[(origem, destino)]
+                    estatisticas.contar('consultas')
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(consultar, range(0, 8 * 7, 7)))
+            assert estatisticas.contadores['consultas'] == 8 * len(pares)
+            assert estatisticas.chamadas['consulta_tempo'] == 8 * len(pares)
+            assert len(grafo._menores_tempos) <= 5
+    finally:
+        sys.setswitchinterval(intervalo)
+
+
+def test_grafo_serializavel():
+    grafo = GrafoConexoes()
+    grafo.adicionar('A', 'B', 10)
+    grafo.adicionar('B', 'C', 5)
+    copia = pickle.loads(pickle.dumps(grafo))
+    assert copia.tempo('A', 'C') == 15
+    copia.adicionar('C', 'A', 1)
+    assert copia.tempo('C', 'B') == 11
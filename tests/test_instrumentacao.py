@@ -0,0 +1,64 @@
+import json
+import tracemalloc
+from datetime import datetime
+
+import pytest
+
+from instrumentacao import ESTATISTICAS_DESATIVADAS, instrumentar
+from operadores_geneticos import OPERADORES_PADRAO
+
+
+def test_instrumentar_registra_etapas_e_contadores(sistema_sintetico):
+    populacao, geracoes = 20, 5
+    with instrumentar(sistema_sintetico) as estatisticas:
+        assert sistema_sintetico.estatisticas is estatisticas
+        sistema_sintetico.algoritmo_genetico(datetime(2023, 11, 15), populacao, geracoes, semente=0)
+
+    filhos_por_geracao = populacao - OPERADORES_PADRAO.tamanho_elite
+    assert estatisticas.chamadas['filtro'] == 1
+    assert estatisticas.chamadas['avaliacao_fitness'] == geracoes
+    assert estatisticas.chamadas['ranqueamento'] == geracoes
+    assert estatisticas.chamadas['cruzamento_mutacao'] == geracoes
+    assert estatisticas.chamadas['consulta_tempo'] > 0
+    assert all(tempo > 0 for tempo in estatisticas.tempos_ns.values())
+    assert estatisticas.contadores['individuos_avaliados'] == populacao * geracoes
+    assert estatisticas.contadores['filhos_gerados'] == filhos_por_geracao * geracoes
+    assert estatisticas.contadores['entregas_validas'] == len(sistema_sintetico.repositorio.indices_validos(datetime(2023, 11, 15)))
+    dados = json.loads(json.dumps(estatisticas.como_dicionario()))
+    assert dados['etapas']['avaliacao_fitness']['chamadas'] == geracoes
+    assert 'avaliacao_fitness' in estatisticas.resumo()
+
+
+def test_estatisticas_desativadas_voltam_ao_sair(sistema_sintetico, sistema):
+    with instrumentar(sistema_sintetico, sistema) as estatisticas:
+        assert sistema.estatisticas is sistema_sintetico.estatisticas is estatisticas
+    assert sistema_sintetico.estatisticas is ESTATISTICAS_DESATIVADAS
+    assert sistema.estatisticas is ESTATISTICAS_DESATIVADAS
+
+    with pytest.raises(RuntimeError):
+        with instrumentar(sistema_sintetico):
+            raise RuntimeError("falha no meio da execução")
+    assert sistema_sintetico.estatisticas is ESTATISTICAS_DESATIVADAS
+
+    # Aninhado: ao sair do bloco interno volta a instrumentação externa
+    with instrumentar(sistema_sintetico) as externa:
+        with instrumentar(sistema_sintetico):
+            pass
+        assert sistema_sintetico.estatisticas is externa
+    assert sistema_sintetico.estatisticas is ESTATISTICAS_DESATIVADAS
+
+
+def test_perfil_e_memoria(sistema_sintetico):
+    tracemalloc_ativo = tracemalloc.is_tracing()
+    with instrumentar(sistema_sintetico, perfil=True, memoria=True) as estatisticas:
+        sistema_sintetico.algoritmo_genetico(datetime(2023, 11, 15), 20, 3, semente=0)
+    assert estatisticas.perfil is not None and estatisticas.perfil.total_calls > 0
+    assert 'algoritmo_genetico' in estatisticas.relatorio_perfil(limite=50)
+    assert estatisticas.memoria_pico > 0
+    assert estatisticas.como_dicionario()['memoria_pico'] == estatisticas.memoria_pico
+    assert tracemalloc.is_tracing() == tracemalloc_ativo
+
+    with instrumentar(sistema_sintetico) as sem_captura:
+        pass
+    assert sem_captura.perfil is None and sem_captura.memoria_pico is None
+    assert sem_captura.relatorio_perfil() == ""
@@ -0,0 +1,61 @@
+import asyncio
+from datetime import datetime
+
+from leilao_online import MotorLeilao
+
+CABECALHO = "id,origem,destino,prazo,valor,bonus\n"
+
+
+def test_acompanhar_arquivo_espera_o_cabecalho(sistema, tmp_path):
+    arquivo = tmp_path / "novas.csv"
+    arquivo.write_text("")
+    motor = MotorLeilao(sistema, datetime(2023, 11, 15))
+
+    async def produtor():
+        await asyncio.sleep(0.05)
+        with open(arquivo, 'a', newline='') as file:
+            file.write(CABECALHO[:10])
+        await asyncio.sleep(0.05)
+        with open(arquivo, 'a', newline='') as file:
+            file.write(CABECALHO[10:] + "N001,A,B,2023-11-20,100.0,20.0\n")
+        await asyncio.sleep(0.05)
+        motor.parar()
+
+    async def cenario():
+        await asyncio.gather(motor.executar(), motor.acompanhar_arquivo(str(arquivo), intervalo=0.01, do_inicio=True),
+                             produtor())
+
+    try:
+        asyncio.run(cenario())
+    finally:
+        motor.fechar()
+    assert motor.relatorio.linhas_aceitas == 1
+    assert motor.relatorio.total_erros == 0
+
+
+def test_acompanhar_arquivo_com_caractere_dividido_entre_escritas(sistema, tmp_path):
+    arquivo = tmp_path / "novas.csv"
+    arquivo.write_bytes(CABECALHO.encode('utf-8'))
+    linha = "N002,São Paulo,B,2023-11-20,100.0,20.0\n".encode('utf-8')
+    corte = linha.index("ã".encode('utf-8')) + 1  # Entre os dois bytes de 'ã'
+    motor = MotorLeilao(sistema, datetime(2023, 11, 15))
+
+    async def produtor():
+        for parte in (linha[:corte], linha[corte:]):
+            await asyncio.sleep(0.05)
+            with open(arquivo, 'ab') as file:
+                file.write(parte)
+        await asyncio.sleep(0.05)
+        motor.parar()
+
+    async def cenario():
+        await asyncio.gather(motor.executar(), motor.acompanhar_arquivo(str(arquivo), intervalo=0.01, do_inicio=True),
+                             produtor())
+
+    try:
+        asyncio.run(cenario())
+    finally:
+        motor.fechar()
+    assert motor.relatorio.total_erros == 0
+    assert motor.relatorio.linhas_aceitas == 1
+    assert sistema.repositorio.obter('N002')['origem'] == 'São Paulo'
@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+
+from leitura_csv import RelatorioLeitura, iterar_entregas, ler_entregas_em_blocos
+
+CABECALHO = "id,origem,destino,prazo,valor,bonus\n"
+
+
+def _escrever(tmp_path, linhas):
+    arquivo = tmp_path / "entregas.csv"
+    arquivo.write_text(CABECALHO + "".join(linha + "\n" for linha in linhas))
+    return str(arquivo)
+
+
+def test_linhas_invalidas_sao_ignoradas_com_linha_e_motivo(tmp_path):
+    arquivo = _escrever(tmp_path, [
+        "E1,A,B,2023-11-20,100.0,10.0",   # linha 2
+        "E2,A,B,2023-11-20",              # linha 3: colunas faltando
+        "",                               # linha 4: vazia, não conta
+        "E3,A,B,20/11/2023,100.0,10.0",   # linha 5: data inválida
+        "E4,A,B,2023-11-20,cem,10.0",     # linha 6: valor inválido
+        "E5,B,A,2023-11-21,50.0,5.0",     # linha 7
+    ])
+    relatorio = RelatorioLeitura()
+    entregas = list(iterar_entregas(arquivo, relatorio=relatorio))
+
+    assert [e['id'] for e in entregas] == ['E1', 'E5']
+    assert entregas[1] == {'id': 'E5', 'origem': 'B', 'destino': 'A', 'prazo': datetime(2023, 11, 21),
+                           'valor': 50.0, 'bonus': 5.0}
+    assert (relatorio.linhas_lidas, relatorio.linhas_aceitas, relatorio.total_erros) == (5, 2, 3)
+    assert [numero for numero, _ in relatorio.erros] == [3, 5, 6]
+    assert relatorio.erros[0][1] == "colunas faltando"
+    assert "20/11/2023" in relatorio.erros[1][1]
+    assert "cem" in relatorio.erros[2][1]
+    assert "linha 5" in relatorio.resumo()
+
+
+def test_prazo_minimo_descarta_antes_de_converter(tmp_path):
+    arquivo = _escrever(tmp_path, [
+        "E1,A,B,2023-11-10,cem,10.0",     # Vencida: o valor inválido nem é convertido
+        "E2,A,B,2023-11-15,100.0,10.0",
+        "E3,A,B,2023-11-14,100.0,10.0",
+        "E4,A,B,2023-11-1X,100.0,10.0",   # Prazo inválido continua sendo erro
+        "E5,A,B,2023-12-01,100.0,10.0",
+    ])
+    relatorio = RelatorioLeitura()
+    entregas = list(iterar_entregas(arquivo, prazo_minimo=datetime(2023, 11, 15), relatorio=relatorio))
+
+    assert [e['id'] for e in entregas] == ['E2', 'E5']
+    assert relatorio.linhas_fora_do_prazo == 2
+    assert [numero for numero, _ in relatorio.erros] == [5]
+
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 4, 7, 25, 100])
+def test_blocos_nao_perdem_nem_repetem_linhas(tmp_path, tamanho_bloco):
+    linhas = [f"E{i},A,B,2023-11-{15 + i % 10},{i}.0,1.0" if i % 6 else f"E{i},A,B" for i in range(1, 26)]
+    arquivo = _escrever(tmp_path, linhas)
+    relatorio = RelatorioLeitura()
+    blocos = list(ler_entregas_em_blocos(arquivo, tamanho_bloco=tamanho_bloco, relatorio=relatorio))
+
+    esperados = [f"E{i}" for i in range(1, 26) if i % 6]
+    assert [e['id'] for bloco in blocos for e in bloco] == esperados
+    assert all(len(bloco) == tamanho_bloco for bloco in blocos[:-1])
+    assert 0 < len(blocos[-1]) <= tamanho_bloco
+    assert relatorio.total_erros == 25 - len(esperados)
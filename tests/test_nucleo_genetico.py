@@ -0,0 +1,77 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from nucleo_genetico import evoluir, gerar_filho, populacao_inicial
+from operadores_geneticos import OperadoresGeneticos
+
+UNIFORME = OperadoresGeneticos(cruzamento='uniforme')
+
+
+@pytest.mark.parametrize('total_validas, capacidade', [(4, 5), (5, 5), (12, 5)])
+def test_filho_do_cruzamento_uniforme_tem_tamanho_completo(total_validas, capacidade):
+    rng = random.Random(0)
+    tamanho = min(capacidade, total_validas)
+    for _ in range(200):
+        pai1 = rng.sample(range(total_validas), tamanho)
+        pai2 = rng.sample(pai1, tamanho) if rng.random() < 0.5 else rng.sample(range(total_validas), tamanho)
+        filho, _ = gerar_filho(pai1, pai2, capacidade, total_validas, rng, UNIFORME)
+        assert len(filho) == tamanho
+        assert len(set(filho)) == tamanho
+        assert all(0 <= gene < total_validas for gene in filho)
+
+
+@pytest.mark.parametrize('vetorizado', [True, False])
+def test_continuar_com_cruzamento_uniforme_usa_todas_as_entregas(sistema, vetorizado):
+    # 2023-11-20 tem menos entregas válidas que a capacidade: os pais são permutações umas das outras
+    sistema.algoritmo_genetico(datetime(2023, 11, 19), vetorizado=vetorizado, semente=1, operadores=UNIFORME)
+    entregas = sistema.algoritmo_genetico(datetime(2023, 11, 20), vetorizado=vetorizado, semente=1,
+                                          continuar=True, operadores=UNIFORME)
+    assert len(entregas) == len(sistema.repositorio.indices_validos(datetime(2023, 11, 20)))
+
+
+def test_cancelar_interrompe_o_dia_em_andamento(sistema):
+    consultas = []
+
+    def cancelar():
+        consultas.append(1)
+        return len(consultas) >= 3
+
+    entregas = sistema.algoritmo_genetico(datetime(2023, 11, 15), geracoes=10 ** 6, semente=0, cancelar=cancelar)
+    assert sistema.ultima_execucao_ga['motivo_parada'] == 'cancelado'
+    assert sistema.ultima_execucao_ga['geracoes_executadas'] == 3
+    assert len(entregas) == 5
+
+
+def test_paciencia_para_na_estagnacao():
+    # Avaliação constante: só a primeira geração "melhora" a solução
+    avaliar = lambda populacao: ([10] * len(populacao), [1.0] * len(populacao))
+    ranquear = lambda tempos, lucros, limite: (list(range(limite)), 0)
+    populacao = populacao_inicial(30, 20, 5, random.Random(0))
+    _, melhor, avaliacao, info = evoluir(populacao, 100, avaliar, ranquear, 5, 30, random.Random(0), paciencia=4)
+    assert info == {'geracoes_executadas': 5, 'motivo_parada': 'estagnacao'}
+    assert melhor == populacao[0] and avaliacao == (10, 1.0)
+
+
+@pytest.mark.parametrize('vetorizado', [True, False])
+def test_parada_antecipada_no_algoritmo_genetico(sistema_sintetico, vetorizado):
+    data_atual = datetime(2023, 11, 15)
+    executar = lambda **kwargs: [e['id'] for e in sistema_sintetico.algoritmo_genetico(
+        data_atual, 30, vetorizado=vetorizado, semente=2, **kwargs)]
+
+    executar(geracoes=40)
+    assert sistema_sintetico.ultima_execucao_ga['geracoes_executadas'] == 40
+    assert sistema_sintetico.ultima_execucao_ga['motivo_parada'] == 'geracoes'
+
+    estagnada = executar(geracoes=10000, paciencia=5)
+    info = sistema_sintetico.ultima_execucao_ga
+    assert info['motivo_parada'] == 'estagnacao' and 5 < info['geracoes_executadas'] < 10000
+    # Com a mesma semente, as gerações executadas são as mesmas de uma execução sem paciência
+    assert executar(geracoes=info['geracoes_executadas']) == estagnada
+
+    # Orçamento zero: só a população inicial é avaliada, e a melhor solução dela é retornada
+    sem_tempo = executar(geracoes=40, tempo_limite=0)
+    assert sistema_sintetico.ultima_execucao_ga['geracoes_executadas'] == 1
+    assert sistema_sintetico.ultima_execucao_ga['motivo_parada'] == 'tempo_limite'
+    assert len(sem_tempo) == 5 and sem_tempo == executar(geracoes=1)
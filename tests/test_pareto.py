@@ -0,0 +1,77 @@
+import random
+from datetime import datetime
+
+import numpy as np
+
+from pareto import classificar_frentes, distancia_aglomeracao
+
+
+def _domina(a, b):
+    """a = (tempo, lucro) domina b: lucro >= e tempo <=, com uma das duas coisas estrita."""
+    return a[1] >= b[1] and a[0] <= b[0] and a != b
+
+
+def _frentes_por_forca_bruta(tempos, lucros):
+    pontos = list(zip(tempos, lucros))
+    frentes = [None] * len(pontos)
+    restantes = set(range(len(pontos)))
+    frente = 0
+    while restantes:
+        atual = {i for i in restantes if not any(_domina(pontos[j], pontos[i]) for j in restantes)}
+        for i in atual:
+            frentes[i] = frente
+        restantes -= atual
+        frente += 1
+    return frentes
+
+
+def test_classificar_frentes_igual_a_forca_bruta():
+    rng = random.Random(0)
+    for _ in range(30):
+        tamanho = rng.randint(1, 60)
+        # Valores em faixas pequenas: muitos empates e pares repetidos
+        tempos = [rng.randint(0, 8) for _ in range(tamanho)]
+        lucros = [float(rng.randint(0, 8)) for _ in range(tamanho)]
+        assert classificar_frentes(tempos, lucros).tolist() == _frentes_por_forca_bruta(tempos, lucros)
+
+
+def test_extremos_da_frente_tem_distancia_infinita():
+    rng = np.random.default_rng(1)
+    tempos = rng.permutation(40).astype(np.float64)
+    lucros = rng.permutation(40).astype(np.float64) * 1.5
+    frentes = classificar_frentes(tempos, lucros)
+    distancias = distancia_aglomeracao(tempos, lucros, frentes)
+    for frente in np.unique(frentes):
+        membros = np.flatnonzero(frentes == frente)
+        extremos = {membros[np.argmin(lucros[membros])], membros[np.argmax(lucros[membros])],
+                    membros[np.argmin(tempos[membros])], membros[np.argmax(tempos[membros])]}
+        assert np.all(np.isinf(distancias[list(extremos)]))
+        internos = [i for i in membros if i not in extremos]
+        assert np.all(np.isfinite(distancias[internos])) and np.all(distancias[internos] > 0)
+
+
+def test_frente_do_nsga2_nao_dominada_e_determinista(sistema_sintetico):
+    data_atual = datetime(2023, 11, 15)
+    frente = sistema_sintetico.algoritmo_genetico_pareto(data_atual, 40, 30, semente=7)
+    pontos = [(solucao['tempo'], solucao['lucro']) for solucao in frente]
+    assert len(pontos) > 1
+    assert not any(_domina(a, b) for a in pontos for b in pontos)
+    assert pontos == sorted(pontos)
+    # Tempo e lucro batem com a avaliação das entregas da solução
+    for solucao in frente:
+        ids = [e['id'] for e in solucao['entregas']]
+        assert sistema_sintetico.avaliar_solucao(ids, data_atual) == (solucao['tempo'], solucao['lucro'])
+    repetida = sistema_sintetico.algoritmo_genetico_pareto(data_atual, 40, 30, semente=7)
+    assert [[e['id'] for e in s['entregas']] for s in repetida] == [[e['id'] for e in s['entregas']] for s in frente]
+
+
+def test_cancelar_interrompe_a_frente_de_pareto(sistema_sintetico):
+    chamadas = []
+
+    def cancelar():
+        chamadas.append(None)
+        return len(chamadas) > 3
+
+    frente = sistema_sintetico.algoritmo_genetico_pareto(datetime(2023, 11, 15), 30, 1000, semente=0, cancelar=cancelar)
+    assert len(chamadas) == 4  # Uma consulta antes de cada geração
+    assert frente and frente == sistema_sintetico.ultima_frente_pareto
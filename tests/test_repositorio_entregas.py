@@ -0,0 +1,56 @@
+import os
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+import repositorio_entregas
+from conftest import RAIZ
+from repositorio_entregas import RepositorioEntregas
+from SistemaEntrega import SistemaEntrega
+
+
+def test_validas_na_ordem_de_leitura(sistema_sintetico):
+    repositorio = sistema_sintetico.repositorio
+    for dias in range(0, 16, 3):
+        data_atual = datetime(2023, 11, 15) + timedelta(days=dias)
+        esperadas = [e['id'] for e in repositorio.entregas if e['prazo'] >= data_atual]
+        indices = repositorio.indices_validos(data_atual)
+        assert np.all(np.diff(indices) > 0)
+        assert [e['id'] for e in repositorio.validas(data_atual)] == esperadas
+
+
+def test_guloso_mantem_os_desempates_originais():
+    sistema = SistemaEntrega()
+    sistema.ler_conexoes(os.path.join(RAIZ, "conexoes.csv"))
+    sistema.ler_entregas(os.path.join(RAIZ, "entregas.csv"))
+    selecionadas = sistema.selecionar_entregas(datetime(2023, 11, 15))
+    assert sum(e['valor'] + e['bonus'] for e in selecionadas) == 1820
+
+
+def test_chegadas_incrementais_iguais_a_reconstrucao(monkeypatch):
+    monkeypatch.setattr(repositorio_entregas, 'MIN_FUSAO_INDICE', 8)
+    rng = random.Random(5)
+    base = datetime(2023, 11, 15)
+
+    def entrega(numero):
+        return {'id': f"E{numero:0{rng.randint(1, 6)}d}", 'origem': rng.choice('ABC'), 'destino': rng.choice('ABC'),
+                'prazo': base + timedelta(days=rng.randint(0, 10)), 'valor': float(numero), 'bonus': 1.0}
+
+    repositorio = RepositorioEntregas()
+    repositorio.adicionar_varias([entrega(i) for i in range(20)])
+    repositorio.indexar_ids()
+    repositorio.indices_validos(base)
+    recebidas = 20
+    for _ in range(40):  # Blocos pequenos, com várias fusões do índice auxiliar no caminho
+        quantidade = rng.randint(1, 6)
+        repositorio.adicionar_varias([entrega(recebidas + i) for i in range(quantidade)])
+        recebidas += quantidade
+        reconstruido = RepositorioEntregas()
+        reconstruido.adicionar_varias([dict(e) for e in repositorio.entregas])
+        for dias in (0, 4, 9, 11):
+            data_atual = base + timedelta(days=dias)
+            assert np.array_equal(repositorio.indices_validos(data_atual), reconstruido.indices_validos(data_atual))
+    assert len(repositorio) == recebidas
+    assert [repositorio.obter(e['id'])['valor'] for e in repositorio.entregas] == \
+        [reconstruido.obter(e['id'])['valor'] for e in repositorio.entregas]
@@ -0,0 +1,114 @@
+import csv
+import io
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from conftest import RAIZ
+from resultado_programacao import CAMPOS_LINHA, RenderizadorCSV, RenderizadorJSONLinhas, ResultadoProgramacao
+from SistemaEntrega import SistemaEntrega
+from SistemaEntregaIA import SistemaEntregaIA
+
+
+def _entregas_do_csv():
+    """Entregas como o código original as lia: dicionários com valor e bônus em float."""
+    with open(os.path.join(RAIZ, "entregas.csv"), newline='') as file:
+        return [dict(row, prazo=datetime.strptime(row['prazo'], '%Y-%m-%d'), valor=float(row['valor']),
+                     bonus=float(row['bonus'])) for row in csv.DictReader(file)]
+
+
+def _exibir_programacao_original(calcular_tempo_entrega, entregas_selecionadas, titulo, rodape):
+    """Cópia de exibir_programacao antes dos renderizadores (referência do formato de texto)."""
+    print(f"\n{titulo}")
+    print("ID\tOrigem\tDestino\tTempo\tValor\tBônus\tLucro Total")
+
+    lucro_total = 0
+    tempo_total = 0
+
+    for entrega in entregas_selecionadas:
+        tempo = calcular_tempo_entrega(entrega['origem'], entrega['destino'])
+        tempo_total += tempo if tempo else 0
+        lucro = entrega['valor'] + entrega['bonus']
+        lucro_total += lucro
+
+        print(f"{entrega['id']}\t{entrega['origem']}\t{entrega['destino']}\t{tempo}\t{entrega['valor']}\t{entrega['bonus']}\t{lucro}")
+
+    print(f"\nTempo total estimado: {tempo_total} minutos")
+    print(f"Lucro total esperado: R$ {lucro_total:.2f}")
+    print(rodape)
+
+    return lucro_total
+
+
+@pytest.mark.parametrize('classe', [SistemaEntrega, SistemaEntregaIA])
+def test_texto_igual_ao_exibir_programacao_original(capsys, classe):
+    sistema = classe()
+    sistema.ler_conexoes(os.path.join(RAIZ, "conexoes.csv"))
+    sistema.ler_entregas(os.path.join(RAIZ, "entregas.csv"))
+    entregas = _entregas_do_csv()
+    # Uma entrega sem caminho: tempo None na tabela, lucro somado
+    entregas.append({'id': 'X01', 'origem': 'A', 'destino': 'Nenhum', 'prazo': datetime(2023, 11, 20),
+                     'valor': 10.5, 'bonus': 0.25})
+    capsys.readouterr()
+
+    def saida_original(entregas):
+        lucro = _exibir_programacao_original(sistema.calcular_tempo_entrega, entregas,
+                                             sistema.TITULO_PROGRAMACAO, sistema.RODAPE_PROGRAMACAO)
+        return capsys.readouterr().out, lucro
+
+    esperado, lucro_esperado = saida_original(entregas)
+    retorno = sistema.exibir_programacao(entregas)
+    assert capsys.readouterr().out == esperado
+    assert (retorno[0] if isinstance(retorno, tuple) else retorno) == lucro_esperado
+
+    # As entregas do repositório (visões do armazém colunar) saem iguais às lidas do CSV
+    esperado, _ = saida_original(entregas[:-1])
+    sistema.exibir_programacao([sistema.repositorio.obter(e['id']) for e in entregas[:-1]])
+    assert capsys.readouterr().out == esperado
+
+
+def _resultados():
+    tempos = {('A', 'B'): 30, ('B', 'São Paulo'): 45}
+    calcular = lambda origem, destino: tempos.get((origem, destino))
+    primeiro = ResultadoProgramacao.calcular([
+        {'id': 'E1', 'origem': 'A', 'destino': 'B', 'valor': 100.0, 'bonus': 10.5},
+        {'id': 'E2', 'origem': 'B', 'destino': 'São Paulo', 'valor': 80.0, 'bonus': 0.0},
+        {'id': 'E3', 'origem': 'C', 'destino': 'A', 'valor': 5.0, 'bonus': 1.0},  # Sem caminho
+    ], calcular)
+    segundo = ResultadoProgramacao.calcular([
+        {'id': 'E4', 'origem': 'A', 'destino': 'B', 'valor': 1.0, 'bonus': 2.0},
+    ], calcular)
+    return primeiro, segundo
+
+
+def test_csv_pode_ser_lido_de_volta():
+    saida = io.StringIO()
+    with RenderizadorCSV(saida, tamanho_buffer=1) as renderizador:
+        for resultado in _resultados():
+            renderizador.renderizar(resultado)
+    linhas = list(csv.DictReader(io.StringIO(saida.getvalue())))
+
+    assert list(linhas[0]) == ['programacao', *CAMPOS_LINHA]
+    assert [(linha['programacao'], linha['id']) for linha in linhas] == [('1', 'E1'), ('1', 'E2'), ('1', 'E3'), ('2', 'E4')]
+    assert linhas[1]['destino'] == 'São Paulo'
+    assert [linha['tempo'] for linha in linhas] == ['30', '45', '', '30']
+    assert [float(linha['lucro']) for linha in linhas] == [110.5, 80.0, 6.0, 3.0]
+
+
+def test_json_linhas_pode_ser_lido_de_volta():
+    saida = io.StringIO()
+    resultados = _resultados()
+    with RenderizadorJSONLinhas(saida) as renderizador:
+        for resultado in resultados:
+            renderizador.renderizar(resultado)
+        assert saida.getvalue() == ''  # Ainda no buffer
+    objetos = [json.loads(linha) for linha in saida.getvalue().splitlines()]
+
+    assert [objeto['programacao'] for objeto in objetos] == [1, 2]
+    for objeto, resultado in zip(objetos, resultados):
+        assert objeto['tempo_total'] == resultado.tempo_total
+        assert objeto['lucro_total'] == resultado.lucro_total
+        assert objeto['entregas'] == resultado.linhas
+    assert 'São Paulo' in saida.getvalue()  # ensure_ascii=False
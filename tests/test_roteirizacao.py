@@ -0,0 +1,125 @@
+import itertools
+import random
+from datetime import datetime, timedelta
+
+from grafo_conexoes import GrafoConexoes
+from roteirizacao import ProgramadorRotas
+
+DATA = datetime(2023, 11, 15)
+
+
+def _grafo_aleatorio(rng, cidades):
+    grafo = GrafoConexoes()
+    for origem in cidades:
+        for destino in cidades:
+            if origem != destino:
+                grafo.adicionar(origem, destino, rng.randint(10, 120))
+    return grafo
+
+
+def _entregas_aleatorias(rng, cidades, quantidade, prazo=DATA + timedelta(days=3)):
+    return [{'id': f"E{i}", 'origem': origem, 'destino': rng.choice([c for c in cidades if c != origem]),
+             'prazo': prazo, 'valor': float(rng.randint(50, 500)), 'bonus': float(rng.randint(0, 50))}
+            for i, origem in enumerate(rng.choice(cidades) for _ in range(quantidade))]
+
+
+def _custo(grafo, sequencia, base=None):
+    """Fim da última entrega: deslocamentos vazios + tempos das entregas, na ordem dada."""
+    custo = 0
+    local = base if base is not None else sequencia[0]['origem']
+    for entrega in sequencia:
+        if local != entrega['origem']:
+            custo += grafo.tempo(local, entrega['origem'])
+        custo += grafo.tempo(entrega['origem'], entrega['destino'])
+        local = entrega['destino']
+    return custo
+
+
+def _vizinho_mais_proximo(grafo, entregas):
+    restantes = list(entregas)
+    sequencia = [min(restantes, key=lambda e: grafo.tempo(e['origem'], e['destino']))]
+    restantes.remove(sequencia[0])
+    while restantes:
+        local = sequencia[-1]['destino']
+        seguinte = min(restantes, key=lambda e: _custo(grafo, [e], local))
+        sequencia.append(seguinte)
+        restantes.remove(seguinte)
+    return sequencia
+
+
+def test_custo_do_roteiro_contra_forca_bruta():
+    rng = random.Random(0)
+    cidades = [f"C{i}" for i in range(5)]
+    otimos = 0
+    for _ in range(20):
+        grafo = _grafo_aleatorio(rng, cidades)
+        entregas = _entregas_aleatorias(rng, cidades, 6)
+        roteiro = ProgramadorRotas(grafo, limite_minutos=10 ** 6).programar(entregas, DATA)
+        por_id = {e['id']: e for e in entregas}
+        custo = _custo(grafo, [por_id[i] for i in roteiro.sequencia()])
+        otimo = min(_custo(grafo, list(p)) for p in itertools.permutations(entregas))
+        assert sorted(roteiro.sequencia()) == sorted(por_id)
+        assert roteiro.tempo_total == custo
+        assert otimo <= custo <= _custo(grafo, _vizinho_mais_proximo(grafo, entregas))
+        otimos += custo == otimo
+    assert otimos >= 15  # A busca local é heurística, mas com 6 paradas em geral chega ao ótimo
+
+
+def test_exclui_entregas_vencidas_e_sem_caminho():
+    grafo = GrafoConexoes()
+    grafo.adicionar('A', 'B', 30)
+    grafo.adicionar('B', 'A', 40)
+    grafo.adicionar('X', 'Y', 10)  # Componente separado de A e B
+    entregas = [
+        {'id': 'ok', 'origem': 'A', 'destino': 'B', 'prazo': DATA, 'valor': 100.0, 'bonus': 0.0},
+        {'id': 'vencida', 'origem': 'B', 'destino': 'A', 'prazo': DATA - timedelta(days=1), 'valor': 100.0, 'bonus': 0.0},
+        {'id': 'sem_caminho', 'origem': 'Y', 'destino': 'X', 'prazo': DATA, 'valor': 100.0, 'bonus': 0.0},
+        {'id': 'cidade_desconhecida', 'origem': 'A', 'destino': 'Z', 'prazo': DATA, 'valor': 100.0, 'bonus': 0.0},
+    ]
+    roteiro = ProgramadorRotas(grafo).programar(entregas, DATA)
+    assert roteiro.sequencia() == ['ok']
+    assert roteiro.excluidas == [{'id': 'vencida', 'motivo': 'fora_do_prazo'},
+                                 {'id': 'sem_caminho', 'motivo': 'sem_caminho'},
+                                 {'id': 'cidade_desconhecida', 'motivo': 'sem_caminho'}]
+
+
+def test_limite_diario_retira_entregas_preservando_as_do_dia():
+    rng = random.Random(3)
+    cidades = [f"C{i}" for i in range(6)]
+    grafo = _grafo_aleatorio(rng, cidades)
+    entregas = _entregas_aleatorias(rng, cidades, 8)
+    # As duas de menor lucro vencem hoje: mesmo assim devem ser as últimas a sair
+    for entrega in entregas[:2]:
+        entrega['prazo'] = DATA + timedelta(hours=18)
+        entrega['valor'], entrega['bonus'] = 1.0, 0.0
+    sem_limite = ProgramadorRotas(grafo, limite_minutos=10 ** 6).programar(entregas, DATA)
+    limite = sem_limite.tempo_total // 2
+    roteiro = ProgramadorRotas(grafo, limite_minutos=limite).programar(entregas, DATA)
+
+    assert 0 < roteiro.tempo_total <= limite
+    assert {'E0', 'E1'} <= set(roteiro.sequencia())
+    retiradas = [e['id'] for e in roteiro.excluidas]
+    assert retiradas and all(e['motivo'] == 'limite_diario' for e in roteiro.excluidas)
+    assert sorted(roteiro.sequencia() + retiradas) == sorted(e['id'] for e in entregas)
+
+
+def test_minutos_de_inicio_e_fim_das_paradas():
+    rng = random.Random(5)
+    cidades = [f"C{i}" for i in range(6)]
+    grafo = _grafo_aleatorio(rng, cidades)
+    entregas = _entregas_aleatorias(rng, cidades, 7)
+    for base in (None, 'C0'):
+        roteiro = ProgramadorRotas(grafo, limite_minutos=10 ** 6, base=base).programar(entregas, DATA)
+        minuto = 0
+        local = base if base is not None else roteiro.paradas[0]['origem']
+        for ordem, parada in enumerate(roteiro.paradas, start=1):
+            esperado = 0 if local == parada['origem'] else grafo.tempo(local, parada['origem'])
+            assert parada['ordem'] == ordem
+            assert parada['deslocamento'] == esperado
+            assert parada['inicio'] == minuto + parada['deslocamento']
+            assert parada['tempo'] == grafo.tempo(parada['origem'], parada['destino'])
+            assert parada['fim'] == parada['inicio'] + parada['tempo']
+            minuto, local = parada['fim'], parada['destino']
+        assert roteiro.tempo_total == minuto
+        assert roteiro.tempo_deslocamento == sum(p['deslocamento'] for p in roteiro.paradas)
+        assert roteiro.lucro_total == sum(p['lucro'] for p in roteiro.paradas)
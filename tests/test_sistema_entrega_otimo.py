@@ -0,0 +1,47 @@
+import itertools
+from datetime import datetime
+
+import pytest
+
+from gerador_dados import gerar_dados
+from SistemaEntregaOtimo import SistemaEntregaOtimo
+
+
+@pytest.fixture(scope='module')
+def sistema_pequeno(tmp_path_factory):
+    diretorio = tmp_path_factory.mktemp('pequeno')
+    gerar_dados(str(diretorio), cidades=6, entregas=14, grafo='esparso', grau=2, horizonte_dias=3, semente=5)
+    sistema = SistemaEntregaOtimo()
+    sistema.ler_conexoes(str(diretorio / "conexoes.csv"))
+    sistema.ler_entregas(str(diretorio / "entregas.csv"))
+    return sistema
+
+
+def melhor_por_forca_bruta(sistema, data_atual, capacidade, tempo_maximo):
+    candidatas = []
+    for entrega in sistema.repositorio.validas(data_atual):
+        tempo = sistema.calcular_tempo_entrega(entrega['origem'], entrega['destino'])
+        if tempo:
+            candidatas.append((tempo, entrega['valor'] + entrega['bonus']))
+    melhor = 0.0
+    for quantidade in range(1, capacidade + 1):
+        for combinacao in itertools.combinations(candidatas, quantidade):
+            if tempo_maximo is None or sum(t for t, _ in combinacao) <= tempo_maximo:
+                melhor = max(melhor, sum(lucro for _, lucro in combinacao))
+    return melhor
+
+
+@pytest.mark.parametrize('capacidade', [1, 3, 5])
+@pytest.mark.parametrize('tempo_maximo', [None, 250, 450, 800])
+def test_programacao_dinamica_e_otima(sistema_pequeno, capacidade, tempo_maximo):
+    for dia in (15, 16, 17):
+        data_atual = datetime(2023, 11, dia)
+        selecionadas = sistema_pequeno.selecionar_entregas(data_atual, capacidade, tempo_maximo)
+        tempos = [sistema_pequeno.calcular_tempo_entrega(e['origem'], e['destino']) for e in selecionadas]
+        assert len(selecionadas) <= capacidade
+        assert len({e['id'] for e in selecionadas}) == len(selecionadas)
+        assert all(tempos) and all(e['prazo'] >= data_atual for e in selecionadas)
+        if tempo_maximo is not None:
+            assert sum(tempos) <= tempo_maximo
+        lucro = sum(e['valor'] + e['bonus'] for e in selecionadas)
+        assert lucro == pytest.approx(melhor_por_forca_bruta(sistema_pequeno, data_atual, capacidade, tempo_maximo))
@@ -0,0 +1,88 @@
+import os
+
+import numpy as np
+import pytest
+
+import snapshot_dados
+from snapshot_dados import caminho_snapshot, ler_conexoes_com_snapshot, ler_entregas_com_snapshot
+
+CONTEUDO = ("id,origem,destino,prazo,valor,bonus\n"
+            "E1,A,B,2023-11-20,100.0,10.0\n"
+            "E2,B,C,2023-11-21,200.0,20.0\n")
+
+
+@pytest.fixture
+def arquivo(tmp_path):
+    arquivo = tmp_path / "entregas.csv"
+    arquivo.write_text(CONTEUDO)
+    return str(arquivo)
+
+
+def _sem_leitura_do_csv(monkeypatch):
+    def falhar(*args, **kwargs):
+        raise AssertionError("o CSV foi relido")
+    monkeypatch.setattr(snapshot_dados, 'ler_entregas_em_blocos', falhar)
+
+
+def _mudar_mtime(arquivo):
+    estado = os.stat(arquivo)
+    os.utime(arquivo, ns=(estado.st_atime_ns, estado.st_mtime_ns + 5 * 10 ** 9))
+
+
+def test_csv_inalterado_reusa_o_snapshot_mapeado(arquivo, monkeypatch):
+    lido = ler_entregas_com_snapshot(arquivo)
+    assert os.path.isdir(caminho_snapshot(arquivo))
+    _sem_leitura_do_csv(monkeypatch)
+    reusado = ler_entregas_com_snapshot(arquivo)
+    assert isinstance(reusado.coluna('valor'), np.memmap)
+    assert [dict(reusado.registro(i)) for i in range(len(reusado))] == [dict(lido.registro(i)) for i in range(len(lido))]
+
+
+def test_csv_com_linha_nova_reconstroi(arquivo):
+    ler_entregas_com_snapshot(arquivo)
+    with open(arquivo, 'a') as file:
+        file.write("E3,C,A,2023-11-22,300.0,30.0\n")
+    armazem = ler_entregas_com_snapshot(arquivo)
+    assert armazem.coluna('id').tolist() == ['E1', 'E2', 'E3']
+
+
+def test_edicao_do_mesmo_tamanho_reconstroi_pelo_hash(arquivo):
+    ler_entregas_com_snapshot(arquivo)
+    with open(arquivo, 'w') as file:
+        file.write(CONTEUDO.replace("200.0", "900.0"))
+    _mudar_mtime(arquivo)  # Garante mtime diferente mesmo em sistemas de arquivos de baixa resolução
+    armazem = ler_entregas_com_snapshot(arquivo)
+    assert armazem.coluna('valor').tolist() == [100.0, 900.0]
+    assert not isinstance(armazem.coluna('valor'), np.memmap)
+
+
+def test_touch_com_o_mesmo_conteudo_mantem_o_snapshot(arquivo, monkeypatch):
+    ler_entregas_com_snapshot(arquivo)
+    _mudar_mtime(arquivo)
+    _sem_leitura_do_csv(monkeypatch)
+    armazem = ler_entregas_com_snapshot(arquivo)
+    assert armazem.coluna('valor').tolist() == [100.0, 200.0]
+    # O novo mtime é registrado: a próxima validação não recalcula o hash
+    monkeypatch.setattr(snapshot_dados, '_hash_arquivo', lambda arquivo: pytest.fail("hash recalculado"))
+    ler_entregas_com_snapshot(arquivo)
+
+
+def test_diretorio_temporario_abandonado(arquivo):
+    # Sobra de uma gravação interrompida: não é usada e não impede a nova gravação
+    temporario = caminho_snapshot(arquivo) + '.tmp'
+    os.makedirs(temporario)
+    with open(os.path.join(temporario, 'meta.json'), 'w') as file:
+        file.write('{corrompido')
+    armazem = ler_entregas_com_snapshot(arquivo)
+    assert armazem.coluna('id').tolist() == ['E1', 'E2']
+    assert not os.path.exists(temporario)
+    assert isinstance(ler_entregas_com_snapshot(arquivo).coluna('id'), np.memmap)
+
+
+def test_snapshot_de_conexoes(tmp_path):
+    arquivo = tmp_path / "conexoes.csv"
+    arquivo.write_text("origem,destino,tempo\nA,B,30\nB,C,45\n")
+    lidas = ler_conexoes_com_snapshot(str(arquivo))
+    reusadas = ler_conexoes_com_snapshot(str(arquivo))
+    assert list(reusadas) == list(lidas) and len(lidas) == 2
+    assert reusadas.cidades.nomes == ['A', 'B', 'C']
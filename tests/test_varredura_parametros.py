@@ -0,0 +1,20 @@
+from datetime import datetime
+
+import pytest
+
+from comparacao_sistemas import ComparadorAlgoritmos
+from varredura_parametros import VarreduraParametros
+
+
+def test_gaps_usam_referencias_exatas(dados_sinteticos):
+    pytest.importorskip('pandas')
+    varredura = VarreduraParametros(ComparadorAlgoritmos())
+    varredura.carregar_dados(str(dados_sinteticos / "conexoes.csv"), str(dados_sinteticos / "entregas.csv"),
+                             usar_snapshot=False)
+    resultados = varredura.executar(datetime(2023, 11, 16), tamanhos_populacao=(10,), geracoes=(5, 40),
+                                    sementes=(0, 1), dias=2)
+    # Nenhuma solução pode superar os ótimos: menor tempo (objetivo do algoritmo genético) e maior lucro
+    assert (resultados['tempo_entrega'] >= resultados['tempo_otimo']).all()
+    assert (resultados['gap_tempo'] >= 0).all()
+    assert (resultados['lucro'] <= resultados['lucro_maximo'] + 1e-9).all()
+    assert (resultados['gap_lucro'] >= -1e-12).all()
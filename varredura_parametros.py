@@ -0,0 +1,204 @@
+import contextlib
+import io
+import itertools
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from armazem_colunar import CAMPOS_ENTREGA
+from avaliacao_vetorizada import AvaliadorVetorizado
+from comparacao_sistemas import ComparadorAlgoritmos
+from operadores_geneticos import OPERADORES_PADRAO, OperadoresGeneticos
+from SistemaEntregaOtimo import SistemaEntregaOtimo
+
+COLUNAS_RESULTADO = ('tamanho_dados', 'tamanho_populacao', 'geracoes', 'capacidade_diaria', 'operadores', 'semente',
+                     'tempo_parede', 'memoria_pico', 'tempo_entrega', 'tempo_otimo', 'gap_tempo',
+                     'lucro', 'lucro_maximo', 'gap_lucro')
+
+# Comparador e resultados ótimos do processo worker, enviados/calculados uma vez por processo
+_contexto = None
+
+
+def _inicializar_worker(comparador, data_inicio, dias):
+    global _contexto
+    _contexto = {'comparador': comparador, 'data_inicio': data_inicio, 'dias': dias,
+                 'reduzidos': {}, 'otimos': {}}
+
+
+def _comparador_reduzido(contexto, tamanho_dados):
+    """Comparador com apenas as primeiras `tamanho_dados` entregas (None = todas), montado sem copiar as colunas."""
+    if tamanho_dados is None:
+        return contexto['comparador']
+    reduzidos = contexto['reduzidos']
+    if tamanho_dados not in reduzidos:
+        original = contexto['comparador'].sistema_a
+        comparador = ComparadorAlgoritmos()
+        comparador.sistema_a.conexoes = original.conexoes
+        comparador.sistema_a.grafo = original.grafo
+        armazem = original.repositorio.armazem
+        colunas = {nome: armazem.coluna(nome)[:tamanho_dados] for nome in CAMPOS_ENTREGA}
+        comparador.sistema_a.repositorio.armazem.adicionar_colunas(colunas, armazem.cidades.nomes)
+        comparador.sistema_b.compartilhar_dados(comparador.sistema_a)
+        reduzidos[tamanho_dados] = comparador
+    return reduzidos[tamanho_dados]
+
+
+def _referencias_otimas(contexto, comparador, tamanho_dados, capacidade_diaria):
+    """
+    Somas, nos dias da varredura, de (tempo_otimo, lucro_maximo):
+    - tempo_otimo: ótimo exato do objetivo do algoritmo genético, cuja
+      solução final é a de menor tempo total com min(capacidade, válidas)
+      entregas (com a mesma avaliação: entregas sem conexão contam 0 min)
+    - lucro_maximo: lucro da seleção de SistemaEntregaOtimo (maior lucro com
+      a capacidade, sem limite de tempo), um objetivo que o algoritmo
+      genético não otimiza na escolha final
+    """
+    chave = (tamanho_dados, capacidade_diaria)
+    if chave not in contexto['otimos']:
+        sistema = comparador.sistema_b
+        otimo = SistemaEntregaOtimo()
+        otimo.compartilhar_dados(comparador.sistema_a)
+        tempo_total = 0
+        lucro_total = 0.0
+        for dia in range(contexto['dias']):
+            data_atual = contexto['data_inicio'] + timedelta(days=dia)
+            indices = sistema.repositorio.indices_validos(data_atual)
+            if len(indices):
+                tempos = AvaliadorVetorizado.do_armazem(sistema.repositorio.armazem, indices,
+                                                        sistema.calcular_tempo_entrega).tempo
+                quantidade = min(capacidade_diaria, len(tempos))
+                tempo_total += int(np.partition(tempos, quantidade - 1)[:quantidade].sum())
+            lucro_total += sum(e['valor'] + e['bonus'] for e in otimo.selecionar_entregas(data_atual, capacidade_diaria))
+        contexto['otimos'][chave] = (tempo_total, lucro_total)
+    return contexto['otimos'][chave]
+
+
+def _executar_combinacao(tarefa, contexto=None):
+    """Executa o algoritmo genético de uma combinação de parâmetros em todos os dias. Retorna uma linha de resultado."""
+    contexto = contexto or _contexto
+    tamanho_dados, tamanho_populacao, geracoes, capacidade_diaria, operadores, semente = tarefa
+    comparador = _comparador_reduzido(contexto, tamanho_dados)
+    sistema = comparador.sistema_b
+
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    tempo_entrega = 0
+    lucro = 0.0
+    for dia in range(contexto['dias']):
+        data_atual = contexto['data_inicio'] + timedelta(days=dia)
+        entregas = sistema.algoritmo_genetico(data_atual, tamanho_populacao, geracoes, capacidade_diaria,
+                                              vetorizado=True, semente=f"{semente}:{dia + 1}", operadores=operadores)
+        # Entregas sem conexão não contam tempo nem lucro, como em avaliar_solucao
+        for entrega in entregas:
+            tempo = sistema.calcular_tempo_entrega(entrega['origem'], entrega['destino'])
+            if tempo:
+                tempo_entrega += tempo
+                lucro += entrega['valor'] + entrega['bonus']
+    tempo_parede = time.perf_counter() - inicio
+    _, memoria_pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tempo_otimo, lucro_maximo = _referencias_otimas(contexto, comparador, tamanho_dados, capacidade_diaria)
+    return {
+        'tamanho_dados': tamanho_dados if tamanho_dados is not None else len(comparador.sistema_a.entregas),
+        'tamanho_populacao': tamanho_populacao,
+        'geracoes': geracoes,
+        'capacidade_diaria': capacidade_diaria,
+        'operadores': operadores.descricao(),
+        'semente': semente,
+        'tempo_parede': tempo_parede,
+        'memoria_pico': memoria_pico,
+        'tempo_entrega': tempo_entrega,
+        'tempo_otimo': tempo_otimo,
+        'gap_tempo': (tempo_entrega - tempo_otimo) / tempo_otimo if tempo_otimo > 0 else 0.0,
+        'lucro': lucro,
+        'lucro_maximo': lucro_maximo,
+        'gap_lucro': (lucro_maximo - lucro) / lucro_maximo if lucro_maximo > 0 else 0.0
+    }
+
+
+class VarreduraParametros:
+    """
+    Varredura sem interface gráfica dos parâmetros do algoritmo genético
+    (SistemaEntregaIA) sobre os dados de um ComparadorAlgoritmos.
+    Cada combinação da grade é executada para várias sementes, em paralelo,
+    e gera uma linha com tempo de parede, pico de memória (tracemalloc, que
+    também acrescenta algum custo ao tempo medido) e duas distâncias (gaps):
+    - gap_tempo: para o ótimo exato do objetivo do algoritmo genético, a
+      solução de menor tempo total de entrega (tempo_otimo)
+    - gap_lucro: para o maior lucro possível com a capacidade diária
+      (lucro_maximo, de SistemaEntregaOtimo). A solução final do algoritmo
+      genético prioriza o menor tempo, não o lucro, então esse gap compara
+      objetivos diferentes e serve só como referência de lucro.
+    """
+    def __init__(self, comparador=None):
+        self.comparador = comparador if comparador is not None else ComparadorAlgoritmos()
+        self.resultados = None
+
+    def carregar_dados(self, arquivo_conexoes, arquivo_entregas, usar_snapshot=True):
+        """Carrega os dados no comparador (sem exibir as mensagens de leitura)."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.comparador.carregar_dados(arquivo_conexoes, arquivo_entregas, usar_snapshot=usar_snapshot)
+
+    def executar(self, data_inicio, tamanhos_populacao=(50,), geracoes=(100,), capacidades=(5,),
+                 tamanhos_dados=(None,), sementes=(0, 1, 2), dias=1, workers=None, operadores=(OPERADORES_PADRAO,)):
+        """
+        Executa todas as combinações da grade e retorna um DataFrame (uma linha por combinação e semente).
+        - tamanhos_dados: quantidade das primeiras entregas lidas usadas em cada rodada (None = todas)
+        - dias: dias consecutivos a partir de data_inicio somados em cada rodada
+        - operadores: configurações de OperadoresGeneticos comparadas (coluna 'operadores')
+        - workers: processos do pool (None ou 1 = execução no próprio processo)
+        """
+        import pandas as pd
+
+        tarefas = list(itertools.product(tamanhos_dados, tamanhos_populacao, geracoes, capacidades, operadores, sementes))
+        if workers is not None and workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker,
+                                     initargs=(self.comparador, data_inicio, dias)) as executor:
+                linhas = list(executor.map(_executar_combinacao, tarefas))
+        else:
+            contexto = {'comparador': self.comparador, 'data_inicio': data_inicio, 'dias': dias,
+                        'reduzidos': {}, 'otimos': {}}
+            linhas = [_executar_combinacao(tarefa, contexto) for tarefa in tarefas]
+
+        self.resultados = pd.DataFrame(linhas, columns=COLUNAS_RESULTADO)
+        return self.resultados
+
+    def resumo(self, lucro_alvo=None):
+        """
+        Médias por combinação (sobre as sementes), da mais barata para a mais cara.
+        Com lucro_alvo, mantém só as combinações cujo lucro médio o atinge.
+        """
+        agrupado = self.resultados.groupby(
+            ['tamanho_dados', 'tamanho_populacao', 'geracoes', 'capacidade_diaria', 'operadores'], as_index=False
+        )[['tempo_parede', 'memoria_pico', 'tempo_entrega', 'gap_tempo', 'lucro', 'gap_lucro']].mean()
+        if lucro_alvo is not None:
+            agrupado = agrupado[agrupado['lucro'] >= lucro_alvo]
+        return agrupado.sort_values('tempo_parede').reset_index(drop=True)
+
+    def salvar(self, arquivo):
+        """Salva os resultados em CSV ou, se o arquivo terminar em .parquet, em Parquet (requer pyarrow)."""
+        if arquivo.endswith('.parquet'):
+            self.resultados.to_parquet(arquivo, index=False)
+        else:
+            self.resultados.to_csv(arquivo, index=False)
+
+
+# Exemplo de uso
+if __name__ == "__main__":
+    varredura = VarreduraParametros()
+    varredura.carregar_dados("conexoes.csv", "entregas.csv")
+
+    data_inicio = datetime.strptime('2023-11-15', '%Y-%m-%d')
+    varredura.executar(data_inicio, tamanhos_populacao=(20, 50), geracoes=(50, 100), capacidades=(5,),
+                       sementes=(0, 1, 2), dias=3, workers=4,
+                       operadores=(OPERADORES_PADRAO, OperadoresGeneticos(selecao='torneio'),
+                                   OperadoresGeneticos(selecao='roleta', cruzamento='uniforme')))
+    varredura.salvar("varredura_parametros.csv")
+
+    print(varredura.resumo().to_string(index=False))
+    print("\ngap_tempo: distância para o menor tempo total possível (o objetivo do algoritmo genético);"
+          "\ngap_lucro: distância para o maior lucro possível (outro objetivo, só como referência).")